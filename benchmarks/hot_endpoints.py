@@ -0,0 +1,299 @@
+"""Throughput and latency of the hot endpoints against a seeded database.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/hot_endpoints.py --scale 2 --output results.json
+    PYTHONPATH=src python benchmarks/hot_endpoints.py --save-baseline benchmarks/baseline.json
+    PYTHONPATH=src python benchmarks/hot_endpoints.py --baseline benchmarks/baseline.json
+
+The script creates a fresh SQLite database and loads a synthetic season
+into it (``app.services.synthetic_data``). ``--federations``, ``--events``,
+``--entries-per-discipline`` and ``--users`` override the default
+``DatasetSize``, and ``--scale`` multiplies the top-level counts.
+Each target is driven in process through ``httpx.ASGITransport`` with the
+app lifespan running: ``--warmup`` requests first, then ``--requests`` timed
+requests spread over ``--concurrency`` workers.
+
+Results are written as JSON. With ``--baseline`` each target is compared with
+a stored run and the script exits with status 1 when p50/p95 latency rose
+by more than ``--latency-tolerance`` (and by at least ``--min-delta-ms``), or
+throughput fell by more than ``--throughput-tolerance``. Baselines depend on
+the machine, so record them on the machine that runs the comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+SEARCH_TERMS = ("Silva", "Grand Prix", "Club Atlético", "Lima")
+TARGETS = ("home_page", "bootstrap_home", "event_detail", "search", "login", "entry_update")
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+def _size(args: argparse.Namespace):
+    from app.services.synthetic_data import DatasetSize
+
+    overrides = {
+        name: getattr(args, name)
+        for name in ("federations", "events", "entries_per_discipline", "users")
+        if getattr(args, name) is not None
+    }
+    return DatasetSize(**overrides).scaled(args.scale)
+
+
+async def seed(engine, args: argparse.Namespace) -> tuple[dict[str, int], dict[str, Any]]:
+    """Load a synthetic season and return its row counts and request inputs."""
+
+    from sqlalchemy import select
+
+    from app.models import User
+    from app.services.synthetic_data import SyntheticDataset, load_dataset
+
+    size = _size(args)
+    counts = await load_dataset(engine, SyntheticDataset(size, seed=args.seed))
+    async with engine.connect() as conn:
+        emails = (await conn.scalars(select(User.email).order_by(User.id))).all()
+    return {**size.as_dict(), **counts}, {
+        "events": counts["events"],
+        "entries": counts["event_entries"],
+        "emails": emails,
+    }
+
+
+async def _drive(
+    call: Callable[[int], Awaitable[int]], requests: int, concurrency: int, warmup: int
+) -> dict[str, Any]:
+    for n in range(warmup):
+        await call(n)
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for n in counter:
+            started = time.perf_counter()
+            status = await call(n)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if status >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    elapsed = time.perf_counter() - started
+    ordered = sorted(latencies)
+    return {
+        "requests": requests,
+        "errors": errors,
+        "throughput_rps": round(requests / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(_percentile(ordered, 0.50), 3),
+        "p95_ms": round(_percentile(ordered, 0.95), 3),
+        "p99_ms": round(_percentile(ordered, 0.99), 3),
+        "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+    }
+
+
+def _targets(client, inputs: dict[str, Any], rng: random.Random):
+    from app.services.synthetic_data import SYNTHETIC_PASSWORD
+
+    events = inputs["events"]
+
+    async def home_page(n: int) -> int:
+        return (await client.get("/")).status_code
+
+    async def bootstrap_home(n: int) -> int:
+        return (await client.get("/api/v1/bootstrap/home")).status_code
+
+    async def event_detail(n: int) -> int:
+        return (await client.get(f"/api/v1/events/{rng.randint(1, events)}")).status_code
+
+    async def search(n: int) -> int:
+        term = SEARCH_TERMS[n % len(SEARCH_TERMS)]
+        return (await client.get("/api/v1/search/", params={"query": term})).status_code
+
+    async def login(n: int) -> int:
+        response = await client.post(
+            "/api/v1/accounts/login",
+            data={
+                "username": rng.choice(inputs["emails"]),
+                "password": SYNTHETIC_PASSWORD,
+            },
+        )
+        return response.status_code
+
+    async def entry_update(n: int) -> int:
+        response = await client.patch(
+            f"/api/v1/events/entries/{rng.randint(1, inputs['entries'])}",
+            json={"result": f"{10 + rng.random() * 2:.2f}", "points": rng.randint(0, 8)},
+        )
+        return response.status_code
+
+    return {
+        "home_page": home_page,
+        "bootstrap_home": bootstrap_home,
+        "event_detail": event_detail,
+        "search": search,
+        "login": login,
+        "entry_update": entry_update,
+    }
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    latency_tolerance: float,
+    throughput_tolerance: float,
+    min_delta_ms: float,
+) -> list[str]:
+    """Return a line per metric that regressed beyond its tolerance."""
+
+    regressions: list[str] = []
+    for target, current in results.items():
+        previous = baseline.get(target)
+        if previous is None:
+            continue
+        for key in ("p50_ms", "p95_ms"):
+            limit = previous[key] * (1 + latency_tolerance)
+            if current[key] > limit and current[key] - previous[key] >= min_delta_ms:
+                regressions.append(
+                    f"{target} {key}: {current[key]:.2f} > {previous[key]:.2f} "
+                    f"(+{latency_tolerance:.0%} allowed)"
+                )
+        floor = previous["throughput_rps"] * (1 - throughput_tolerance)
+        if current["throughput_rps"] < floor:
+            regressions.append(
+                f"{target} throughput_rps: {current['throughput_rps']:.1f} < "
+                f"{previous['throughput_rps']:.1f} (-{throughput_tolerance:.0%} allowed)"
+            )
+        if current["errors"] > previous.get("errors", 0):
+            regressions.append(f"{target} errors: {current['errors']}")
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    import httpx
+
+    from app.core.database import DatabaseSessionManager
+    from main import create_app
+
+    rng = random.Random(args.seed)
+    seeded = time.perf_counter()
+    sizes, inputs = await seed(DatabaseSessionManager().engine, args)
+    seed_seconds = time.perf_counter() - seeded
+
+    app = create_app()
+    results: dict[str, dict[str, Any]] = {}
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            targets = _targets(client, inputs, rng)
+            for name in args.targets:
+                results[name] = await _drive(
+                    targets[name], args.requests, args.concurrency, args.warmup
+                )
+                print(
+                    f"{name:>15}: {results[name]['throughput_rps']:8.1f} req/s  "
+                    f"p50 {results[name]['p50_ms']:7.2f} ms  "
+                    f"p95 {results[name]['p95_ms']:7.2f} ms  "
+                    f"p99 {results[name]['p99_ms']:7.2f} ms  "
+                    f"errors {results[name]['errors']}"
+                )
+    return {
+        "meta": {
+            "created_at": datetime.now(tz=timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "scale": args.scale,
+            "sizes": sizes,
+            "seed_seconds": round(seed_seconds, 2),
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        },
+        "results": results,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--federations", type=int)
+    parser.add_argument("--events", type=int)
+    parser.add_argument("--entries-per-discipline", type=int)
+    parser.add_argument("--users", type=int)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--targets", nargs="+", choices=TARGETS, default=list(TARGETS))
+    parser.add_argument("--database", type=Path, help="SQLite file to create (default: temp)")
+    parser.add_argument("--output", type=Path, help="Write the JSON results here")
+    parser.add_argument("--baseline", type=Path, help="Compare with this results file")
+    parser.add_argument("--save-baseline", type=Path, help="Also write the results here")
+    parser.add_argument("--latency-tolerance", type=float, default=0.25)
+    parser.add_argument("--throughput-tolerance", type=float, default=0.20)
+    parser.add_argument("--min-delta-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="trackeo-bench-") as scratch:
+        database = args.database or Path(scratch) / "bench.db"
+        if database.exists():
+            parser.error(f"{database} already exists; the benchmark seeds a fresh database")
+        # Settings are read on first use, so configure them before importing the app.
+        os.environ["ATHLETICS_DATABASE_URL"] = f"sqlite+aiosqlite:///{database}"
+        os.environ["ATHLETICS_SEED_DEMO_DATA"] = "false"
+        os.environ["ATHLETICS_RATE_LIMIT_ENABLED"] = "false"
+        # Measure what production runs: read models built from rows are not re-validated.
+        os.environ.setdefault("ATHLETICS_VALIDATE_TRUSTED_ROWS", "false")
+        os.environ["ATHLETICS_UPLOAD_DIR"] = str(Path(scratch) / "uploads")
+        report = asyncio.run(run(args))
+
+    payload = json.dumps(report, indent=2) + "\n"
+    for path in (args.output, args.save_baseline):
+        if path is not None:
+            path.write_text(payload, encoding="utf-8")
+    if args.output is None and args.save_baseline is None:
+        print(payload)
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(
+            report["results"],
+            baseline["results"],
+            args.latency_tolerance,
+            args.throughput_tolerance,
+            args.min_delta_ms,
+        )
+        if regressions:
+            print("Regressions against", args.baseline)
+            for line in regressions:
+                print("  " + line)
+            return 1
+        print("No regressions against", args.baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
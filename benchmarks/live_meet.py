@@ -0,0 +1,414 @@
+"""Replay a live meet against the app and measure result-publication latency.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/live_meet.py --spectators 500 --duration 60
+    PYTHONPATH=src python benchmarks/live_meet.py --base-url http://localhost:8000 --event-id 42
+
+Three kinds of virtual users run concurrently on one asyncio loop:
+
+* spectators poll ``GET /api/v1/events/{id}`` every ``--poll-interval``
+  seconds, with jitter. The API has no push channel, so polling is what a
+  spectator's browser does.
+* officials post results with ``PATCH /api/v1/events/entries/{id}``
+  following the meet's schedule, compressed into ``--duration`` seconds. A
+  track race publishes all lanes within a few seconds of the finish. A
+  field event publishes one attempt per athlete per round, so marks improve
+  over the event.
+* federations upload results files through the resumable upload API
+  (``--uploads`` over the run).
+
+The headline number is the publication latency: the time from an official
+sending a result to a spectator's poll showing it. It is reported for the
+first spectator to see each result and across all spectators. Poll,
+update and upload request latencies are reported too.
+
+Without ``--base-url`` the script loads a synthetic season into a fresh
+SQLite database (``app.services.synthetic_data``). It then drives the app in
+process through ``httpx.ASGITransport`` and replays the first meet that has
+no results yet. Against a running instance, pass ``--event-id`` of a meet
+whose entries have no results. Uploads also need the federation's name and
+ingest token.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+ATTEMPT_ROUNDS = 3
+# Share of a discipline's slot over which a track race's lanes are posted.
+TRACK_BURST = 0.1
+
+
+@dataclass(order=True)
+class Update:
+    at: float
+    entry_id: int = field(compare=False)
+    payload: dict[str, Any] = field(compare=False)
+
+
+@dataclass
+class Stats:
+    poll_ms: list[float] = field(default_factory=list)
+    update_ms: list[float] = field(default_factory=list)
+    upload_ms: list[float] = field(default_factory=list)
+    first_seen_ms: list[float] = field(default_factory=list)
+    seen_ms: list[float] = field(default_factory=list)
+    errors: dict[str, int] = field(default_factory=lambda: {"poll": 0, "update": 0, "upload": 0})
+    # (entry id, result) -> monotonic time the official sent it.
+    published: dict[tuple[int, str], float] = field(default_factory=dict)
+    first_seen: set[tuple[int, str]] = field(default_factory=set)
+
+
+def _summary(values: Iterable[float]) -> dict[str, float]:
+    ordered = sorted(values)
+    if not ordered:
+        return {"count": 0}
+
+    def pick(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))], 2)
+
+    return {
+        "count": len(ordered),
+        "p50_ms": pick(0.50),
+        "p95_ms": pick(0.95),
+        "p99_ms": pick(0.99),
+        "max_ms": round(ordered[-1], 2),
+    }
+
+
+def _format(unit, value: float) -> str:
+    from app.models import MarkUnit
+
+    if unit == MarkUnit.POINTS:
+        return str(round(value))
+    if unit == MarkUnit.SECONDS and value >= 60:
+        minutes, seconds = divmod(value, 60)
+        return f"{int(minutes)}:{seconds:05.2f}"
+    return f"{value:.2f}"
+
+
+def build_timeline(detail: dict[str, Any], duration: float, rng: random.Random) -> list[Update]:
+    """Turn an event's pending entries into timed result updates."""
+
+    from app.domain.marks import discipline_unit, lower_is_better, parse_mark
+    from app.models import MarkUnit
+
+    disciplines = sorted(
+        (
+            discipline
+            for discipline in detail["disciplines"]
+            if any(entry["result"] is None for entry in discipline["entries"])
+        ),
+        key=lambda item: (item["scheduled_start"] or "", item["order"] or 0, item["id"]),
+    )
+    if not disciplines:
+        raise SystemExit(f"Event {detail['id']} has no entries without results")
+    slot = duration / len(disciplines)
+    updates: list[Update] = []
+    for index, discipline in enumerate(disciplines):
+        unit = discipline_unit(discipline["name"]) or MarkUnit.SECONDS
+        entries = [entry for entry in discipline["entries"] if entry["result"] is None]
+        marks = {}
+        for entry in entries:
+            seed = parse_mark(entry.get("seed_mark"), discipline["name"])
+            fallback = {MarkUnit.SECONDS: 12.0, MarkUnit.METRES: 6.0, MarkUnit.POINTS: 5000.0}
+            marks[entry["id"]] = (seed.value if seed else fallback[unit]) * rng.uniform(0.97, 1.03)
+        ranked = sorted(marks, key=marks.get, reverse=not lower_is_better(unit))
+        positions = {entry_id: position for position, entry_id in enumerate(ranked, start=1)}
+        start = index * slot
+        if unit == MarkUnit.SECONDS:
+            for entry_id in ranked:
+                updates.append(
+                    Update(
+                        start + slot * TRACK_BURST * rng.random(),
+                        entry_id,
+                        {
+                            "result": _format(unit, marks[entry_id]),
+                            "position": positions[entry_id],
+                            "status": "finished",
+                        },
+                    )
+                )
+            continue
+        # Field events: each round every athlete jumps or throws once and the
+        # board shows their best mark so far.
+        best: dict[int, float] = {}
+        step = slot / (ATTEMPT_ROUNDS * max(1, len(entries)))
+        for attempt in range(ATTEMPT_ROUNDS):
+            for order, entry in enumerate(entries):
+                mark = marks[entry["id"]] * (1 - 0.04 * rng.random() * (ATTEMPT_ROUNDS - attempt))
+                previous = best.get(entry["id"])
+                if previous is not None and mark <= previous:
+                    continue
+                best[entry["id"]] = mark
+                final = attempt == ATTEMPT_ROUNDS - 1
+                payload: dict[str, Any] = {"result": _format(unit, mark)}
+                if final:
+                    payload.update(position=positions[entry["id"]], status="finished")
+                updates.append(
+                    Update(start + (attempt * len(entries) + order) * step, entry["id"], payload)
+                )
+    updates.sort()
+    return updates
+
+
+async def spectator(
+    client, event_id: int, stats: Stats, seen: set, interval: float, stop: asyncio.Event
+) -> None:
+    rng = random.Random()
+    await asyncio.sleep(rng.uniform(0, interval))
+    while not stop.is_set():
+        started = time.monotonic()
+        try:
+            response = await client.get(f"/api/v1/events/{event_id}")
+        except Exception:
+            stats.errors["poll"] += 1
+            response = None
+        received = time.monotonic()
+        stats.poll_ms.append((received - started) * 1000)
+        if response is not None and response.status_code == 200:
+            for discipline in response.json()["disciplines"]:
+                for entry in discipline["entries"]:
+                    if entry["result"] is None:
+                        continue
+                    key = (entry["id"], entry["result"])
+                    sent = stats.published.get(key)
+                    if sent is None or key in seen:
+                        continue
+                    seen.add(key)
+                    stats.seen_ms.append((received - sent) * 1000)
+                    if key not in stats.first_seen:
+                        stats.first_seen.add(key)
+                        stats.first_seen_ms.append((received - sent) * 1000)
+        elif response is not None:
+            stats.errors["poll"] += 1
+        await asyncio.sleep(max(0.0, interval * rng.uniform(0.8, 1.2) - (received - started)))
+
+
+async def official(client, updates: list[Update], stats: Stats, began: float) -> None:
+    for update in updates:
+        delay = began + update.at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        sent = time.monotonic()
+        stats.published[(update.entry_id, update.payload["result"])] = sent
+        try:
+            response = await client.patch(
+                f"/api/v1/events/entries/{update.entry_id}", json=update.payload
+            )
+            failed = response.status_code >= 400
+        except Exception:
+            failed = True
+        stats.update_ms.append((time.monotonic() - sent) * 1000)
+        if failed:
+            stats.errors["update"] += 1
+
+
+def _results_csv(meet: str, rows: int, rng: random.Random) -> bytes:
+    lines = ["event,event_date,location,discipline,category,round,athlete,team,bib,result"]
+    for bib in range(rows):
+        lines.append(
+            f"{meet},{date.today().isoformat()},Lima,100m,Senior Men,Final,"
+            f"Athlete {bib},Upload Club,{bib},{10 + rng.random() * 2:.2f}"
+        )
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+async def uploader(
+    client,
+    federations: list[str],
+    token: str,
+    count: int,
+    rows: int,
+    duration: float,
+    stats: Stats,
+) -> None:
+    rng = random.Random(7)
+    for number in range(count):
+        await asyncio.sleep(duration / max(1, count) * rng.uniform(0.5, 1.0))
+        body = _results_csv(f"Simulated Upload {number + 1}", rows, rng)
+        started = time.monotonic()
+        try:
+            created = await client.post(
+                "/api/v1/federations/uploads",
+                json={
+                    "federation_name": federations[number % len(federations)],
+                    "contact_email": "results@example.org",
+                    "access_token": token,
+                    "filename": f"upload-{number + 1}.csv",
+                    "total_size": len(body),
+                },
+            )
+            created.raise_for_status()
+            finished = await client.put(
+                f"/api/v1/federations/uploads/{created.json()['id']}",
+                content=body,
+                headers={"Upload-Offset": "0"},
+            )
+            finished.raise_for_status()
+        except Exception:
+            stats.errors["upload"] += 1
+        stats.upload_ms.append((time.monotonic() - started) * 1000)
+
+
+async def simulate(client, args: argparse.Namespace, event_id: int, federations: list[str]):
+    detail = await client.get(f"/api/v1/events/{event_id}")
+    detail.raise_for_status()
+    rng = random.Random(args.seed)
+    updates = build_timeline(detail.json(), args.duration, rng)
+    per_official = [updates[index :: args.officials] for index in range(args.officials)]
+
+    stats = Stats()
+    stop = asyncio.Event()
+    spectators = [
+        asyncio.create_task(
+            spectator(client, event_id, stats, set(), args.poll_interval, stop)
+        )
+        for _ in range(args.spectators)
+    ]
+    began = time.monotonic()
+    workers = [official(client, share, stats, began) for share in per_official]
+    if args.uploads and federations:
+        workers.append(
+            uploader(
+                client,
+                federations,
+                args.ingest_token,
+                args.uploads,
+                args.upload_rows,
+                args.duration,
+                stats,
+            )
+        )
+    await asyncio.gather(*workers)
+    # Give every spectator time for one more poll after the last result.
+    await asyncio.sleep(args.poll_interval * 1.5)
+    stop.set()
+    await asyncio.gather(*spectators)
+    elapsed = time.monotonic() - began
+
+    # A field athlete's early marks may be replaced before any poll shows
+    # them; only a result still standing at the end must have been seen.
+    standing = {entry_id: (entry_id, result) for entry_id, result in stats.published}
+    never_seen = len(set(standing.values()) - stats.first_seen)
+    superseded = len(set(stats.published) - stats.first_seen) - never_seen
+    return {
+        "event_id": event_id,
+        "elapsed_s": round(elapsed, 1),
+        "spectators": args.spectators,
+        "officials": args.officials,
+        "poll_interval_s": args.poll_interval,
+        "results_published": len(stats.published),
+        "results_never_seen": never_seen,
+        "superseded_before_seen": superseded,
+        "publication_latency": {
+            "first_spectator": _summary(stats.first_seen_ms),
+            "all_spectators": _summary(stats.seen_ms),
+        },
+        "requests": {
+            "poll": {**_summary(stats.poll_ms), "errors": stats.errors["poll"]},
+            "update": {**_summary(stats.update_ms), "errors": stats.errors["update"]},
+            "upload": {**_summary(stats.upload_ms), "errors": stats.errors["upload"]},
+        },
+    }
+
+
+async def run_in_process(args: argparse.Namespace) -> dict[str, Any]:
+    import httpx
+    from sqlalchemy import select
+
+    from app.core.database import DatabaseSessionManager
+    from app.models import Event, Federation
+    from app.services.synthetic_data import DatasetSize, SyntheticDataset, load_dataset
+    from main import create_app
+
+    engine = DatabaseSessionManager().engine
+    # Mid-season, so the first half of the meets have results and the rest do not.
+    season = date.today().year
+    today = date(season, 6, 1)
+    size = DatasetSize().scaled(args.scale)
+    await load_dataset(engine, SyntheticDataset(size, seed=args.seed, season=season, today=today))
+    async with engine.connect() as conn:
+        event_id = await conn.scalar(
+            select(Event.id).where(Event.start_date > today).order_by(Event.start_date).limit(1)
+        )
+        federations = (await conn.scalars(select(Federation.name).order_by(Federation.id))).all()
+    if event_id is None:
+        raise SystemExit("The synthetic season has no meet left to replay")
+
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://simulator") as client:
+            return await simulate(client, args, event_id, list(federations))
+
+
+async def run_remote(args: argparse.Namespace) -> dict[str, Any]:
+    import httpx
+
+    if args.event_id is None:
+        raise SystemExit("--event-id is required with --base-url")
+    limits = httpx.Limits(max_connections=args.spectators + args.officials + 2)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30) as client:
+        return await simulate(client, args, args.event_id, args.federation or [])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spectators", type=int, default=200)
+    parser.add_argument("--poll-interval", type=float, default=2.0)
+    parser.add_argument("--officials", type=int, default=3)
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to replay the meet in")
+    parser.add_argument("--uploads", type=int, default=2)
+    parser.add_argument("--upload-rows", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scale", type=float, default=0.2, help="Synthetic season size")
+    parser.add_argument("--base-url", help="Drive a running instance instead of an in-process app")
+    parser.add_argument("--event-id", type=int)
+    parser.add_argument("--federation", action="append", help="Federation name for uploads")
+    parser.add_argument("--ingest-token")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    args = parser.parse_args()
+    if args.spectators < 1 or args.officials < 1:
+        parser.error("--spectators and --officials must be at least 1")
+
+    if args.base_url:
+        report = asyncio.run(run_remote(args))
+    else:
+        with tempfile.TemporaryDirectory(prefix="trackeo-meet-") as scratch:
+            # Settings are read on first use, so configure them before importing the app.
+            os.environ["ATHLETICS_DATABASE_URL"] = f"sqlite+aiosqlite:///{scratch}/meet.db"
+            os.environ["ATHLETICS_SEED_DEMO_DATA"] = "false"
+            os.environ["ATHLETICS_RATE_LIMIT_ENABLED"] = "false"
+            # Measure what production runs: read models built from rows are not re-validated.
+            os.environ.setdefault("ATHLETICS_VALIDATE_TRUSTED_ROWS", "false")
+            os.environ["ATHLETICS_UPLOAD_DIR"] = f"{scratch}/uploads"
+            from app.services.synthetic_data import SYNTHETIC_INGEST_TOKEN
+
+            args.ingest_token = args.ingest_token or SYNTHETIC_INGEST_TOKEN
+            report = asyncio.run(run_in_process(args))
+
+    payload = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Measure event-loop latency while a burst of password verifications runs.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/login_storm.py --logins 200
+
+The script verifies ``--logins`` passwords concurrently, first inline on the
+event loop (the old behaviour) and then through ``PasswordHasher.verify_async``,
+while a heartbeat coroutine records how late each 5 ms tick fires. With the
+thread pool the heartbeat lag should stay close to the idle baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app.core.security import PasswordHasher  # noqa: E402
+
+TICK_SECONDS = 0.005
+
+
+async def _heartbeat(stop: asyncio.Event, samples: list[float]) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        scheduled = loop.time()
+        await asyncio.sleep(TICK_SECONDS)
+        samples.append((loop.time() - scheduled - TICK_SECONDS) * 1000)
+
+
+async def _inline_verify(hasher: PasswordHasher, password: str, hashed: str) -> bool:
+    return hasher.verify(password, hashed)
+
+
+async def _run(mode: str, logins: int, hashed: str) -> dict[str, float]:
+    hasher = PasswordHasher()
+    stop = asyncio.Event()
+    samples: list[float] = []
+    heartbeat = asyncio.create_task(_heartbeat(stop, samples))
+    await asyncio.sleep(TICK_SECONDS * 4)
+
+    started = time.perf_counter()
+    if mode == "inline":
+        calls = [_inline_verify(hasher, "SuperSecure123", hashed) for _ in range(logins)]
+    else:
+        calls = [hasher.verify_async("SuperSecure123", hashed) for _ in range(logins)]
+    await asyncio.gather(*calls)
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await heartbeat
+    ordered = sorted(samples) or [0.0]
+    return {
+        "elapsed_s": elapsed,
+        "lag_p50_ms": statistics.median(ordered),
+        "lag_p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+        "lag_max_ms": ordered[-1],
+    }
+
+
+async def main(logins: int) -> None:
+    hashed = PasswordHasher().hash("SuperSecure123")
+    for mode in ("inline", "executor"):
+        stats = await _run(mode, logins, hashed)
+        formatted = ", ".join(f"{key}={value:.2f}" for key, value in stats.items())
+        print(f"{mode:>8}: {formatted}")
+    PasswordHasher().shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins))
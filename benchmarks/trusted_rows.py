@@ -0,0 +1,207 @@
+"""Per-row cost of building read models from database rows.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/trusted_rows.py --rows 10000
+
+For each read model that a list endpoint builds from rows, the script times
+three ways of building ``--rows`` instances from unsaved ORM objects:
+validating (``model_validate`` or ``Model(...)``), ``model_construct``, and
+the generated constructors from ``app.core.trusted_rows``. It prints the
+microseconds per row for each, using the best of ``--repeat`` runs. The
+``inputs`` column is the cost of reading the row's values alone, which every
+method pays.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+
+def _cases(rows: int) -> dict[str, tuple[list[Any], Callable, Callable, Callable, Callable]]:
+    from app.core.trusted_rows import _generated_builder, _generated_loader
+    from app.models import Club, Event, NewsArticle, NewsAudience, RecentResult, Roster, User
+    from app.schemas.event import EventRead
+    from app.schemas.home import HomeResult, HomeRoster
+    from app.schemas.news import NewsRead
+    from app.schemas.roster import RosterRead
+    from app.schemas.user import UserRead
+
+    stamp = datetime(2025, 5, 1, 12, 0)
+    events = [
+        Event(
+            id=n,
+            name=f"Grand Prix {n}",
+            location="Lima",
+            start_date=date(2025, 5, 1),
+            end_date=date(2025, 5, 2),
+            federation_id=n % 10 + 1,
+        )
+        for n in range(rows)
+    ]
+    news = [
+        NewsArticle(
+            id=n,
+            title=f"Season report {n}",
+            region="Andes",
+            excerpt="Results from the weekend.",
+            content="Full results and reports from the weekend meets.",
+            audience=NewsAudience.PUBLIC,
+            published_at=stamp,
+        )
+        for n in range(rows)
+    ]
+    users = [
+        User(
+            id=n,
+            email=f"athlete{n}@example.org",
+            full_name=f"Athlete {n}",
+            role="athlete",
+            created_at=stamp,
+        )
+        for n in range(rows)
+    ]
+    club = Club(id=1, name="Club Atlético Lima")
+    rosters = [
+        (
+            Roster(
+                id=n,
+                name=f"Senior squad {n}",
+                country="Peru",
+                division="Senior",
+                coach_name="Ana Torres",
+                athlete_count=15,
+                updated_at=stamp,
+            ),
+            club,
+        )
+        for n in range(rows)
+    ]
+    feed = [
+        RecentResult(
+            entry_id=n,
+            event_id=1,
+            event_name="Grand Prix Lima",
+            discipline_id=2,
+            discipline_name="100m",
+            athlete_name=f"Athlete {n}",
+            team_name="Club Atlético Lima",
+            position=n % 8 + 1,
+            result="10.45",
+            points=8,
+            roster_id=3,
+            roster_name="Senior squad",
+            club_id=1,
+            club_name="Club Atlético Lima",
+            federation_id=1,
+            federation_name="Federación Peruana",
+            updated_at=stamp,
+        )
+        for n in range(rows)
+    ]
+
+    def roster_values(pair) -> dict[str, Any]:
+        roster, owner = pair
+        return dict(
+            id=roster.id,
+            name=roster.name,
+            country=roster.country,
+            division=roster.division,
+            coach_name=roster.coach_name,
+            athlete_count=roster.athlete_count,
+            updated_at=roster.updated_at,
+            club_id=owner.id,
+            club_name=owner.name,
+        )
+
+    def home_roster_values(pair) -> dict[str, Any]:
+        roster, _ = pair
+        return dict(
+            id=roster.id,
+            name=roster.name,
+            division=roster.division,
+            coach_name=roster.coach_name,
+            athlete_count=roster.athlete_count,
+            updated_at=roster.updated_at,
+        )
+
+    def result_values(row) -> dict[str, Any]:
+        return {name: getattr(row, name) for name in HomeResult.model_fields}
+
+    def attributes(model) -> Callable[[Any], dict[str, Any]]:
+        return lambda row: {name: getattr(row, name) for name in model.model_fields}
+
+    def keyword_case(model, values):
+        build = _generated_builder(model)
+        return (
+            values,
+            lambda row: model(**values(row)),
+            lambda row: model.model_construct(**values(row)),
+            lambda row: build(**values(row)),
+        )
+
+    def attribute_case(model):
+        return (
+            attributes(model),
+            model.model_validate,
+            lambda row: model.model_construct(**attributes(model)(row)),
+            _generated_loader(model),
+        )
+
+    return {
+        "EventRead": (events, *attribute_case(EventRead)),
+        "NewsRead": (news, *attribute_case(NewsRead)),
+        "UserRead": (users, *attribute_case(UserRead)),
+        "RosterRead": (rosters, *keyword_case(RosterRead, roster_values)),
+        "HomeRoster": (rosters, *keyword_case(HomeRoster, home_roster_values)),
+        "HomeResult": (feed, *keyword_case(HomeResult, result_values)),
+    }
+
+
+def _best(build: Callable, rows: list[Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for row in rows:
+            build(row)
+        best = min(best, time.perf_counter() - started)
+    return best / len(rows) * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Write the JSON results here")
+    args = parser.parse_args()
+
+    results: dict[str, dict[str, float]] = {}
+    columns = ("inputs", "validate", "construct", "trusted")
+    print(f"{'model':>12}  " + "  ".join(f"{column:>9}" for column in columns) + "  us/row")
+    for name, (rows, inputs, validate, construct, trusted) in _cases(args.rows).items():
+        results[name] = {
+            "inputs_us": round(_best(inputs, rows, args.repeat), 3),
+            "validate_us": round(_best(validate, rows, args.repeat), 3),
+            "model_construct_us": round(_best(construct, rows, args.repeat), 3),
+            "trusted_us": round(_best(trusted, rows, args.repeat), 3),
+        }
+        row = results[name]
+        print(f"{name:>12}  " + "  ".join(f"{value:9.2f}" for value in row.values()))
+    if args.output is not None:
+        args.output.write_text(
+            json.dumps({"rows": args.rows, "results": results}, indent=2) + "\n", encoding="utf-8"
+        )
+
+
+if __name__ == "__main__":
+    main()
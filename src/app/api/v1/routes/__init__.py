@@ -5,7 +5,10 @@ from . import (
     events,
     federations,
     health,
+    leaderboards,
+    metrics,
     news,
+    profiling,
     rosters,
     search,
     subscribers,
@@ -18,7 +21,10 @@ __all__ = [
     "events",
     "federations",
     "health",
+    "leaderboards",
+    "metrics",
     "news",
+    "profiling",
     "rosters",
     "search",
     "subscribers",
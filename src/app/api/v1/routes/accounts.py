@@ -2,8 +2,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.core.authorization import get_current_user_with_model
+from app.core.rate_limit import admission_control
 from app.core.security import TokenService
-from app.schemas.auth import TokenResponse
+from app.schemas.auth import RefreshTokenRequest, TokenResponse
 from app.schemas.user import UserCreate, UserRead
 from app.services.accounts import AccountsService, get_accounts_service
 
@@ -36,7 +37,11 @@ async def get_user(
     return user
 
 
-@router.post("/login", response_model=TokenResponse)
+@router.post(
+    "/login",
+    response_model=TokenResponse,
+    dependencies=[Depends(admission_control("login"))],
+)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     service: AccountsService = Depends(get_accounts_service),
@@ -45,7 +50,31 @@ async def login(
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect credentials")
     token, expires_at = TokenService().create_access_token({"sub": str(user.id)})
-    return TokenResponse(access_token=token, expires_at=expires_at)
+    refresh_token, refresh_expires_at = await service.issue_refresh_token(user.id)
+    return TokenResponse(
+        access_token=token,
+        expires_at=expires_at,
+        refresh_token=refresh_token,
+        refresh_expires_at=refresh_expires_at,
+    )
+
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh_access_token(
+    payload: RefreshTokenRequest,
+    service: AccountsService = Depends(get_accounts_service),
+) -> TokenResponse:
+    rotated = await service.rotate_refresh_token(payload.refresh_token)
+    if rotated is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+    user_id, refresh_token, refresh_expires_at = rotated
+    token, expires_at = TokenService().create_access_token({"sub": str(user_id)})
+    return TokenResponse(
+        access_token=token,
+        expires_at=expires_at,
+        refresh_token=refresh_token,
+        refresh_expires_at=refresh_expires_at,
+    )
 
 
 @router.get("/me", response_model=UserRead)
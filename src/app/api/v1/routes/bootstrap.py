@@ -2,14 +2,15 @@
 
 from fastapi import APIRouter
 
+from app.core.serialization import ModelJSONResponse
 from app.schemas.home import HomeSnapshot
 from app.services.home import get_home_snapshot
 
 router = APIRouter(prefix="/bootstrap", tags=["bootstrap"])
 
 
-@router.get("/home", response_model=HomeSnapshot)
-async def read_home_snapshot() -> HomeSnapshot:
+@router.get("/home", response_model=HomeSnapshot, response_class=ModelJSONResponse)
+async def read_home_snapshot() -> ModelJSONResponse:
     """Return federations, clubs, results, and news needed for the landing view."""
 
-    return await get_home_snapshot()
+    return ModelJSONResponse(await get_home_snapshot())
@@ -1,4 +1,7 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+
+from app.core.serialization import ModelJSONResponse
+from app.models import StandingScope
 
 from app.schemas.event import (
     EventCreate,
@@ -13,7 +16,9 @@ from app.schemas.event import (
     EventSessionCreate,
     EventSessionRead,
 )
+from app.schemas.standing import EventStandingsRead
 from app.services.events import EventsService, get_events_service
+from app.services.standings import StandingsService, get_standings_service
 
 router = APIRouter(prefix="/events", tags=["events"])
 
@@ -30,11 +35,21 @@ async def list_events(service: EventsService = Depends(get_events_service)) -> l
     return await service.list_events()
 
 
-@router.get("/{event_id}", response_model=EventDetailRead)
+@router.get("/{event_id}", response_model=EventDetailRead, response_class=ModelJSONResponse)
 async def read_event_detail(
     event_id: int, service: EventsService = Depends(get_events_service)
-) -> EventDetailRead:
-    return await service.get_event_detail(event_id)
+) -> ModelJSONResponse:
+    return ModelJSONResponse(await service.get_event_detail(event_id))
+
+
+@router.get("/{event_id}/standings", response_model=EventStandingsRead)
+async def read_event_standings(
+    event_id: int,
+    scope: StandingScope = Query(default=StandingScope.TEAM),
+    limit: int = Query(default=100, ge=1, le=500),
+    service: StandingsService = Depends(get_standings_service),
+) -> EventStandingsRead:
+    return await service.get_standings(event_id, scope, limit)
 
 
 @router.post("/{event_id}/sessions", response_model=EventSessionRead, status_code=201)
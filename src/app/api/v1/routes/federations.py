@@ -1,7 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from starlette.requests import ClientDisconnect
 
 from app.core.authorization import require_roles
-from app.schemas.federation import FederationSubmissionCreate, FederationSubmissionRead
+from app.core.rate_limit import admission_control
+from app.integrations.message_bus import MessageBusBackpressureError
+from app.schemas.federation import (
+    FederationSubmissionCreate,
+    FederationSubmissionRead,
+    FederationUploadCreate,
+    FederationUploadRead,
+)
+from app.services.federation_uploads import (
+    FederationUploadService,
+    get_federation_upload_service,
+)
 from app.services.federations import FederationIngestionService, get_federation_service
 
 router = APIRouter(prefix="/federations", tags=["federations"])
@@ -11,6 +23,7 @@ router = APIRouter(prefix="/federations", tags=["federations"])
     "/submissions",
     response_model=FederationSubmissionRead,
     status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(admission_control("submissions"))],
 )
 async def submit_results(
     payload: FederationSubmissionCreate,
@@ -20,6 +33,12 @@ async def submit_results(
         return await service.enqueue_submission(payload)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except MessageBusBackpressureError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Ingestion queue is full",
+            headers={"Retry-After": "5"},
+        ) from exc
 
 
 @router.get(
@@ -31,3 +50,55 @@ async def list_submissions(
     service: FederationIngestionService = Depends(get_federation_service),
 ) -> list[FederationSubmissionRead]:
     return await service.list_submissions()
+
+
+@router.post(
+    "/uploads",
+    response_model=FederationUploadRead,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(admission_control("submissions"))],
+)
+async def create_upload(
+    payload: FederationUploadCreate,
+    service: FederationUploadService = Depends(get_federation_upload_service),
+) -> FederationUploadRead:
+    try:
+        return await service.create_upload(payload)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.get("/uploads/{upload_id}", response_model=FederationUploadRead)
+async def get_upload(
+    upload_id: str,
+    service: FederationUploadService = Depends(get_federation_upload_service),
+) -> FederationUploadRead:
+    return await service.get_upload(upload_id)
+
+
+@router.put(
+    "/uploads/{upload_id}",
+    response_model=FederationUploadRead,
+    dependencies=[Depends(admission_control("submissions"))],
+)
+async def upload_chunk(
+    upload_id: str,
+    request: Request,
+    upload_offset: int = Header(..., ge=0),
+    service: FederationUploadService = Depends(get_federation_upload_service),
+) -> FederationUploadRead:
+    try:
+        return await service.append_chunk(upload_id, upload_offset, request.stream())
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except ClientDisconnect as exc:
+        # The bytes received so far are kept; the client resumes after a GET.
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Upload interrupted"
+        ) from exc
+    except MessageBusBackpressureError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Ingestion queue is full",
+            headers={"Retry-After": "5"},
+        ) from exc
@@ -1,9 +1,25 @@
+from typing import Any
+
 from fastapi import APIRouter
 
 from app.core.config import SettingsSingleton
+from app.core.loop_monitor import LoopLagMonitor
+from app.integrations.message_bus import MessageBus
 
 router = APIRouter(tags=["health"])
 
+# Public per-topic figures; handler names and latency histograms are served
+# behind the profiling token at /profiling/message-bus.
+_PUBLIC_BUS_FIELDS = (
+    "queue_depth",
+    "published",
+    "rejected",
+    "delivered",
+    "failed",
+    "dead_lettered",
+    "worker_restarts",
+)
+
 
 @router.get("/health", summary="Readiness probe")
 async def health_check() -> dict[str, str]:
@@ -13,3 +29,16 @@ async def health_check() -> dict[str, str]:
         "status": "ok",
         "environment": settings.environment,
     }
+
+
+@router.get("/health/message-bus", summary="Message bus queue depth and delivery counts")
+async def message_bus_stats() -> dict[str, dict[str, Any]]:
+    return {
+        topic: {name: topic_stats[name] for name in _PUBLIC_BUS_FIELDS}
+        for topic, topic_stats in (await MessageBus().stats()).items()
+    }
+
+
+@router.get("/health/event-loop", summary="Event loop lag percentiles and stall count")
+async def event_loop_stats() -> dict[str, Any]:
+    return LoopLagMonitor().snapshot()
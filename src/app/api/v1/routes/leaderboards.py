@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.schemas.leaderboard import LeaderboardRead
+from app.services.leaderboards import LeaderboardService, get_leaderboard_service
+
+router = APIRouter(prefix="/leaderboards", tags=["leaderboards"])
+
+
+@router.get("/{discipline}", response_model=LeaderboardRead)
+async def read_leaderboard(
+    discipline: str,
+    season: int | None = Query(default=None, description="Defaults to the latest season"),
+    category: str | None = Query(default=None, description="Omit for the open list"),
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    service: LeaderboardService = Depends(get_leaderboard_service),
+) -> LeaderboardRead:
+    return await service.get_leaderboard(discipline, season, category, limit, offset)
@@ -0,0 +1,73 @@
+import math
+from typing import Any
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.database import DatabaseSessionManager
+from app.core.loop_monitor import LoopLagMonitor
+from app.core.metrics import PrometheusText
+from app.core.request_metrics import PoolMetrics, RequestMetrics
+from app.integrations.message_bus import MessageBus
+
+router = APIRouter(tags=["health"])
+
+_BUS_COUNTERS = ("published", "rejected", "delivered", "failed", "dead_lettered")
+
+
+@router.get("/metrics", summary="Prometheus metrics", response_class=PlainTextResponse)
+async def prometheus_metrics() -> PlainTextResponse:
+    output = PrometheusText()
+    RequestMetrics().write(output)
+    LoopLagMonitor().write(output)
+    PoolMetrics().write(output, DatabaseSessionManager().engine.pool)
+    _write_message_bus(output, await MessageBus().stats())
+    return PlainTextResponse(output.render(), media_type=output.content_type)
+
+
+def _write_message_bus(output: PrometheusText, stats: dict[str, dict[str, Any]]) -> None:
+    output.metric("message_bus_queue_depth", "gauge", "Payloads published and not yet handled")
+    for topic, topic_stats in stats.items():
+        output.sample("message_bus_queue_depth", topic_stats["queue_depth"], {"topic": topic})
+
+    output.metric("message_bus_messages_total", "counter", "Payloads by topic and outcome")
+    for topic, topic_stats in stats.items():
+        for outcome in _BUS_COUNTERS:
+            output.sample(
+                "message_bus_messages_total",
+                topic_stats[outcome],
+                {"topic": topic, "outcome": outcome},
+            )
+
+    output.metric("message_bus_worker_restarts_total", "counter", "Crashed topic workers restarted")
+    for topic, topic_stats in stats.items():
+        output.sample(
+            "message_bus_worker_restarts_total", topic_stats["worker_restarts"], {"topic": topic}
+        )
+
+    output.metric(
+        "message_bus_wait_seconds", "histogram", "Time payloads spent queued before handling"
+    )
+    for topic, topic_stats in stats.items():
+        _write_snapshot(
+            output, "message_bus_wait_seconds", topic_stats["wait_seconds"], {"topic": topic}
+        )
+
+    output.metric("message_bus_handler_seconds", "histogram", "Handler run time")
+    for topic, topic_stats in stats.items():
+        for handler, snapshot in topic_stats["handler_seconds"].items():
+            _write_snapshot(
+                output,
+                "message_bus_handler_seconds",
+                snapshot,
+                {"topic": topic, "handler": handler},
+            )
+
+
+def _write_snapshot(
+    output: PrometheusText, name: str, snapshot: dict[str, Any], labels: dict[str, str]
+) -> None:
+    buckets = [
+        (math.inf if bound == "+Inf" else bound, count) for bound, count in snapshot["buckets"]
+    ]
+    output.histogram(name, buckets, snapshot["sum"], snapshot["count"], labels)
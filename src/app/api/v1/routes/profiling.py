@@ -0,0 +1,73 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse
+
+from app.core.loop_monitor import LoopLagMonitor
+from app.core.profiling import ProfileStore, RequestProfile, require_profiling_token
+from app.integrations.message_bus import MessageBus
+from app.schemas.profiling import ProfileDetail, ProfileFrame, ProfileSummary
+
+router = APIRouter(
+    prefix="/profiling",
+    tags=["profiling"],
+    dependencies=[Depends(require_profiling_token)],
+)
+
+
+@router.get("/requests", response_model=list[ProfileSummary])
+async def list_profiles() -> list[ProfileSummary]:
+    return [_summary(profile) for profile in ProfileStore().recent()]
+
+
+@router.get("/requests/{profile_id}", response_model=ProfileDetail)
+async def read_profile(
+    profile_id: int, limit: int = Query(default=20, ge=1, le=200)
+) -> ProfileDetail:
+    profile = ProfileStore().get(profile_id)
+    own, inclusive = profile.top(limit)
+    total = profile.sample_count
+    return ProfileDetail(
+        **_summary(profile).model_dump(),
+        self_time=_frames(own, total),
+        inclusive_time=_frames(inclusive, total),
+    )
+
+
+@router.get(
+    "/requests/{profile_id}/collapsed",
+    response_class=PlainTextResponse,
+    summary="Collapsed stacks for flamegraph.pl or speedscope",
+)
+async def read_collapsed_stacks(profile_id: int) -> PlainTextResponse:
+    return PlainTextResponse(ProfileStore().get(profile_id).collapsed())
+
+
+@router.get("/event-loop", summary="Event loop lag with the stacks of recent stalls")
+async def read_event_loop_stalls() -> dict[str, Any]:
+    return LoopLagMonitor().snapshot(include_stalls=True)
+
+
+@router.get("/message-bus", summary="Message bus options, wait and handler latency per topic")
+async def read_message_bus_stats() -> dict[str, dict[str, Any]]:
+    return await MessageBus().stats()
+
+
+def _summary(profile: RequestProfile) -> ProfileSummary:
+    return ProfileSummary(
+        id=profile.id,
+        method=profile.method,
+        path=profile.path,
+        status=profile.status,
+        started_at=profile.started_at,
+        duration_ms=round(profile.duration * 1000, 3),
+        interval_ms=profile.interval * 1000,
+        samples=profile.sample_count,
+    )
+
+
+def _frames(counts: list[tuple[str, int]], total: int) -> list[ProfileFrame]:
+    return [
+        ProfileFrame(frame=frame, samples=samples, percent=round(100 * samples / total, 1))
+        for frame, samples in counts
+    ]
@@ -3,7 +3,6 @@ from collections.abc import Callable
 from fastapi import Depends, HTTPException, status
 
 from app.schemas.user import UserRead
-from app.services.accounts import AccountsService, get_accounts_service
 
 from .security import get_current_user
 
@@ -21,9 +20,7 @@ def require_roles(*roles: str) -> Callable[[UserRead], UserRead]:
 
 async def get_current_user_with_model(
     current_user: UserRead = Depends(get_current_user),
-    accounts: AccountsService = Depends(get_accounts_service),
 ) -> UserRead:
-    refreshed = await accounts.get_user_by_id(current_user.id)
-    if refreshed is None:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User no longer exists")
-    return refreshed
+    # ``get_current_user`` already loads the user row for this request (and
+    # rejects deleted users), so it is not fetched a second time.
+    return current_user
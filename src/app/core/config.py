@@ -1,6 +1,7 @@
 from functools import cached_property
 from pathlib import Path
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .singleton import ResettableSingletonMeta
@@ -19,11 +20,57 @@ class Settings(BaseSettings):
     api_v1_prefix: str = "/api/v1"
     database_url: str = "sqlite+aiosqlite:///./data/app.db"
     redis_url: str = "redis://localhost:6379/0"
+    message_bus_backend: str = "memory"
+    message_bus_stream_prefix: str = "trackeo"
+    message_bus_consumer_group: str = "trackeo-workers"
+    message_bus_consume: bool = True
+    message_bus_workers: int = 4
+    message_bus_queue_size: int = 1000
+    message_bus_publish_timeout_seconds: float = 5.0
+    message_bus_max_deliveries: int = 5
+    ingestion_workers: int = 2
+    ingestion_batch_size: int = 50
+    ingestion_batch_wait_ms: float = 50
+    ingestion_chunk_size: int = 1000
+    ingestion_parse_workers: int | None = None
+    ingestion_fetch_timeout_seconds: float = 30.0
+    ingestion_allow_local_payloads: bool = False
+    upload_dir: str = "./data/uploads"
+    upload_max_bytes: int = 512 * 1024 * 1024
+    upload_expire_hours: int = 24
     secret_key: str = "change-me"
     access_token_expire_minutes: int = 60
+    refresh_token_expire_days: int = 30
+    password_hash_workers: int = 2
+    rate_limit_enabled: bool = True
+    login_rate_per_minute: float = 20
+    login_rate_burst: float = 10
+    login_max_concurrency: int = 8
+    submission_rate_per_minute: float = 30
+    submission_rate_burst: float = 10
+    federation_submission_rate_per_minute: float = 10
+    federation_submission_rate_burst: float = 5
+    submission_max_concurrency: int = 16
     allowed_hosts: list[str] = ["*"]
+    query_stats_header: bool = False
+    metrics_enabled: bool = True
+    loop_monitor_enabled: bool = True
+    loop_monitor_interval_ms: float = 50
+    loop_lag_threshold_ms: float = 100
+    loop_stalls_keep: int = 50
+    profiling_token: str | None = None
+    profiling_interval_ms: float = 2.0
+    profiling_keep: int = 20
+    # Unset means on everywhere except production; see app.core.trusted_rows.
+    validate_trusted_rows: bool | None = None
     seed_demo_data: bool = True
 
+    @model_validator(mode="after")
+    def _default_trusted_row_validation(self) -> "Settings":
+        if self.validate_trusted_rows is None:
+            self.validate_trusted_rows = self.environment.lower() != "production"
+        return self
+
     @cached_property
     def base_path(self) -> Path:
         return Path(__file__).resolve().parents[3]
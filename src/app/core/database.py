@@ -2,13 +2,25 @@ from collections.abc import AsyncGenerator
 from pathlib import Path
 
 import sqlalchemy as sa
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
-from app.models import Base
+from app.domain.marks import parse_marks
+from app.models import Base, EventDiscipline, EventEntry
 
 from .config import SettingsSingleton
+from .query_stats import instrument_engine
+from .request_metrics import instrument_pool
 from .singleton import ResettableSingletonMeta, SingletonMeta
 
+# Read-model tables filled from existing entries when an older database gains them.
+_READ_MODEL_TABLES = frozenset({"leaderboard_entries", "event_standings", "recent_results"})
+
 
 class DatabaseSessionManager(metaclass=ResettableSingletonMeta):
     def __init__(self) -> None:
@@ -20,6 +32,8 @@ class DatabaseSessionManager(metaclass=ResettableSingletonMeta):
                 Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
         self._engine = create_async_engine(settings.database_url, echo=False, future=True)
+        instrument_engine(self._engine)
+        instrument_pool(self._engine)
         self._session_factory = async_sessionmaker(self._engine, expire_on_commit=False)
 
     @property
@@ -36,11 +50,44 @@ class DatabaseSchemaManager:
 
     async def ensure_schema(self) -> None:
         async with self._engine.begin() as conn:
+            existing_tables = await conn.run_sync(
+                lambda sync_conn: set(sa.inspect(sync_conn).get_table_names())
+            )
             await conn.run_sync(Base.metadata.create_all)
             await conn.run_sync(self._ensure_user_subscription_columns)
             await conn.run_sync(self._ensure_federation_submission_columns)
             await conn.run_sync(self._ensure_federation_columns)
             await conn.run_sync(self._ensure_roster_columns)
+            await conn.run_sync(self._ensure_event_entry_columns)
+            await conn.run_sync(self._ensure_indexes)
+            if existing_tables:
+                await self._rebuild_read_models(conn, _READ_MODEL_TABLES - existing_tables)
+
+    async def _rebuild_read_models(self, conn: AsyncConnection, tables: set[str]) -> None:
+        """Fill read-model tables that were just created on an existing database.
+
+        Each table is rebuilt by the service that keeps it current, inside the
+        schema transaction, so a failed rebuild leaves the table uncreated.
+        """
+
+        if not tables:
+            return
+        # The services import this module, so they are imported on use.
+        from app.services.leaderboards import LeaderboardService
+        from app.services.recent_results import RecentResultsService
+        from app.services.standings import StandingsService
+
+        session = AsyncSession(bind=conn)
+        try:
+            if "leaderboard_entries" in tables:
+                await LeaderboardService(session).rebuild()
+            if "event_standings" in tables:
+                await StandingsService(session).rebuild()
+            if "recent_results" in tables:
+                await RecentResultsService(session).rebuild()
+            await session.flush()
+        finally:
+            await session.close()
 
     def _ensure_user_subscription_columns(self, sync_conn) -> None:
         if sync_conn.dialect.name != "sqlite":
@@ -84,6 +131,12 @@ class DatabaseSchemaManager:
                 sync_conn.execute(
                     sa.text(f"ALTER TABLE federation_submissions ADD COLUMN {column_name} {ddl}")
                 )
+        sync_conn.execute(
+            sa.text(
+                "CREATE INDEX IF NOT EXISTS ix_federation_submissions_checksum "
+                "ON federation_submissions (checksum)"
+            )
+        )
 
     def _ensure_federation_columns(self, sync_conn) -> None:
         if sync_conn.dialect.name != "sqlite":
@@ -116,6 +169,80 @@ class DatabaseSchemaManager:
             )
 
 
+    def _ensure_event_entry_columns(self, sync_conn) -> None:
+        if sync_conn.dialect.name != "sqlite":
+            return
+
+        inspector = sa.inspect(sync_conn)
+        if "event_entries" not in inspector.get_table_names():
+            return
+
+        existing_columns = {column["name"] for column in inspector.get_columns("event_entries")}
+
+        if "fingerprint" not in existing_columns:
+            sync_conn.execute(sa.text("ALTER TABLE event_entries ADD COLUMN fingerprint VARCHAR(32)"))
+        if "mark_value" not in existing_columns:
+            sync_conn.execute(sa.text("ALTER TABLE event_entries ADD COLUMN mark_value FLOAT"))
+            sync_conn.execute(sa.text("ALTER TABLE event_entries ADD COLUMN mark_unit VARCHAR(7)"))
+            sync_conn.execute(
+                sa.text(
+                    "CREATE INDEX IF NOT EXISTS ix_event_entries_discipline_mark "
+                    "ON event_entries (discipline_id, mark_value)"
+                )
+            )
+            self._backfill_entry_marks(sync_conn)
+
+    def _ensure_indexes(self, sync_conn) -> None:
+        """Create model indexes that tables from older schemas do not have yet.
+
+        ``create_all`` skips existing tables together with their indexes.
+        Indexes over columns a legacy table still lacks are left out.
+        """
+
+        inspector = sa.inspect(sync_conn)
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for index in table.indexes:
+                if {column.name for column in index.columns} <= existing:
+                    index.create(sync_conn, checkfirst=True)
+
+    def _backfill_entry_marks(self, sync_conn, batch_size: int = 5000) -> None:
+        """Parse the marks of entries written before ``mark_value`` existed."""
+
+        entries = EventEntry.__table__
+        disciplines = EventDiscipline.__table__
+        statement = (
+            sa.update(entries)
+            .where(entries.c.id == sa.bindparam("entry_id"))
+            # Keep ``updated_at``: a backfill is not a result change.
+            .values(
+                mark_value=sa.bindparam("value"),
+                mark_unit=sa.bindparam("unit"),
+                updated_at=entries.c.updated_at,
+            )
+        )
+        last_id = 0
+        while True:
+            rows = sync_conn.execute(
+                sa.select(entries.c.id, entries.c.result, disciplines.c.name)
+                .join(disciplines, disciplines.c.id == entries.c.discipline_id)
+                .where(entries.c.id > last_id, entries.c.result.is_not(None))
+                .order_by(entries.c.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                return
+            last_id = rows[-1].id
+            marks = parse_marks([row.result for row in rows], [row.name for row in rows])
+            updates = [
+                {"entry_id": row.id, "value": mark.value, "unit": mark.unit}
+                for row, mark in zip(rows, marks)
+                if mark is not None
+            ]
+            if updates:
+                sync_conn.execute(statement, updates)
+
+
 async def init_models() -> None:
     settings = SettingsSingleton().instance
     if settings.database_url.startswith("sqlite"):
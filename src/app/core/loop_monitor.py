@@ -0,0 +1,201 @@
+"""Event loop lag monitoring.
+
+Everything async in the app shares one event loop, so a synchronous call in
+any handler delays every other request. ``LoopLagMonitor`` runs a small task
+that sleeps for ``loop_monitor_interval_ms`` and records how late it wakes
+up; that scheduling delay is the loop lag and goes into a histogram.
+
+A task cannot observe the loop while the loop is blocked, so a watchdog
+thread checks the task's heartbeat as well. When the heartbeat is older than
+the interval plus ``loop_lag_threshold_ms``, the watchdog captures the loop
+thread's stack and the running task's name. This names the code that is
+blocking. Once the loop recovers, the stall is logged and kept in a short
+history. ``/api/v1/health/event-loop`` is public and shows only the lag
+percentiles and the stall count; the stalls themselves, with their stacks,
+are served at ``/api/v1/profiling/event-loop`` behind the profiling token.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from time import monotonic
+from typing import Any
+
+from .config import SettingsSingleton
+from .metrics import Histogram, PrometheusText
+from .singleton import ResettableSingletonMeta
+
+logger = logging.getLogger(__name__)
+
+LAG_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+LAG_QUANTILES: tuple[float, ...] = (0.5, 0.9, 0.99)
+_STACK_LIMIT = 40
+
+
+@dataclass
+class LoopStall:
+    at: datetime
+    lag: float
+    task: str | None = None
+    stack: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "at": self.at.isoformat(),
+            "lag_ms": round(self.lag * 1000, 1),
+            "task": self.task,
+            "stack": self.stack,
+        }
+
+
+class LoopLagMonitor(metaclass=ResettableSingletonMeta):
+    def __init__(self) -> None:
+        settings = SettingsSingleton().instance
+        self._interval = max(settings.loop_monitor_interval_ms, 1.0) / 1000
+        self._threshold = max(settings.loop_lag_threshold_ms, 1.0) / 1000
+        self.lag = Histogram(LAG_BUCKETS)
+        self.stalls: deque[LoopStall] = deque(maxlen=max(1, settings.loop_stalls_keep))
+        self.stall_count = 0
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._heartbeat = monotonic()
+        # Set by the watchdog while the loop is blocked, consumed by the task.
+        self._pending: LoopStall | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._stopped.clear()
+        self._heartbeat = monotonic()
+        self._task = loop.create_task(self._run(), name="loop-lag-monitor")
+        self._watchdog = threading.Thread(
+            target=self._watch,
+            args=(loop, threading.get_ident()),
+            name="loop-lag-watchdog",
+            daemon=True,
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        watchdog, self._watchdog = self._watchdog, None
+        if watchdog is not None:
+            watchdog.join()
+
+    def snapshot(self, include_stalls: bool = False) -> dict[str, Any]:
+        """Lag percentiles and stall count; ``include_stalls`` adds the recent stacks."""
+
+        snapshot: dict[str, Any] = {
+            "interval_ms": self._interval * 1000,
+            "threshold_ms": self._threshold * 1000,
+            "lag_seconds": {
+                **self.lag.snapshot(),
+                "p90": self.lag.quantile(0.9),
+            },
+            "stalls": self.stall_count,
+        }
+        if include_stalls:
+            snapshot["recent_stalls"] = [stall.as_dict() for stall in reversed(self.stalls)]
+        return snapshot
+
+    def write(self, output: PrometheusText) -> None:
+        output.metric(
+            "event_loop_lag_seconds", "histogram", "Delay between a timer's due time and its run"
+        )
+        output.histogram("event_loop_lag_seconds", self.lag.buckets(), self.lag.sum, self.lag.count)
+        output.metric(
+            "event_loop_lag_quantile_seconds", "gauge", "Estimated event loop lag percentiles"
+        )
+        for q in LAG_QUANTILES:
+            output.sample(
+                "event_loop_lag_quantile_seconds", self.lag.quantile(q), {"quantile": str(q)}
+            )
+        output.metric(
+            "event_loop_stalls_total", "counter", "Times the loop was blocked past the threshold"
+        )
+        output.sample("event_loop_stalls_total", self.stall_count)
+
+    def record(self, lag: float) -> None:
+        self.lag.observe(lag)
+        pending, self._pending = self._pending, None
+        if lag < self._threshold:
+            return
+        stall = pending or LoopStall(at=datetime.now(tz=timezone.utc), lag=lag)
+        stall.lag = lag
+        self.stall_count += 1
+        self.stalls.append(stall)
+        logger.warning(
+            "Event loop blocked for %.0f ms (task %s)%s",
+            lag * 1000,
+            stall.task or "unknown",
+            "\n" + "".join(stall.stack) if stall.stack else "",
+        )
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            self._heartbeat = monotonic()
+            self.record(max(0.0, loop.time() - expected))
+
+    def _watch(self, loop: asyncio.AbstractEventLoop, thread_id: int) -> None:
+        captured_for: float | None = None
+        while not self._stopped.wait(self._threshold / 2):
+            heartbeat = self._heartbeat
+            if captured_for == heartbeat:
+                continue
+            if monotonic() - heartbeat < self._interval + self._threshold:
+                continue
+            captured_for = heartbeat
+            self._pending = _capture(loop, thread_id)
+
+
+def _capture(loop: asyncio.AbstractEventLoop, thread_id: int) -> LoopStall:
+    task = asyncio.current_task(loop)
+    frame = sys._current_frames().get(thread_id)
+    stack = traceback.format_stack(frame, limit=_STACK_LIMIT) if frame is not None else []
+    return LoopStall(
+        at=datetime.now(tz=timezone.utc),
+        lag=0.0,
+        task=_task_name(task) if task is not None else None,
+        stack=stack,
+    )
+
+
+def _task_name(task: asyncio.Task) -> str:
+    coro = task.get_coro()
+    return f"{task.get_name()} ({getattr(coro, '__qualname__', coro)})"
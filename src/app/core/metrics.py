@@ -0,0 +1,139 @@
+"""Lightweight in-process metric primitives.
+
+Histograms use fixed, cumulative upper bounds (Prometheus style) so a snapshot
+can be rendered by any exporter without keeping individual samples around.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from collections.abc import Sequence
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class Histogram:
+    __slots__ = ("_bounds", "_counts", "count", "sum", "max")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self._bounds = tuple(sorted(buckets))
+        self._counts = [0] * (len(self._bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """Return ``(upper_bound, cumulative_count)`` pairs ending with ``+inf``."""
+
+        cumulative = 0
+        result: list[tuple[float, int]] = []
+        for bound, count in zip((*self._bounds, math.inf), self._counts):
+            cumulative += count
+            result.append((bound, cumulative))
+        return result
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile as the upper bound of its bucket.
+
+        The estimate never exceeds the largest observed value, which keeps it
+        finite for samples beyond the last bound.
+        """
+
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        for bound, cumulative in self.buckets():
+            if cumulative >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": [
+                ["+Inf" if math.isinf(bound) else bound, count]
+                for bound, count in self.buckets()
+            ],
+        }
+
+
+Labels = dict[str, str]
+
+
+class PrometheusText:
+    """Builder for the Prometheus text exposition format (version 0.0.4)."""
+
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+
+    def metric(self, name: str, kind: str, help_text: str) -> None:
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, value: float, labels: Labels | None = None) -> None:
+        self._lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    def histogram(
+        self,
+        name: str,
+        buckets: Sequence[tuple[float, int]],
+        total: float,
+        count: int,
+        labels: Labels | None = None,
+    ) -> None:
+        """Write one labelled histogram series from cumulative ``buckets``."""
+
+        labels = labels or {}
+        for bound, cumulative in buckets:
+            self.sample(f"{name}_bucket", cumulative, {**labels, "le": _format_value(bound)})
+        self.sample(f"{name}_sum", total, labels)
+        self.sample(f"{name}_count", count, labels)
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
+
+
+def _format_labels(labels: Labels | None) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
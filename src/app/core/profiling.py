@@ -0,0 +1,209 @@
+"""On-demand sampling profiler for single requests.
+
+Profiling is off unless ``ATHLETICS_PROFILING_TOKEN`` is set; without it the
+middleware is not installed at all. With a token configured, a request that
+carries ``X-Profile: <token>`` is profiled: a
+background thread reads the event loop thread's Python stack every
+``profiling_interval_ms`` and counts identical stacks. ORM hydration,
+Pydantic validation and template rendering all run on that thread, so they
+show up by name. Time spent waiting (including SQL running on the aiosqlite
+thread) appears as the loop's ``select`` frames.
+
+Finished profiles are kept in memory (``ProfileStore``) and served as a top-N
+summary and as collapsed stacks (``root;caller;leaf count``, the input format
+of ``flamegraph.pl`` and speedscope) under ``/api/v1/profiling``. Only one
+request is profiled at a time; others run normally. Samples are taken from
+the whole loop thread, so concurrent requests can appear in a profile.
+"""
+
+from __future__ import annotations
+
+import hmac
+import itertools
+import sys
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from types import FrameType
+
+from fastapi import Header, HTTPException, status
+
+from .config import SettingsSingleton
+from .singleton import ResettableSingletonMeta
+
+PROFILE_HEADER = "x-profile"
+
+Stack = tuple[str, ...]
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+def _stack(frame: FrameType | None) -> Stack:
+    names: list[str] = []
+    while frame is not None:
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    names.reverse()
+    return tuple(names)
+
+
+class StackSampler:
+    """Counts the stacks of one thread, sampled from a daemon thread."""
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        self._thread_id = thread_id
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self.samples: Counter[Stack] = Counter()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> Counter[Stack]:
+        self._stopped.set()
+        self._thread.join()
+        return self.samples
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is not None:
+                self.samples[_stack(frame)] += 1
+            del frame
+
+
+@dataclass
+class RequestProfile:
+    id: int
+    method: str
+    path: str
+    started_at: datetime
+    interval: float
+    duration: float = 0.0
+    status: int = 500
+    samples: Counter[Stack] = field(default_factory=Counter)
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self.samples.values())
+
+    def collapsed(self) -> str:
+        lines = [f"{';'.join(stack)} {count}" for stack, count in self.samples.most_common()]
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def top(self, limit: int = 20) -> tuple[list[tuple[str, int]], list[tuple[str, int]]]:
+        """Frames with the most samples: (self time, inclusive time)."""
+
+        own: Counter[str] = Counter()
+        inclusive: Counter[str] = Counter()
+        for stack, count in self.samples.items():
+            if not stack:
+                continue
+            own[stack[-1]] += count
+            # Recursive frames still count once per sample.
+            for name in set(stack):
+                inclusive[name] += count
+        return own.most_common(limit), inclusive.most_common(limit)
+
+
+class ProfileStore(metaclass=ResettableSingletonMeta):
+    def __init__(self) -> None:
+        settings = SettingsSingleton().instance
+        self._profiles: deque[RequestProfile] = deque(maxlen=max(1, settings.profiling_keep))
+        self._ids = itertools.count(1)
+        self.active = False
+
+    def new_profile(self, method: str, path: str, interval: float) -> RequestProfile:
+        return RequestProfile(
+            id=next(self._ids),
+            method=method,
+            path=path,
+            started_at=datetime.now(tz=timezone.utc),
+            interval=interval,
+        )
+
+    def save(self, profile: RequestProfile) -> None:
+        self._profiles.append(profile)
+
+    def recent(self) -> list[RequestProfile]:
+        return list(reversed(self._profiles))
+
+    def get(self, profile_id: int) -> RequestProfile:
+        for profile in self._profiles:
+            if profile.id == profile_id:
+                return profile
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+
+
+def _token_matches(provided: str | None) -> bool:
+    expected = SettingsSingleton().instance.profiling_token
+    if not expected or not provided:
+        return False
+    return hmac.compare_digest(provided.encode("utf-8"), expected.encode("utf-8"))
+
+
+async def require_profiling_token(
+    x_profile: str | None = Header(default=None, alias=PROFILE_HEADER),
+) -> None:
+    if not SettingsSingleton().instance.profiling_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profiling is disabled")
+    if not _token_matches(x_profile):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid profiling token")
+
+
+def _requested_token(scope) -> str | None:
+    for name, value in scope.get("headers", ()):
+        if name == PROFILE_HEADER.encode():
+            return value.decode("latin-1")
+    return None
+
+
+class ProfilingMiddleware:
+    """Profiles requests that present the profiling token."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not _token_matches(_requested_token(scope)):
+            await self.app(scope, receive, send)
+            return
+        store = ProfileStore()
+        if store.active:
+            await self.app(scope, receive, send)
+            return
+
+        settings = SettingsSingleton().instance
+        interval = max(settings.profiling_interval_ms, 0.1) / 1000
+        profile = store.new_profile(scope["method"], scope["path"], interval)
+
+        async def send_with_profile_id(message) -> None:
+            if message["type"] == "http.response.start":
+                profile.status = message["status"]
+                message = {
+                    **message,
+                    "headers": [
+                        *message.get("headers", []),
+                        (b"x-profile-id", str(profile.id).encode()),
+                    ],
+                }
+            await send(message)
+
+        store.active = True
+        sampler = StackSampler(threading.get_ident(), interval)
+        started = perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profile.samples = sampler.stop()
+            profile.duration = perf_counter() - started
+            store.active = False
+            store.save(profile)
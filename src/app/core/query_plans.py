@@ -0,0 +1,121 @@
+"""Query-plan checks for the SELECTs a code path issues.
+
+``QueryPlanRecorder`` listens on an engine while application code runs and
+keeps every SELECT it sends. ``findings`` then replays each one through
+SQLite's ``EXPLAIN QUERY PLAN`` and reports two patterns that get slower as
+tables grow:
+
+* a full scan of a table or one of its indexes (``SCAN <table>``) in a
+  statement that filters with ``WHERE``. Reading a whole table on purpose,
+  such as listing every event, is not reported.
+* a ``USE TEMP B-TREE`` step, where the rows are sorted or grouped after
+  they are read instead of being read in index order.
+
+The test suite uses this against a scaled dataset so that a query losing its
+index fails the run (see ``tests/test_query_plans.py``). Known exceptions,
+such as substring ``ILIKE`` searches, are passed in as ``allowed``.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from typing import Any, NamedTuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# "SCAN t", "SCAN t USING INDEX i" and "SCAN t USING COVERING INDEX i" all
+# read every row; only "SEARCH" steps are bounded by the WHERE clause.
+_FULL_SCAN = re.compile(r"^SCAN (?!CONSTANT ROW|\()\w+")
+# Whole-result sorts. "RIGHT PART OF ORDER BY" only orders ties within rows
+# that already come out of an index in order, so it is not reported.
+_TEMP_BTREE = re.compile(r"^USE TEMP B-TREE FOR (?:ORDER BY|GROUP BY|DISTINCT)$")
+
+
+class RecordedQuery(NamedTuple):
+    label: str
+    statement: str
+    parameters: Any
+
+
+class PlanFinding(NamedTuple):
+    label: str
+    detail: str
+    statement: str
+
+    def __str__(self) -> str:
+        statement = " ".join(self.statement.split())
+        return f"[{self.label}] {self.detail}: {statement[:300]}"
+
+
+class QueryPlanRecorder:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+        self._label = "unlabelled"
+        self.queries: list[RecordedQuery] = []
+
+    def __enter__(self) -> QueryPlanRecorder:
+        event.listen(self._engine.sync_engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        event.remove(self._engine.sync_engine, "before_cursor_execute", self._record)
+
+    @contextmanager
+    def label(self, name: str) -> Iterator[None]:
+        """Attribute queries issued inside the block to ``name``."""
+
+        previous, self._label = self._label, name
+        try:
+            yield
+        finally:
+            self._label = previous
+
+    async def findings(self, allowed: Mapping[str, str] | None = None) -> list[PlanFinding]:
+        """Explain every recorded SELECT and return the problems.
+
+        ``allowed`` maps a label to a regex. Findings of that label whose
+        detail matches the regex are not reported.
+        """
+
+        allowed = allowed or {}
+        async with self._engine.connect() as conn:
+            plans = await conn.run_sync(self._explain_all)
+        findings: list[PlanFinding] = []
+        for query, details in zip(self.queries, plans):
+            for detail in plan_problems(details, query.statement):
+                pattern = allowed.get(query.label)
+                if pattern and re.search(pattern, detail):
+                    continue
+                findings.append(PlanFinding(query.label, detail, query.statement))
+        return findings
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if not executemany and statement.lstrip().upper().startswith("SELECT"):
+            self.queries.append(RecordedQuery(self._label, statement, parameters))
+
+    def _explain_all(self, sync_conn) -> list[list[str]]:
+        return [
+            explain_query_plan(sync_conn, query.statement, query.parameters)
+            for query in self.queries
+        ]
+
+
+def explain_query_plan(sync_conn, statement: str, parameters: Any = ()) -> list[str]:
+    """Return the ``detail`` column of SQLite's ``EXPLAIN QUERY PLAN``."""
+
+    if sync_conn.dialect.name != "sqlite":
+        raise NotImplementedError("Query plans are only checked on SQLite")
+    rows = sync_conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+    return [row[-1] for row in rows]
+
+
+def plan_problems(details: list[str], statement: str) -> list[str]:
+    filtered = re.search(r"\bWHERE\b", statement, re.IGNORECASE) is not None
+    problems: list[str] = []
+    for detail in details:
+        if _TEMP_BTREE.match(detail) or (filtered and _FULL_SCAN.match(detail)):
+            problems.append(detail)
+    return problems
@@ -0,0 +1,171 @@
+"""Per-request SQL statement counts and repeated-statement (N+1) detection.
+
+``instrument_engine`` hooks the engine's cursor events once. While a
+``track_queries`` block is active in the current context, every statement
+adds to a ``QueryStats``: the number of statements, the time spent in the
+driver, and a count per statement *shape*. A shape is the SQL text with IN
+lists collapsed, so loading related rows one parent at a time shows up as the
+same shape repeated. Outside a tracked block the hooks only read a context
+variable.
+
+Two consumers:
+
+* ``QueryStatsMiddleware`` adds ``X-DB-Queries``, ``X-DB-Time-Ms`` and
+  ``X-DB-Repeated`` headers to each response and logs repeated shapes. It is
+  enabled with ``ATHLETICS_QUERY_STATS_HEADER`` (meant for development).
+* ``query_budget`` is a test helper. It raises ``AssertionError`` when the
+  code in its block issues more statements, or repeats a shape more often,
+  than the budget allows.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# A shape issued this many times in one request is reported as a likely N+1.
+REPEAT_THRESHOLD = 3
+
+_IN_LIST = re.compile(r"\((?:\s*(?:\?|%s|\$\d+|:\w+)\s*,)+\s*(?:\?|%s|\$\d+|:\w+)\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+# Set on the statement's execution context, so a statement that raises
+# leaves nothing behind on the connection.
+_STARTED = "_query_stats_started"
+
+
+def statement_shape(statement: str) -> str:
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    return _IN_LIST.sub("(?)", shape)
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+    parent: QueryStats | None = field(default=None, repr=False)
+
+    def record(self, statement: str, duration: float) -> None:
+        shape = statement_shape(statement)
+        stats: QueryStats | None = self
+        while stats is not None:
+            stats.count += 1
+            stats.duration += duration
+            stats.shapes[shape] += 1
+            stats = stats.parent
+
+    def repeated(self, threshold: int = REPEAT_THRESHOLD) -> list[tuple[str, int]]:
+        """Shapes issued at least ``threshold`` times, most frequent first."""
+
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+    def summary(self, limit: int = 5) -> str:
+        lines = [f"{self.count} statements in {self.duration * 1000:.1f} ms"]
+        for shape, count in self.repeated(2)[:limit]:
+            lines.append(f"  {count}x {shape[:200]}")
+        return "\n".join(lines)
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect statements issued in this context (and tasks it starts).
+
+    Nested blocks also count towards the enclosing one.
+    """
+
+    stats = QueryStats(parent=_current.get())
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def query_budget(
+    max_queries: int | None = None, max_repeats: int = REPEAT_THRESHOLD - 1
+) -> Iterator[QueryStats]:
+    """Fail when the block issues more than ``max_queries`` statements or runs
+    any single statement shape more than ``max_repeats`` times."""
+
+    with track_queries() as stats:
+        yield stats
+    problems: list[str] = []
+    if max_queries is not None and stats.count > max_queries:
+        problems.append(f"expected at most {max_queries} statements, got {stats.count}")
+    for shape, count in stats.repeated(max_repeats + 1):
+        problems.append(f"statement repeated {count}x (limit {max_repeats}): {shape[:300]}")
+    if problems:
+        raise AssertionError("Query budget exceeded:\n" + "\n".join(problems))
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    sync_engine = engine.sync_engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None and _current.get() is not None:
+        setattr(context, _STARTED, perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current.get()
+    started = getattr(context, _STARTED, None)
+    if stats is None or started is None:
+        return
+    stats.record(statement, perf_counter() - started)
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware reporting each request's statements in response headers."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_stats(message) -> None:
+                if message["type"] == "http.response.start":
+                    repeated = stats.repeated()
+                    message = {
+                        **message,
+                        "headers": [
+                            *message.get("headers", []),
+                            (b"x-db-queries", str(stats.count).encode()),
+                            (b"x-db-time-ms", f"{stats.duration * 1000:.2f}".encode()),
+                            (b"x-db-repeated", str(len(repeated)).encode()),
+                        ],
+                    }
+                    if repeated:
+                        logger.warning(
+                            "Repeated SQL on %s %s: %s",
+                            scope.get("method"),
+                            scope.get("path"),
+                            stats.summary(),
+                        )
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
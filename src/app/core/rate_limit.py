@@ -0,0 +1,178 @@
+"""In-process token-bucket rate limiting and admission control.
+
+Expensive endpoints (login, federation submissions) consult the shared
+``RateLimitRegistry`` before doing any work so that a misbehaving client is
+answered with a cheap 429 instead of competing with live-result reads for CPU.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+
+from fastapi import HTTPException, Request, status
+
+from .config import Settings, SettingsSingleton
+from .singleton import ResettableSingletonMeta
+
+
+class TokenBucket:
+    __slots__ = ("capacity", "refill_per_second", "tokens", "updated_at")
+
+    def __init__(self, capacity: float, refill_per_second: float, now: float) -> None:
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self.updated_at = now
+
+    def consume(self, now: float, amount: float = 1.0) -> float:
+        """Take ``amount`` tokens, returning 0 on success or seconds until retry."""
+
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+        self.updated_at = now
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return 0.0
+        if self.refill_per_second <= 0:
+            return math.inf
+        return (amount - self.tokens) / self.refill_per_second
+
+
+class RateLimiter:
+    """Keyed token buckets with LRU eviction so memory stays bounded."""
+
+    def __init__(
+        self,
+        capacity: float,
+        per_minute: float,
+        max_keys: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._capacity = capacity
+        self._refill_per_second = per_minute / 60.0
+        self._max_keys = max_keys
+        self._clock = clock
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+
+    def hit(self, key: str) -> float:
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self._capacity, self._refill_per_second, now)
+            self._buckets[key] = bucket
+            if len(self._buckets) > self._max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket.consume(now)
+
+
+class AdmissionController:
+    """Non-blocking concurrency cap; callers that cannot enter are rejected."""
+
+    def __init__(self, limit: int) -> None:
+        self._limit = max(1, limit)
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def try_acquire(self) -> bool:
+        if self._in_flight >= self._limit:
+            return False
+        self._in_flight += 1
+        return True
+
+    def release(self) -> None:
+        self._in_flight = max(0, self._in_flight - 1)
+
+
+class RateLimitRegistry(metaclass=ResettableSingletonMeta):
+    """Named limiters and admission controllers built from ``Settings``.
+
+    Settings are read on first use rather than in ``__init__``: the singleton
+    lock is not reentrant, so constructing another singleton here could deadlock.
+    """
+
+    def __init__(self) -> None:
+        self._enabled: bool | None = None
+        self._limiters: dict[str, RateLimiter] = {}
+        self._admission: dict[str, AdmissionController] = {}
+
+    @property
+    def enabled(self) -> bool:
+        if self._enabled is None:
+            self._configure(SettingsSingleton().instance)
+        return bool(self._enabled)
+
+    def limiter(self, name: str) -> RateLimiter:
+        if self._enabled is None:
+            self._configure(SettingsSingleton().instance)
+        return self._limiters[name]
+
+    def admission(self, name: str) -> AdmissionController:
+        if self._enabled is None:
+            self._configure(SettingsSingleton().instance)
+        return self._admission[name]
+
+    def _configure(self, settings: Settings) -> None:
+        self._limiters = {
+            "login": RateLimiter(settings.login_rate_burst, settings.login_rate_per_minute),
+            "submissions": RateLimiter(
+                settings.submission_rate_burst, settings.submission_rate_per_minute
+            ),
+            "federation_submissions": RateLimiter(
+                settings.federation_submission_rate_burst,
+                settings.federation_submission_rate_per_minute,
+            ),
+        }
+        self._admission = {
+            "login": AdmissionController(settings.login_max_concurrency),
+            "submissions": AdmissionController(settings.submission_max_concurrency),
+        }
+        self._enabled = settings.rate_limit_enabled
+
+
+def client_key(request: Request) -> str:
+    return request.client.host if request.client else "anonymous"
+
+
+def enforce_rate_limit(name: str, key: str) -> None:
+    registry = RateLimitRegistry()
+    if not registry.enabled:
+        return
+    retry_after = registry.limiter(name).hit(key)
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded",
+            headers={"Retry-After": str(max(1, math.ceil(min(retry_after, 3600))))},
+        )
+
+
+def admission_control(name: str) -> Callable[[Request], AsyncIterator[None]]:
+    """Dependency that rate limits the client and caps in-flight requests for ``name``."""
+
+    async def _dependency(request: Request) -> AsyncIterator[None]:
+        registry = RateLimitRegistry()
+        if not registry.enabled:
+            yield
+            return
+        enforce_rate_limit(name, client_key(request))
+        controller = registry.admission(name)
+        if not controller.try_acquire():
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Server busy, retry shortly",
+                headers={"Retry-After": "1"},
+            )
+        try:
+            yield
+        finally:
+            controller.release()
+
+    return _dependency
@@ -0,0 +1,144 @@
+"""In-process HTTP request metrics.
+
+``MetricsMiddleware`` is a plain ASGI middleware (no extra task per request,
+unlike ``BaseHTTPMiddleware``). For every request it keeps an in-flight
+gauge, a latency histogram per route and a counter per route and status.
+Routes are labelled with their path template (``/api/v1/events/{event_id}``)
+so label cardinality stays fixed. Requests that match no route share the
+``other`` label. Per request this costs two clock reads, a couple of dict
+lookups and a bisect, so it can stay on permanently. ``GET /metrics`` renders
+the values together with database pool and message bus state.
+
+``PoolMetrics`` counts connections through pool events, which also works for
+the ``NullPool`` SQLAlchemy uses for file-backed SQLite.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.metrics import Histogram, PrometheusText
+from app.core.singleton import ResettableSingletonMeta
+
+UNMATCHED_ROUTE = "other"
+
+RouteKey = tuple[str, str]
+
+
+class RequestMetrics(metaclass=ResettableSingletonMeta):
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.latency: dict[RouteKey, Histogram] = defaultdict(Histogram)
+        self.responses: Counter[tuple[str, str, int]] = Counter()
+
+    def observe(self, method: str, route: str, status: int, seconds: float) -> None:
+        self.latency[(method, route)].observe(seconds)
+        self.responses[(method, route, status)] += 1
+
+    def write(self, output: PrometheusText) -> None:
+        output.metric("http_requests_in_flight", "gauge", "HTTP requests being served")
+        output.sample("http_requests_in_flight", self.in_flight)
+
+        output.metric("http_requests_total", "counter", "HTTP responses by route and status")
+        for (method, route, status), count in sorted(self.responses.items()):
+            output.sample(
+                "http_requests_total",
+                count,
+                {"method": method, "route": route, "status": str(status)},
+            )
+
+        output.metric(
+            "http_request_duration_seconds", "histogram", "HTTP request latency by route"
+        )
+        for (method, route), histogram in sorted(self.latency.items()):
+            output.histogram(
+                "http_request_duration_seconds",
+                histogram.buckets(),
+                histogram.sum,
+                histogram.count,
+                {"method": method, "route": route},
+            )
+
+
+class PoolMetrics(metaclass=ResettableSingletonMeta):
+    def __init__(self) -> None:
+        self.in_use = 0
+        self.opened = 0
+
+    def write(self, output: PrometheusText, pool) -> None:
+        output.metric("db_pool_connections_in_use", "gauge", "Database connections checked out")
+        output.sample("db_pool_connections_in_use", self.in_use)
+        output.metric("db_pool_connections_opened_total", "counter", "Database connections opened")
+        output.sample("db_pool_connections_opened_total", self.opened)
+        for name, attribute, help_text in _POOL_GAUGES:
+            # Only queue pools have a size; SQLite file and memory pools do not.
+            reader = getattr(pool, attribute, None)
+            if callable(reader):
+                output.metric(name, "gauge", help_text)
+                output.sample(name, reader())
+
+
+_POOL_GAUGES = (
+    ("db_pool_size", "size", "Connections the pool keeps open"),
+    ("db_pool_checked_in", "checkedin", "Idle connections in the pool"),
+    ("db_pool_overflow", "overflow", "Connections opened beyond the pool size"),
+)
+
+
+def instrument_pool(engine: AsyncEngine) -> None:
+    pool = engine.sync_engine.pool
+    if event.contains(pool, "checkout", _on_checkout):
+        return
+    event.listen(pool, "connect", _on_connect)
+    event.listen(pool, "checkout", _on_checkout)
+    event.listen(pool, "checkin", _on_checkin)
+
+
+def _on_connect(dbapi_connection, connection_record) -> None:
+    PoolMetrics().opened += 1
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    PoolMetrics().in_use += 1
+
+
+def _on_checkin(dbapi_connection, connection_record) -> None:
+    PoolMetrics().in_use -= 1
+
+
+class MetricsMiddleware:
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics()
+        status = 500
+
+        async def send_with_status(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        metrics.in_flight += 1
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            metrics.in_flight -= 1
+            # Routing stores the matched route on the shared scope.
+            route = scope.get("route")
+            metrics.observe(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                status,
+                perf_counter() - started,
+            )
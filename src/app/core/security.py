@@ -1,4 +1,10 @@
+import asyncio
+import hmac
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from hashlib import sha256
+from threading import Lock
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -22,8 +28,17 @@ optional_oauth2_scheme = OAuth2PasswordBearer(
 
 
 class PasswordHasher(metaclass=SingletonMeta):
+    """pbkdf2 hashing with awaitable wrappers that keep the event loop free.
+
+    Key derivation takes tens of milliseconds per call, so async callers should
+    use ``hash_async``/``verify_async`` which run on a bounded thread pool sized
+    by ``Settings.password_hash_workers``.
+    """
+
     def __init__(self) -> None:
         self._context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = Lock()
 
     def hash(self, password: str) -> str:
         return self._context.hash(password)
@@ -31,6 +46,32 @@ class PasswordHasher(metaclass=SingletonMeta):
     def verify(self, plain_password: str, hashed_password: str) -> bool:
         return self._context.verify(plain_password, hashed_password)
 
+    async def hash_async(self, password: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), self.hash, password)
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), self.verify, plain_password, hashed_password
+        )
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    workers = max(1, SettingsSingleton().instance.password_hash_workers)
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=workers, thread_name_prefix="password-hasher"
+                    )
+        return self._executor
+
 
 class TokenService(metaclass=SingletonMeta):
     def __init__(self) -> None:
@@ -47,6 +88,22 @@ class TokenService(metaclass=SingletonMeta):
         token = jwt.encode(to_encode, self._settings.secret_key, algorithm="HS256")
         return token, expire
 
+    def create_refresh_token(
+        self, expires_delta: timedelta | None = None
+    ) -> tuple[str, str, datetime]:
+        """Return an opaque refresh token, its storage hash and its expiry."""
+
+        token = secrets.token_urlsafe(32)
+        expire = datetime.now(tz=timezone.utc) + (
+            expires_delta or timedelta(days=self._settings.refresh_token_expire_days)
+        )
+        return token, self.hash_refresh_token(token), expire
+
+    def hash_refresh_token(self, token: str) -> str:
+        return hmac.new(
+            self._settings.secret_key.encode("utf-8"), token.encode("utf-8"), sha256
+        ).hexdigest()
+
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
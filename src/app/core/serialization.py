@@ -0,0 +1,68 @@
+"""Serialize large read models to JSON once.
+
+When a route returns a model, FastAPI validates it again against
+``response_model`` and then encodes it through ``jsonable_encoder`` into
+plain dicts before ``json.dumps``. That costs three passes over a payload the
+service has just built and validated. For large nested payloads such as
+``EventDetailRead`` and ``HomeSnapshot``, ``model_json`` writes the model
+straight to bytes with the model's pydantic-core serializer instead.
+
+A route returns ``ModelJSONResponse(model)``. FastAPI sends a returned
+``Response`` as it is, so the model is not validated again, and
+``response_model`` is still used for the OpenAPI schema. Pages that embed
+the same payload in a ``<script type="application/json">`` tag pass the bytes
+through ``embed_json`` instead of dumping the model a second time.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from markupsafe import Markup
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+# Same escapes as Jinja's ``tojson`` filter, so the payload cannot close the
+# script tag or break out of an attribute.
+_HTML_ESCAPES = (
+    (b"&", b"\\u0026"),
+    (b"<", b"\\u003c"),
+    (b">", b"\\u003e"),
+    (b"'", b"\\u0027"),
+)
+
+
+def model_json(model: BaseModel) -> bytes:
+    """JSON bytes for ``model``, matching what FastAPI would send for it."""
+
+    return model.__pydantic_serializer__.to_json(model)
+
+
+def embed_json(payload: bytes) -> Markup:
+    """Mark serialized JSON as safe to place inside an HTML ``<script>`` tag."""
+
+    for raw, escaped in _HTML_ESCAPES:
+        payload = payload.replace(raw, escaped)
+    return Markup(payload.decode("utf-8"))
+
+
+class ModelJSONResponse(Response):
+    """JSON response for a model or for bytes already produced by ``model_json``."""
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: BaseModel | bytes,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return model_json(content)
@@ -0,0 +1,135 @@
+"""Build read models from database rows without validating them again.
+
+List endpoints turn every ORM row into a read model with ``model_validate``
+or keyword construction, and each field is validated again. Rows from our
+own database already passed validation on the way in, so for large lists
+that is wasted work. ``model_construct`` does not help: in pydantic 2 it is
+slower than validating.
+
+``row_loader(Model)`` and ``row_builder(Model)`` return a constructor for a
+flat read model. It is generated once per schema and fills the instance
+``__dict__`` directly. The loader reads the model's fields as attributes of
+an ORM object, like ``model_validate`` with ``from_attributes``. The builder
+takes keyword arguments, like ``Model(...)``. Unless
+``ATHLETICS_ENVIRONMENT`` is ``production`` (or
+``ATHLETICS_VALIDATE_TRUSTED_ROWS`` says otherwise), both return the
+validating constructors instead. This way a schema and a column that
+disagree fail in development rather than passing silently in production.
+
+Only flat schemas qualify. A nested model field would receive the raw ORM
+object, and validators or serializers would be skipped, so generation
+refuses such schemas. The generated code sets pydantic's instance slots
+itself, which ties it to the pinned pydantic version;
+``tests/test_trusted_rows.py`` fails if those slots change.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import typing
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from .config import SettingsSingleton
+
+M = TypeVar("M", bound=BaseModel)
+
+_TEMPLATE = """\
+def {name}({params}):
+    instance = _new(_model)
+    _set(instance, "__dict__", {{{values}}})
+    _set(instance, "__pydantic_fields_set__", set(_fields))
+    _set(instance, "__pydantic_extra__", None)
+    _set(instance, "__pydantic_private__", None)
+    return instance
+"""
+
+
+def row_loader(model: type[M]) -> Callable[[Any], M]:
+    """Constructor reading ``model``'s fields from an object's attributes."""
+
+    if SettingsSingleton().instance.validate_trusted_rows:
+        return model.model_validate
+    return _generated_loader(model)
+
+
+def row_builder(model: type[M]) -> Callable[..., M]:
+    """Constructor taking ``model``'s fields as keyword arguments."""
+
+    if SettingsSingleton().instance.validate_trusted_rows:
+        return model
+    return _generated_builder(model)
+
+
+@lru_cache(maxsize=None)
+def _generated_loader(model: type[BaseModel]) -> Callable[[Any], BaseModel]:
+    fields = _flat_fields(model)
+    values = ", ".join(f"{name!r}: row.{name}" for name in fields)
+    return _compile(model, f"load_{model.__name__}", "row", values, {})
+
+
+@lru_cache(maxsize=None)
+def _generated_builder(model: type[BaseModel]) -> Callable[..., BaseModel]:
+    _flat_fields(model)
+    params: list[str] = []
+    namespace: dict[str, Any] = {}
+    values: list[str] = []
+    for name, info in model.model_fields.items():
+        if info.is_required():
+            params.append(name)
+            values.append(f"{name!r}: {name}")
+        elif info.default_factory is None and info.default is None:
+            params.append(f"{name}=None")
+            values.append(f"{name!r}: {name}")
+        else:
+            # Defaults are produced per instance, as pydantic does.
+            namespace[f"_field_{name}"] = info
+            params.append(f"{name}=_unset")
+            values.append(
+                f"{name!r}: _field_{name}.get_default(call_default_factory=True) "
+                f"if {name} is _unset else {name}"
+            )
+    return _compile(
+        model, f"build_{model.__name__}", "*, " + ", ".join(params), ", ".join(values), namespace
+    )
+
+
+def _compile(
+    model: type[BaseModel], name: str, params: str, values: str, namespace: dict[str, Any]
+) -> Callable[..., BaseModel]:
+    namespace.update(
+        _model=model,
+        _fields=frozenset(model.model_fields),
+        _new=object.__new__,
+        _set=object.__setattr__,
+        _unset=object(),
+    )
+    exec(_TEMPLATE.format(name=name, params=params, values=values), namespace)
+    function = namespace[name]
+    function.__qualname__ = name
+    return function
+
+
+def _flat_fields(model: type[BaseModel]) -> tuple[str, ...]:
+    if model.__pydantic_post_init__ is not None or model.__private_attributes__:
+        raise TypeError(f"{model.__name__} has post-init logic or private attributes")
+    decorators = model.__pydantic_decorators__
+    if any(getattr(decorators, info.name) for info in dataclasses.fields(decorators)):
+        raise TypeError(f"{model.__name__} has validators or serializers")
+    if model.model_config.get("extra") == "allow":
+        raise TypeError(f"{model.__name__} accepts extra fields")
+    for name, info in model.model_fields.items():
+        if info.alias is not None and info.alias != name:
+            raise TypeError(f"{model.__name__}.{name} has an alias")
+        if _contains_model(info.annotation):
+            raise TypeError(f"{model.__name__}.{name} holds a nested model")
+    return tuple(model.model_fields)
+
+
+def _contains_model(annotation: Any) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_contains_model(arg) for arg in typing.get_args(annotation))
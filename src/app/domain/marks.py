@@ -0,0 +1,121 @@
+"""Canonical numeric marks for free-text results.
+
+``EventEntry.result`` keeps what the federation published ("10.52",
+"11.32s", "2:03.45", "6.48m (+1.2)", "7250 pts", "DNF"). ``parse_marks``
+turns whole columns of those strings into a ``Mark``: a value in seconds,
+metres or points plus its unit, which also fixes the ordering direction
+(``lower_is_better``). Marks are stored next to the text so rankings are an
+indexed ``ORDER BY mark_value`` instead of a Python sort over parsed strings.
+
+A single regex pass splits each string into its clock parts, which are then
+combined into one number. Bare numbers take their unit from the discipline
+name (field events are metres, combined events points, everything else
+seconds). Unparseable results (DNF, DQ, NM, ...) have no mark.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import NamedTuple
+
+from app.models.event import MarkUnit
+
+
+class Mark(NamedTuple):
+    value: float
+    unit: MarkUnit
+
+
+FIELD_KEYWORDS = ("jump", "vault", "put", "throw", "discus", "javelin", "hammer", "weight")
+COMBINED_KEYWORDS = ("athlon",)
+
+# Optional h: and m: clock parts, the number (decimal point or comma), then an
+# optional unit. Anything after that (wind readings, "PB", "Q", "w") is ignored.
+_MARK_PATTERN = re.compile(
+    r"\s*(?:(?P<hours>\d+):(?=\d+:))?(?:(?P<minutes>\d+):)?(?P<number>\d++(?:[.,]\d++)?+)"
+    r"(?:\s*(?P<unit>s|sec|secs|m|pts|pt|points)(?![a-z]))?",
+    re.IGNORECASE,
+)
+_EXPLICIT_UNITS = {
+    "s": MarkUnit.SECONDS,
+    "sec": MarkUnit.SECONDS,
+    "secs": MarkUnit.SECONDS,
+    "m": MarkUnit.METRES,
+    "pts": MarkUnit.POINTS,
+    "pt": MarkUnit.POINTS,
+    "points": MarkUnit.POINTS,
+}
+
+
+def lower_is_better(unit: MarkUnit) -> bool:
+    """Times rank ascending; distances and points rank descending."""
+
+    return unit == MarkUnit.SECONDS
+
+
+@lru_cache(maxsize=1024)
+def discipline_unit(discipline: str | None) -> MarkUnit | None:
+    """Unit implied by a discipline name for results given as bare numbers."""
+
+    if not discipline:
+        return None
+    name = discipline.lower()
+    if any(keyword in name for keyword in COMBINED_KEYWORDS):
+        return MarkUnit.POINTS
+    if any(keyword in name for keyword in FIELD_KEYWORDS):
+        return MarkUnit.METRES
+    return MarkUnit.SECONDS
+
+
+def parse_mark(result: str | None, discipline: str | None) -> Mark | None:
+    return parse_marks([result], discipline)[0]
+
+
+def parse_marks(
+    results: Sequence[str | None], disciplines: Sequence[str | None] | str | None
+) -> list[Mark | None]:
+    """Parse ``results`` in bulk.
+
+    ``disciplines`` is either one discipline name for the whole column or a
+    name per result.
+    """
+
+    if disciplines is None or isinstance(disciplines, str):
+        disciplines = [disciplines] * len(results)
+    indexes: list[int] = []
+    hours: list[str] = []
+    minutes: list[str] = []
+    numbers: list[str] = []
+    units: list[MarkUnit] = []
+    for index, (text, discipline) in enumerate(zip(results, disciplines)):
+        match = _MARK_PATTERN.match(text) if text else None
+        if match is None:
+            continue
+        explicit = match["unit"]
+        if match["minutes"] is not None:
+            unit = MarkUnit.SECONDS
+        elif explicit:
+            unit = _EXPLICIT_UNITS[explicit.lower()]
+        else:
+            unit = discipline_unit(discipline)
+            if unit is None:
+                continue
+        indexes.append(index)
+        hours.append(match["hours"] or "0")
+        minutes.append(match["minutes"] or "0")
+        numbers.append(match["number"].replace(",", "."))
+        units.append(unit)
+
+    marks: list[Mark | None] = [None] * len(results)
+    for index, value, unit in zip(indexes, _combine(hours, minutes, numbers), units):
+        marks[index] = Mark(value, unit)
+    return marks
+
+
+def _combine(hours: list[str], minutes: list[str], numbers: list[str]) -> list[float]:
+    return [
+        round(int(hour) * 3600 + int(minute) * 60 + float(number), 3)
+        for hour, minute, number in zip(hours, minutes, numbers)
+    ]
@@ -0,0 +1,538 @@
+"""Incremental parsing and normalization of federation results files.
+
+Payloads arrive as byte chunks (see ``app.integrations.payload_sources``) and
+are cut into record-aligned blocks by ``iter_blocks`` on the event loop, which
+only scans for line breaks. Each block becomes a ``BlockJob``: a picklable
+function plus arguments that decodes, parses and normalizes the block into a
+compact ``ParsedBlock``, so the CPU-bound work can run in a process pool.
+Accepted formats:
+
+* CSV with a header row (RFC 4180 quoting, UTF-8 with optional BOM).
+* JSON Lines (one object per line), split into blocks like CSV.
+* A JSON array of objects. Arrays cannot be split without parsing them, so
+  they are decoded incrementally on the loop and only normalization is
+  shipped out in batches of ``JSON_RECORDS_PER_BLOCK``.
+
+``normalize_record`` maps a raw record onto ``ResultRow`` and raises
+``RowValidationError`` with a readable message for bad rows.
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import io
+import json
+from hashlib import blake2b
+from collections.abc import AsyncIterator, Callable, Mapping
+from datetime import date
+from typing import Any, NamedTuple
+
+from app.domain.marks import parse_marks
+from app.models.event import EventEntryStatus, MarkUnit
+
+PARSE_BLOCK_BYTES = 512 * 1024
+JSON_RECORDS_PER_BLOCK = 2000
+# Row errors returned per block; the rejected count stays exact.
+MAX_BLOCK_ERRORS = 10
+# Longest single JSON record accepted before the payload is declared malformed.
+MAX_JSON_RECORD_CHARS = 1_000_000
+# A CSV or JSON Lines record may span at most four blocks, and never less
+# than this, before the payload is declared malformed.
+MIN_LINE_RECORD_LIMIT = 64 * 1024
+
+COLUMN_ALIASES = {
+    "event": "event",
+    "event_name": "event",
+    "event_date": "event_date",
+    "date": "event_date",
+    "event_end_date": "event_end_date",
+    "location": "location",
+    "discipline": "discipline",
+    "category": "category",
+    "round": "round",
+    "round_name": "round",
+    "athlete": "athlete_name",
+    "athlete_name": "athlete_name",
+    "team": "team_name",
+    "team_name": "team_name",
+    "club": "team_name",
+    "bib": "bib",
+    "lane": "lane",
+    "position": "position",
+    "place": "position",
+    "result": "result",
+    "mark": "result",
+    "points": "points",
+    "status": "status",
+    "notes": "notes",
+}
+
+
+class RowValidationError(ValueError):
+    """A single results row could not be normalized."""
+
+
+class PayloadFormatError(ValueError):
+    """The payload as a whole is not a supported results file."""
+
+
+class ResultRow(NamedTuple):
+    event: str
+    event_date: date
+    event_end_date: date
+    location: str
+    discipline: str
+    category: str | None
+    round_name: str | None
+    athlete_name: str
+    team_name: str | None
+    bib: str | None
+    lane: str | None
+    position: int | None
+    result: str | None
+    points: int | None
+    status: EventEntryStatus
+    notes: str | None
+    mark_value: float | None = None
+    mark_unit: MarkUnit | None = None
+
+
+class ParsedRow(NamedTuple):
+    line_number: int
+    row: ResultRow
+    fingerprint: str
+
+
+class ParsedBlock(NamedTuple):
+    records: int
+    rows: list[ParsedRow]
+    rejected: int
+    errors: list[tuple[int, str]]
+
+
+BlockJob = tuple[Callable[..., ParsedBlock], tuple[Any, ...]]
+
+
+def detect_format(url: str, first_chunk: bytes) -> str:
+    path = url.split("?", 1)[0].lower()
+    if path.endswith(".csv"):
+        return "csv"
+    if path.endswith((".json", ".jsonl", ".ndjson")):
+        return "json"
+    head = first_chunk.lstrip(codecs.BOM_UTF8).lstrip()
+    if head[:1] in (b"[", b"{"):
+        return "json"
+    raise PayloadFormatError("Payload must be a CSV or JSON results file")
+
+
+async def iter_blocks(
+    url: str, chunks: AsyncIterator[bytes], block_bytes: int = PARSE_BLOCK_BYTES
+) -> AsyncIterator[BlockJob]:
+    """Yield parse jobs for ``chunks`` in payload order."""
+
+    first = await anext(chunks, b"")
+    if first.startswith(codecs.BOM_UTF8):
+        first = first[len(codecs.BOM_UTF8) :]
+    fmt = detect_format(url, first)
+    if fmt == "json":
+        while first and not first.strip():
+            first = await anext(chunks, b"")
+        if first.lstrip()[:1] == b"[":
+            async for job in _json_array_blocks(_prepend(first, chunks)):
+                yield job
+            return
+        async for job in _line_blocks(_prepend(first, chunks), block_bytes, None):
+            yield job
+        return
+    async for job in _line_blocks(_prepend(first, chunks), block_bytes, []):
+        yield job
+
+
+async def _prepend(first: bytes, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    if first:
+        yield first
+    async for chunk in chunks:
+        yield chunk
+
+
+async def _line_blocks(
+    chunks: AsyncIterator[bytes], block_bytes: int, header: list[str] | None
+) -> AsyncIterator[BlockJob]:
+    """Cut CSV (``header`` is a list) or JSON Lines (``header`` is None) into blocks.
+
+    A record that has not ended after ``4 * block_bytes`` (usually an
+    unterminated quote) fails the payload rather than buffering it whole.
+    """
+
+    csv_mode = header is not None
+    limit = max(4 * block_bytes, MIN_LINE_RECORD_LIMIT)
+    buffer = bytearray()
+    line = 1
+    async for chunk in chunks:
+        buffer += chunk
+        if csv_mode and not header:
+            line = _take_header(buffer, header, line)
+            if not header:
+                _check_pending(buffer, limit, line)
+                continue
+        if len(buffer) < block_bytes:
+            continue
+        cut = _last_record_end(buffer, csv_mode)
+        if cut:
+            data = bytes(buffer[:cut])
+            del buffer[:cut]
+            yield _block_job(header, data, line)
+            line += data.count(b"\n")
+        _check_pending(buffer, limit, line)
+    if csv_mode and not header:
+        line = _take_header(buffer, header, line, final=True)
+        if not header:
+            raise PayloadFormatError("CSV payload has no header row")
+    if csv_mode and buffer.count(b'"') % 2:
+        raise PayloadFormatError(f"line {line}: unterminated quoted field")
+    if buffer.strip():
+        yield _block_job(header, bytes(buffer), line)
+
+
+def _check_pending(buffer: bytearray, limit: int, line: int) -> None:
+    if len(buffer) > limit:
+        raise PayloadFormatError(f"line {line}: record too long or unterminated quoted field")
+
+
+def _block_job(header: list[str] | None, data: bytes, line: int) -> BlockJob:
+    if header is None:
+        return parse_json_lines_block, (data, line)
+    return parse_csv_block, (tuple(header), data, line)
+
+
+def _take_header(buffer: bytearray, header: list[str], line: int, final: bool = False) -> int:
+    """Move the first non-blank CSV record out of ``buffer`` into ``header``."""
+
+    while True:
+        end = _first_record_end(buffer)
+        if end is None:
+            if not final or not buffer.strip():
+                return line
+            end = len(buffer)
+        record = bytes(buffer[:end])
+        del buffer[:end]
+        line += record.count(b"\n")
+        try:
+            fields = next(csv.reader(io.StringIO(record.decode("utf-8"), newline="")), [])
+        except (csv.Error, UnicodeDecodeError) as exc:
+            raise PayloadFormatError(f"Unreadable CSV header: {exc}") from exc
+        if any(field.strip() for field in fields):
+            header.extend(field.strip().lower() for field in fields)
+            return line
+
+
+def _first_record_end(buffer: bytearray) -> int | None:
+    position = buffer.find(b"\n")
+    while position != -1:
+        if buffer.count(b'"', 0, position + 1) % 2 == 0:
+            return position + 1
+        position = buffer.find(b"\n", position + 1)
+    return None
+
+
+def _last_record_end(buffer: bytearray, csv_mode: bool) -> int:
+    # A CSV record may span lines inside quotes; a line break ends a record
+    # only when the quotes before it are balanced (escaped quotes are doubled
+    # and keep the parity). JSON Lines never contain raw line breaks in values.
+    position = buffer.rfind(b"\n")
+    if not csv_mode:
+        return position + 1
+    # Count the quotes once and step back through them, so a long run of
+    # lines inside an open quote is scanned once rather than once per line.
+    quotes = buffer.count(b'"', 0, position + 1)
+    while position != -1:
+        if quotes % 2 == 0:
+            return position + 1
+        previous = buffer.rfind(b"\n", 0, position)
+        quotes -= buffer.count(b'"', previous + 1, position + 1)
+        position = previous
+    return 0
+
+
+def parse_csv_block(header: tuple[str, ...], data: bytes, first_line: int) -> ParsedBlock:
+    block = _BlockBuilder()
+    reader = csv.reader(io.StringIO(_decode_block(data, first_line), newline=""))
+    consumed = 0
+    while True:
+        try:
+            fields = next(reader)
+        except StopIteration:
+            break
+        except csv.Error as exc:
+            raise PayloadFormatError(f"line {first_line + consumed}: {exc}") from exc
+        line_number, consumed = first_line + consumed, reader.line_num
+        if any(field.strip() for field in fields):
+            block.add(line_number, dict(zip(header, fields)))
+    return block.build()
+
+
+def parse_json_lines_block(data: bytes, first_line: int) -> ParsedBlock:
+    block = _BlockBuilder()
+    for offset, text in enumerate(_decode_block(data, first_line).split("\n")):
+        if not text.strip():
+            continue
+        line_number = first_line + offset
+        try:
+            record = json.loads(text)
+        except ValueError:
+            block.reject(line_number, "malformed JSON")
+            continue
+        block.add(line_number, record)
+    return block.build()
+
+
+def normalize_records(records: list[tuple[int, Any]]) -> ParsedBlock:
+    block = _BlockBuilder()
+    for line_number, record in records:
+        block.add(line_number, record)
+    return block.build()
+
+
+class _BlockBuilder:
+    def __init__(self) -> None:
+        self.records = 0
+        self.rows: list[ParsedRow] = []
+        self.rejected = 0
+        self.errors: list[tuple[int, str]] = []
+
+    def add(self, line_number: int, record: Any) -> None:
+        if not isinstance(record, Mapping):
+            self.reject(line_number, "expected a JSON object")
+            return
+        try:
+            row = normalize_record(record)
+        except RowValidationError as exc:
+            self.reject(line_number, str(exc))
+            return
+        self.records += 1
+        self.rows.append(ParsedRow(line_number, row, row_fingerprint(row)))
+
+    def reject(self, line_number: int, message: str) -> None:
+        self.records += 1
+        self.rejected += 1
+        if len(self.errors) < MAX_BLOCK_ERRORS:
+            self.errors.append((line_number, message))
+
+    def build(self) -> ParsedBlock:
+        # Marks are parsed for the whole block at once; they derive from
+        # ``result`` so the row fingerprint does not need to cover them.
+        marks = parse_marks(
+            [parsed.row.result for parsed in self.rows],
+            [parsed.row.discipline for parsed in self.rows],
+        )
+        rows = [
+            parsed._replace(row=parsed.row._replace(mark_value=mark.value, mark_unit=mark.unit))
+            if mark is not None
+            else parsed
+            for parsed, mark in zip(self.rows, marks)
+        ]
+        return ParsedBlock(self.records, rows, self.rejected, self.errors)
+
+
+def _decode_block(data: bytes, first_line: int) -> str:
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        line = first_line + data.count(b"\n", 0, exc.start)
+        raise PayloadFormatError(f"line {line}: payload is not valid UTF-8") from exc
+
+
+async def _json_array_blocks(chunks: AsyncIterator[bytes]) -> AsyncIterator[BlockJob]:
+    batch: list[tuple[int, Any]] = []
+    async for index, record in _iter_json_array(_decode(chunks)):
+        batch.append((index, record))
+        if len(batch) >= JSON_RECORDS_PER_BLOCK:
+            yield normalize_records, (batch,)
+            batch = []
+    if batch:
+        yield normalize_records, (batch,)
+
+
+async def _decode(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        async for chunk in chunks:
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        tail = decoder.decode(b"", final=True)
+    except UnicodeDecodeError as exc:
+        raise PayloadFormatError("Payload is not valid UTF-8") from exc
+    if tail:
+        yield tail
+
+
+async def _iter_json_array(text: AsyncIterator[str]) -> AsyncIterator[tuple[int, Any]]:
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    opened = False
+    index = 0
+    finished = False
+    async for piece in text:
+        buffer = buffer[position:] + piece
+        position = 0
+        while not finished:
+            position = _skip_separators(buffer, position, opened)
+            if position >= len(buffer):
+                break
+            if not opened:
+                opened = True
+                position += 1
+                continue
+            if buffer[position] == "]":
+                finished = True
+                position += 1
+                break
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # Either the value continues in the next chunk or it is
+                # malformed; the trailing check below tells them apart.
+                if len(buffer) - position > MAX_JSON_RECORD_CHARS:
+                    raise PayloadFormatError(f"record {index + 1}: malformed JSON") from None
+                break
+            index += 1
+            position = end
+            yield index, value
+    if buffer[position:].strip():
+        raise PayloadFormatError(f"record {index + 1}: malformed JSON")
+    if not finished:
+        raise PayloadFormatError("JSON array is not terminated")
+
+
+def _skip_separators(buffer: str, position: int, opened: bool) -> int:
+    separators = " \t\r\n," if opened else " \t\r\n"
+    while position < len(buffer) and buffer[position] in separators:
+        position += 1
+    return position
+
+
+def normalize_record(record: Mapping[str, Any]) -> ResultRow:
+    values: dict[str, Any] = {}
+    for key, value in record.items():
+        column = COLUMN_ALIASES.get(str(key).strip().lower())
+        if column is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+        values[column] = None if value in ("", None) else value
+
+    event = _required_text(values, "event", 120)
+    event_date = _parse_date(values, "event_date", required=True)
+    event_end_date = _parse_date(values, "event_end_date") or event_date
+    if event_end_date < event_date:
+        raise RowValidationError("event_end_date is before event_date")
+    result = _optional_text(values, "result", 60)
+    status = _parse_status(values.get("status"), has_result=result is not None)
+
+    return ResultRow(
+        event=event,
+        event_date=event_date,
+        event_end_date=event_end_date,
+        location=_optional_text(values, "location", 120) or "",
+        discipline=_required_text(values, "discipline", 120),
+        category=_optional_text(values, "category", 60),
+        round_name=_optional_text(values, "round", 80),
+        athlete_name=_required_text(values, "athlete_name", 120),
+        team_name=_optional_text(values, "team_name", 120),
+        bib=_optional_text(values, "bib", 20),
+        lane=_optional_text(values, "lane", 12),
+        position=_parse_int(values, "position", minimum=1),
+        result=result,
+        points=_parse_int(values, "points", minimum=0),
+        status=status,
+        notes=_optional_text(values, "notes", 1000),
+    )
+
+
+def row_fingerprint(row: ResultRow) -> str:
+    """Digest of the entry values a row sets, used to skip unchanged rows on re-import."""
+
+    values = (
+        row.athlete_name,
+        row.team_name,
+        row.bib,
+        row.lane,
+        row.status.value,
+        row.position,
+        row.result,
+        row.points,
+        row.notes,
+    )
+    return blake2b(repr(values).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _optional_text(values: dict[str, Any], column: str, max_length: int) -> str | None:
+    value = values.get(column)
+    if value is None:
+        return None
+    text = str(value)
+    if len(text) > max_length:
+        raise RowValidationError(f"{column} is longer than {max_length} characters")
+    return text
+
+
+def _required_text(values: dict[str, Any], column: str, max_length: int) -> str:
+    text = _optional_text(values, column, max_length)
+    if text is None:
+        raise RowValidationError(f"{column} is required")
+    return text
+
+
+def _parse_date(values: dict[str, Any], column: str, *, required: bool = False) -> date | None:
+    value = values.get(column)
+    if value is None:
+        if required:
+            raise RowValidationError(f"{column} is required")
+        return None
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError as exc:
+        raise RowValidationError(f"{column} must be an ISO date (YYYY-MM-DD)") from exc
+
+
+def _parse_int(values: dict[str, Any], column: str, *, minimum: int) -> int | None:
+    value = values.get(column)
+    if value is None:
+        return None
+    try:
+        number = int(str(value))
+    except ValueError as exc:
+        raise RowValidationError(f"{column} must be a whole number") from exc
+    if number < minimum:
+        raise RowValidationError(f"{column} must be at least {minimum}")
+    return number
+
+
+def _parse_status(value: Any, *, has_result: bool) -> EventEntryStatus:
+    if value is None:
+        return EventEntryStatus.FINISHED if has_result else EventEntryStatus.SCHEDULED
+    try:
+        return EventEntryStatus(str(value).lower())
+    except ValueError as exc:
+        allowed = ", ".join(status.value for status in EventEntryStatus)
+        raise RowValidationError(f"status must be one of: {allowed}") from exc
+
+
+__all__ = [
+    "BlockJob",
+    "ParsedBlock",
+    "ParsedRow",
+    "PayloadFormatError",
+    "ResultRow",
+    "RowValidationError",
+    "detect_format",
+    "iter_blocks",
+    "normalize_record",
+    "normalize_records",
+    "parse_csv_block",
+    "parse_json_lines_block",
+    "row_fingerprint",
+]
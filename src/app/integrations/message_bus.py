@@ -1,36 +1,461 @@
 import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from typing import Any
 
+from app.core.config import Settings, SettingsSingleton
+from app.core.metrics import Histogram
 from app.core.singleton import SingletonMeta
 
 
 Subscriber = Callable[[Any], Awaitable[None]]
+BatchSubscriber = Callable[[list[Any]], Awaitable[None]]
 
+logger = logging.getLogger(__name__)
 
-class MessageBus(metaclass=SingletonMeta):
-    def __init__(self) -> None:
-        self._queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
+
+class MessageBusBackpressureError(RuntimeError):
+    """Raised when a topic queue stays full for longer than the publish timeout."""
+
+
+@dataclass
+class TopicMetrics:
+    """Counters and latency histograms collected for a single topic."""
+
+    published: int = 0
+    rejected: int = 0
+    delivered: int = 0
+    failed: int = 0
+    dead_lettered: int = 0
+    worker_restarts: int = 0
+    last_wait_seconds: float = 0.0
+    wait_seconds: Histogram = field(default_factory=Histogram)
+    handler_seconds: dict[str, Histogram] = field(
+        default_factory=lambda: defaultdict(Histogram)
+    )
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "published": self.published,
+            "rejected": self.rejected,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "dead_lettered": self.dead_lettered,
+            "worker_restarts": self.worker_restarts,
+            "last_wait_seconds": self.last_wait_seconds,
+            "wait_seconds": self.wait_seconds.snapshot(),
+            "handler_seconds": {
+                name: histogram.snapshot() for name, histogram in self.handler_seconds.items()
+            },
+        }
+
+
+@dataclass
+class _TopicLane:
+    queue: asyncio.Queue
+    workers: int
+    tasks: list[asyncio.Task] = field(default_factory=list)
+
+
+class BaseMessageBus(ABC):
+    """Subscription, per-topic option and metrics bookkeeping shared by backends.
+
+    Options left as ``None`` fall back to ``Settings`` on first use. Worker
+    tasks run under ``_supervise`` so an unexpected error restarts the worker
+    after ``restart_delay`` seconds instead of silently shrinking the pool.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_queue_size: int | None = None,
+        publish_timeout: float | None = None,
+        restart_delay: float = 1.0,
+    ) -> None:
+        self._workers = workers
+        self._max_queue_size = max_queue_size
+        self._publish_timeout = publish_timeout
+        self._restart_delay = restart_delay
+        self._metrics: dict[str, TopicMetrics] = defaultdict(TopicMetrics)
         self._subscribers: dict[str, list[Subscriber]] = defaultdict(list)
-        self._worker_task: asyncio.Task | None = None
+        self._batch_subscribers: dict[str, list[BatchSubscriber]] = defaultdict(list)
+        self._batch_options: dict[str, tuple[int, float]] = {}
+        self._topic_options: dict[str, tuple[int | None, int | None]] = {}
 
-    async def start(self) -> None:
-        if self._worker_task is None:
-            self._worker_task = asyncio.create_task(self._worker())
+    def configure_topic(
+        self, topic: str, *, workers: int | None = None, max_queue_size: int | None = None
+    ) -> None:
+        """Override concurrency or queue size for ``topic`` before it starts."""
 
-    async def publish(self, topic: str, payload: Any) -> None:
-        await self._queue.put((topic, payload))
-        if self._worker_task is None:
-            await self.start()
+        self._topic_options[topic] = (workers, max_queue_size)
+
+    def topic_workers(self, topic: str) -> int:
+        return self._resolve_options(topic)[0]
 
     def subscribe(self, topic: str, handler: Subscriber) -> None:
         self._subscribers[topic].append(handler)
 
-    async def _worker(self) -> None:
+    def subscribe_batch(
+        self,
+        topic: str,
+        handler: BatchSubscriber,
+        *,
+        max_batch_size: int = 50,
+        max_wait_ms: float = 50,
+    ) -> None:
+        """Deliver up to ``max_batch_size`` payloads, or whatever arrived within
+        ``max_wait_ms`` of the first one, to ``handler`` in a single call.
+
+        Plain subscribers on the same topic still receive payloads one by one.
+        """
+
+        options = (max(1, max_batch_size), max(0.0, max_wait_ms))
+        existing = self._batch_options.get(topic)
+        if existing is not None and existing != options:
+            raise ValueError(f"Topic '{topic}' already batches with {existing}")
+        self._batch_options[topic] = options
+        self._batch_subscribers[topic].append(handler)
+
+    def metrics(self, topic: str) -> TopicMetrics:
+        return self._metrics[topic]
+
+    @abstractmethod
+    async def queue_depth(self, topic: str) -> int:
+        """Payloads published to ``topic`` and not yet handled."""
+
+    async def stats(self) -> dict[str, dict[str, Any]]:
+        """Snapshot of every known topic: options, queue depth and metrics."""
+
+        topics = sorted({*self._topics(), *self._metrics})
+        snapshot: dict[str, dict[str, Any]] = {}
+        for topic in topics:
+            workers, max_queue_size = self._resolve_options(topic)
+            snapshot[topic] = {
+                "workers": workers,
+                "max_queue_size": max_queue_size,
+                "queue_depth": await self.queue_depth(topic),
+                "batch": self._batch_options.get(topic),
+                **self._metrics[topic].snapshot(),
+            }
+        return snapshot
+
+    def _has_subscribers(self, topic: str) -> bool:
+        return bool(self._subscribers.get(topic) or self._batch_subscribers.get(topic))
+
+    def _topics(self) -> list[str]:
+        return list({*self._subscribers, *self._batch_subscribers})
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Start consuming every subscribed topic."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop the consumers started by ``start``."""
+
+    @abstractmethod
+    async def join(self) -> None:
+        """Wait until every published payload has been handled."""
+
+    @abstractmethod
+    async def publish(self, topic: str, payload: Any) -> None:
+        """Queue ``payload`` for the subscribers of ``topic``."""
+
+    async def _dispatch(self, topic: str, payloads: list[Any]) -> set[int]:
+        """Run every handler and return the indexes of payloads a handler failed on."""
+
+        metrics = self._metrics[topic]
+        failed: set[int] = set()
+        for handler in list(self._subscribers.get(topic, [])):
+            for index, payload in enumerate(payloads):
+                if not await self._call(topic, metrics, handler, payload):
+                    failed.add(index)
+        for batch_handler in list(self._batch_subscribers.get(topic, [])):
+            if not await self._call(topic, metrics, batch_handler, list(payloads)):
+                failed.update(range(len(payloads)))
+        metrics.delivered += len(payloads)
+        return failed
+
+    async def _call(
+        self, topic: str, metrics: TopicMetrics, handler: Callable[[Any], Awaitable[None]], arg: Any
+    ) -> bool:
+        started = time.perf_counter()
+        try:
+            await handler(arg)
+            return True
+        except Exception:
+            metrics.failed += 1
+            logger.exception("Handler %r failed for topic %s", handler, topic)
+            return False
+        finally:
+            metrics.handler_seconds[_handler_name(handler)].observe(
+                time.perf_counter() - started
+            )
+
+    def _record_wait(self, topic: str, seconds: float) -> None:
+        metrics = self._metrics[topic]
+        metrics.last_wait_seconds = max(0.0, seconds)
+        metrics.wait_seconds.observe(metrics.last_wait_seconds)
+
+    async def _supervise(self, topic: str, worker: Callable[[], Awaitable[None]]) -> None:
+        """Run ``worker`` forever, restarting it when it raises."""
+
         while True:
-            topic, payload = await self._queue.get()
-            handlers = self._subscribers.get(topic, [])
-            for handler in handlers:
-                await handler(payload)
-            self._queue.task_done()
+            try:
+                await worker()
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._metrics[topic].worker_restarts += 1
+                logger.exception(
+                    "Worker for topic %s crashed; restarting in %.1fs", topic, self._restart_delay
+                )
+                await asyncio.sleep(self._restart_delay)
+
+    def _resolve_options(self, topic: str) -> tuple[int, int]:
+        workers, max_queue_size = self._topic_options.get(topic, (None, None))
+        workers = workers or self._workers
+        max_queue_size = max_queue_size or self._max_queue_size
+        if workers is None or max_queue_size is None:
+            settings = SettingsSingleton().instance
+            workers = workers or settings.message_bus_workers
+            max_queue_size = max_queue_size or settings.message_bus_queue_size
+        return max(1, workers), max(1, max_queue_size)
+
+    def _resolve_publish_timeout(self) -> float:
+        if self._publish_timeout is None:
+            self._publish_timeout = (
+                SettingsSingleton().instance.message_bus_publish_timeout_seconds
+            )
+        return self._publish_timeout
+
+
+class InMemoryMessageBus(BaseMessageBus):
+    """In-process pub/sub with a bounded queue and worker pool per topic.
+
+    Each topic is served by its own lane so a slow handler on one topic cannot
+    stall the others. ``workers`` bounds how many payloads of a topic are
+    handled concurrently, and publishers wait at most ``publish_timeout``
+    seconds for room in a full queue before ``MessageBusBackpressureError``.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_queue_size: int | None = None,
+        publish_timeout: float | None = None,
+        restart_delay: float = 1.0,
+    ) -> None:
+        super().__init__(workers, max_queue_size, publish_timeout, restart_delay)
+        self._lanes: dict[str, _TopicLane] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def start(self) -> None:
+        for topic in self._topics():
+            self._lane(topic)
+
+    async def stop(self) -> None:
+        lanes, self._lanes = list(self._lanes.values()), {}
+        tasks = [task for lane in lanes for task in lane.tasks]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def join(self) -> None:
+        """Wait until every queued payload has been handled."""
+
+        for lane in list(self._lanes.values()):
+            await lane.queue.join()
+
+    async def queue_depth(self, topic: str) -> int:
+        lane = self._lanes.get(topic)
+        return lane.queue.qsize() if lane is not None else 0
+
+    async def publish(self, topic: str, payload: Any) -> None:
+        queue = self._lane(topic).queue
+        metrics = self._metrics[topic]
+        if not queue.full():
+            queue.put_nowait((time.monotonic(), payload))
+            metrics.published += 1
+            return
+        timeout = self._resolve_publish_timeout()
+        if timeout <= 0:
+            metrics.rejected += 1
+            raise MessageBusBackpressureError(f"Queue for '{topic}' is full")
+        try:
+            await asyncio.wait_for(queue.put((time.monotonic(), payload)), timeout=timeout)
+        except asyncio.TimeoutError as exc:
+            metrics.rejected += 1
+            raise MessageBusBackpressureError(
+                f"Queue for '{topic}' stayed full for {timeout:.1f}s"
+            ) from exc
+        metrics.published += 1
+
+    def _lane(self, topic: str) -> _TopicLane:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Queues and worker tasks are bound to the loop that created them;
+            # cancel the old loop's workers before starting fresh lanes.
+            self._cancel_lanes()
+            self._loop = loop
+        lane = self._lanes.get(topic)
+        if lane is None:
+            workers, max_queue_size = self._resolve_options(topic)
+            lane = _TopicLane(queue=asyncio.Queue(maxsize=max_queue_size), workers=workers)
+            lane.tasks = [
+                loop.create_task(
+                    self._supervise(topic, lambda queue=lane.queue: self._worker(topic, queue))
+                )
+                for _ in range(workers)
+            ]
+            self._lanes[topic] = lane
+        return lane
+
+    def _cancel_lanes(self) -> None:
+        lanes, self._lanes = list(self._lanes.values()), {}
+        for lane in lanes:
+            for task in lane.tasks:
+                if task.done():
+                    continue
+                try:
+                    task.cancel()
+                except RuntimeError:
+                    # The owning loop is already closed, so the task can never run again.
+                    logger.debug("Discarding worker for a closed event loop")
+
+    async def _worker(self, topic: str, queue: asyncio.Queue) -> None:
+        while True:
+            entries = [await queue.get()]
+            dispatching = False
+            try:
+                self._record_wait(topic, time.monotonic() - entries[0][0])
+                batch_options = self._batch_options.get(topic)
+                if batch_options is not None:
+                    await self._fill_batch(topic, queue, entries, *batch_options)
+                dispatching = True
+                await self._dispatch(topic, [payload for _, payload in entries])
+            except Exception:
+                # The worker is about to crash; hand back what it dequeued so
+                # the restarted worker sees it, unless handlers already ran.
+                self._salvage(topic, queue, entries, handled=dispatching)
+                raise
+            finally:
+                for _ in entries:
+                    queue.task_done()
+
+    def _salvage(
+        self, topic: str, queue: asyncio.Queue, entries: list[tuple[float, Any]], handled: bool
+    ) -> None:
+        lost = 0
+        for entry in entries:
+            if handled:
+                lost += 1
+                continue
+            try:
+                queue.put_nowait(entry)
+            except asyncio.QueueFull:
+                lost += 1
+        if lost:
+            self._metrics[topic].failed += lost
+            logger.error("Dropped %d payloads of topic %s after a worker crash", lost, topic)
+
+    async def _fill_batch(
+        self,
+        topic: str,
+        queue: asyncio.Queue,
+        entries: list[tuple[float, Any]],
+        max_batch_size: int,
+        max_wait_ms: float,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait_ms / 1000
+        while len(entries) < max_batch_size:
+            try:
+                entry = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+                try:
+                    entry = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    return
+            entries.append(entry)
+            self._record_wait(topic, time.monotonic() - entry[0])
+
+
+def _handler_name(handler: Callable[..., Any]) -> str:
+    return getattr(handler, "__qualname__", None) or type(handler).__qualname__
+
+
+def create_message_bus_backend(settings: Settings) -> BaseMessageBus:
+    """Build the backend selected by ``Settings.message_bus_backend``."""
+
+    backend = settings.message_bus_backend.lower()
+    if backend == "memory":
+        return InMemoryMessageBus()
+    if backend == "redis":
+        from app.integrations.redis_bus import RedisStreamsMessageBus
+
+        return RedisStreamsMessageBus.from_settings(settings)
+    raise ValueError(f"Unknown message bus backend '{settings.message_bus_backend}'")
+
+
+class MessageBus(metaclass=SingletonMeta):
+    """Process-wide bus facade shared by services and background processors.
+
+    The backend is created on first use from ``Settings`` (in-memory by
+    default, Redis Streams for multi-worker deployments).
+    """
+
+    def __init__(self, backend: BaseMessageBus | None = None) -> None:
+        self._backend = backend
+
+    @property
+    def backend(self) -> BaseMessageBus:
+        if self._backend is None:
+            self._backend = create_message_bus_backend(SettingsSingleton().instance)
+        return self._backend
+
+    def configure_topic(
+        self, topic: str, *, workers: int | None = None, max_queue_size: int | None = None
+    ) -> None:
+        self.backend.configure_topic(topic, workers=workers, max_queue_size=max_queue_size)
+
+    def topic_workers(self, topic: str) -> int:
+        return self.backend.topic_workers(topic)
+
+    def subscribe(self, topic: str, handler: Subscriber) -> None:
+        self.backend.subscribe(topic, handler)
+
+    def subscribe_batch(
+        self,
+        topic: str,
+        handler: BatchSubscriber,
+        *,
+        max_batch_size: int = 50,
+        max_wait_ms: float = 50,
+    ) -> None:
+        self.backend.subscribe_batch(
+            topic, handler, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms
+        )
+
+    async def publish(self, topic: str, payload: Any) -> None:
+        await self.backend.publish(topic, payload)
+
+    async def start(self) -> None:
+        await self.backend.start()
+
+    async def stop(self) -> None:
+        await self.backend.stop()
+
+    async def join(self) -> None:
+        await self.backend.join()
+
+    async def stats(self) -> dict[str, dict[str, Any]]:
+        return await self.backend.stats()
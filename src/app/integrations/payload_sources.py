@@ -0,0 +1,156 @@
+"""Streaming readers for federation result payloads.
+
+``open_payload`` yields raw byte chunks so callers never hold a whole results
+file in memory. Remote payloads are fetched over HTTPS; ``file://`` and plain
+``http://`` URLs are only accepted when ``allow_local`` is set (local tooling,
+tests and the HTTP stand-in used during development). ``file://`` URLs inside
+one of ``local_roots`` (the direct upload directory) are always readable.
+Redirects are not followed: a redirect could lead an HTTPS URL to plain HTTP
+or to an internal host and bypass those checks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+from collections.abc import AsyncIterator, Iterable
+from hashlib import sha256
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+import httpx
+
+READ_CHUNK_BYTES = 64 * 1024
+
+
+class PayloadFetchError(RuntimeError):
+    """Raised when a payload cannot be opened or read."""
+
+
+async def open_payload(
+    url: str,
+    *,
+    allow_local: bool = False,
+    local_roots: Iterable[str | Path] = (),
+    timeout: float = 30.0,
+) -> AsyncIterator[bytes]:
+    parsed = urlparse(url)
+    if parsed.scheme == "file" and (allow_local or local_payload_path(url, local_roots)):
+        async for chunk in read_file(Path(unquote(parsed.path))):
+            yield chunk
+        return
+    if parsed.scheme == "https" or (parsed.scheme == "http" and allow_local):
+        async for chunk in _read_http(url, timeout):
+            yield chunk
+        return
+    raise PayloadFetchError(f"Unsupported payload URL scheme '{parsed.scheme}'")
+
+
+def local_payload_path(url: str, roots: Iterable[str | Path]) -> Path | None:
+    """Return the file behind a ``file://`` ``url`` if it lies inside ``roots``."""
+
+    parsed = urlparse(url)
+    if parsed.scheme != "file":
+        return None
+    path = Path(unquote(parsed.path)).resolve()
+    for root in roots:
+        if path.is_relative_to(Path(root).resolve()):
+            return path
+    return None
+
+
+class SpooledPayload:
+    """A payload in a local file, with its content hash.
+
+    ``owned`` payloads are temporary copies that ``discard`` deletes; files that
+    were already local (direct uploads) are left in place.
+    """
+
+    def __init__(self, path: Path, checksum: str, size: int, owned: bool = True) -> None:
+        self.path = path
+        self.checksum = checksum
+        self.size = size
+        self.owned = owned
+
+    def chunks(self) -> AsyncIterator[bytes]:
+        return read_file(self.path)
+
+    def discard(self) -> None:
+        if self.owned:
+            self.path.unlink(missing_ok=True)
+
+
+async def spool_payload(chunks: AsyncIterator[bytes]) -> SpooledPayload:
+    """Hash ``chunks`` while writing them to disk, so the payload is downloaded
+    once and its checksum is known before deciding whether to import it."""
+
+    descriptor, name = tempfile.mkstemp(prefix="trackeo-payload-")
+    path = Path(name)
+    digest = sha256()
+    size = 0
+    try:
+        with os.fdopen(descriptor, "wb") as handle:
+            async for chunk in chunks:
+                digest.update(chunk)
+                size += len(chunk)
+                await asyncio.to_thread(handle.write, chunk)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return SpooledPayload(path, digest.hexdigest(), size)
+
+
+async def hash_local_payload(path: Path, checksum: str | None = None) -> SpooledPayload:
+    """Hash a payload that is already on local disk without copying it.
+
+    A ``checksum`` recorded when the file was written is trusted as is, so the
+    file is not read an extra time.
+    """
+
+    if checksum:
+        try:
+            size = (await asyncio.to_thread(path.stat)).st_size
+        except OSError as exc:
+            raise PayloadFetchError(f"Cannot open payload: {exc.strerror or exc}") from exc
+        return SpooledPayload(path, checksum, size, owned=False)
+    digest = sha256()
+    size = 0
+    async for chunk in read_file(path):
+        digest.update(chunk)
+        size += len(chunk)
+    return SpooledPayload(path, digest.hexdigest(), size, owned=False)
+
+
+async def read_file(path: Path) -> AsyncIterator[bytes]:
+    try:
+        handle = await asyncio.to_thread(path.open, "rb")
+    except OSError as exc:
+        raise PayloadFetchError(f"Cannot open payload: {exc.strerror or exc}") from exc
+    try:
+        while True:
+            chunk = await asyncio.to_thread(handle.read, READ_CHUNK_BYTES)
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        handle.close()
+
+
+async def _read_http(url: str, timeout: float) -> AsyncIterator[bytes]:
+    try:
+        async with httpx.AsyncClient(timeout=timeout, follow_redirects=False) as client:
+            async with client.stream("GET", url) as response:
+                if response.is_redirect:
+                    raise PayloadFetchError(
+                        f"Payload URL redirects (HTTP {response.status_code}); "
+                        "submit the final URL"
+                    )
+                if response.status_code != 200:
+                    raise PayloadFetchError(
+                        f"Payload download failed with HTTP {response.status_code}"
+                    )
+                async for chunk in response.aiter_bytes(READ_CHUNK_BYTES):
+                    yield chunk
+    except httpx.HTTPError as exc:
+        raise PayloadFetchError(f"Payload download failed: {exc}") from exc
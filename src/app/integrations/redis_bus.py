@@ -0,0 +1,279 @@
+"""Durable ``MessageBus`` backend built on Redis Streams consumer groups.
+
+Each topic maps to a stream ``<prefix>:<topic>``. Every consuming process joins
+the same consumer group, so payloads are shared across API and ingestion
+workers and survive restarts: an entry is only acknowledged (and deleted) after
+its handlers succeeded. Entries left pending by a crashed consumer or a failed
+handler are reclaimed with ``XAUTOCLAIM`` once they have been idle for
+``claim_idle_ms``. An entry delivered ``max_deliveries`` times without
+success, or one whose payload cannot be decoded, is moved to the
+``<prefix>:<topic>:dead`` stream for inspection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+from typing import Any
+
+from app.core.config import Settings
+
+from .message_bus import BaseMessageBus, MessageBusBackpressureError
+
+logger = logging.getLogger(__name__)
+
+
+class RedisStreamsMessageBus(BaseMessageBus):
+    """Publish to and consume from Redis Streams.
+
+    ``client`` is any object exposing the ``redis.asyncio.Redis`` stream
+    commands with ``decode_responses=True``; tests pass an in-process stand-in.
+    Payloads must be JSON serializable. With ``consume=False`` the process only
+    publishes, leaving consumption to a separate worker pool.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        stream_prefix: str = "trackeo",
+        group: str = "trackeo-workers",
+        consumer: str | None = None,
+        consume: bool = True,
+        block_ms: int = 1000,
+        claim_idle_ms: int = 60_000,
+        max_deliveries: int = 5,
+        workers: int | None = None,
+        max_queue_size: int | None = None,
+        publish_timeout: float | None = None,
+        restart_delay: float = 1.0,
+    ) -> None:
+        super().__init__(workers, max_queue_size, publish_timeout, restart_delay)
+        self._client = client
+        self._prefix = stream_prefix
+        self._group = group
+        self._consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+        self._consume = consume
+        self._block_ms = block_ms
+        self._claim_idle_ms = claim_idle_ms
+        self._max_deliveries = max(1, max_deliveries)
+        self._groups_ready: set[str] = set()
+        # Entries whose handlers failed, left pending for a retry, per stream.
+        self._parked: dict[str, set[str]] = {}
+        self._tasks: dict[str, list[asyncio.Task]] = {}
+        self._in_flight = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "RedisStreamsMessageBus":
+        from redis.asyncio import Redis
+
+        return cls(
+            Redis.from_url(settings.redis_url, decode_responses=True),
+            stream_prefix=settings.message_bus_stream_prefix,
+            group=settings.message_bus_consumer_group,
+            consume=settings.message_bus_consume,
+            max_deliveries=settings.message_bus_max_deliveries,
+        )
+
+    async def start(self) -> None:
+        if not self._consume:
+            return
+        for topic in self._topics():
+            await self._start_topic(topic)
+
+    async def stop(self) -> None:
+        tasks = [task for topic_tasks in self._tasks.values() for task in topic_tasks]
+        self._tasks = {}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def close(self) -> None:
+        await self.stop()
+        await self._client.aclose()
+
+    async def join(self) -> None:
+        """Wait until every stream served by this process is drained.
+
+        Entries parked after a failed delivery do not count; they wait for
+        ``claim_idle_ms`` before their retry.
+        """
+
+        while True:
+            lengths = [
+                await self._client.xlen(stream) - len(self._parked.get(stream, ()))
+                for stream in map(self._stream, self._tasks)
+            ]
+            if not any(lengths) and self._in_flight == 0:
+                return
+            await asyncio.sleep(0.01)
+
+    async def queue_depth(self, topic: str) -> int:
+        return await self._client.xlen(self._stream(topic))
+
+    async def publish(self, topic: str, payload: Any) -> None:
+        stream = self._stream(topic)
+        metrics = self._metrics[topic]
+        _, max_queue_size = self._resolve_options(topic)
+        if await self._client.xlen(stream) >= max_queue_size:
+            timeout = self._resolve_publish_timeout()
+            deadline = time.monotonic() + timeout
+            while await self._client.xlen(stream) >= max_queue_size:
+                if time.monotonic() >= deadline:
+                    metrics.rejected += 1
+                    raise MessageBusBackpressureError(
+                        f"Stream for '{topic}' stayed full for {timeout:.1f}s"
+                    )
+                await asyncio.sleep(0.05)
+        # Wall-clock time so consumers in other processes can measure lag.
+        await self._client.xadd(
+            stream, {"payload": json.dumps(payload), "published_at": repr(time.time())}
+        )
+        metrics.published += 1
+        if self._consume and self._has_subscribers(topic) and topic not in self._tasks:
+            await self._start_topic(topic)
+
+    def _stream(self, topic: str) -> str:
+        return f"{self._prefix}:{topic}"
+
+    async def _start_topic(self, topic: str) -> None:
+        if topic in self._tasks:
+            return
+        await self._ensure_group(self._stream(topic))
+        workers, _ = self._resolve_options(topic)
+        self._tasks[topic] = [
+            asyncio.create_task(
+                self._supervise(
+                    topic,
+                    lambda consumer=f"{self._consumer}-{index}": self._worker(topic, consumer),
+                )
+            )
+            for index in range(workers)
+        ]
+
+    async def _ensure_group(self, stream: str) -> None:
+        if stream in self._groups_ready:
+            return
+        try:
+            await self._client.xgroup_create(stream, self._group, id="0", mkstream=True)
+        except Exception as exc:  # redis raises ResponseError when the group exists
+            if "BUSYGROUP" not in str(exc):
+                raise
+        self._groups_ready.add(stream)
+
+    async def _worker(self, topic: str, consumer: str) -> None:
+        # Connection hiccups propagate to ``_supervise``, which restarts the
+        # worker; entries it had not acknowledged stay pending and are reclaimed.
+        stream = self._stream(topic)
+        # Pick up entries a crashed consumer left behind before taking new ones,
+        # and look again whenever the stream goes idle.
+        messages = await self._reclaim(stream, consumer)
+        while True:
+            if messages:
+                await self._deliver(topic, stream, messages)
+            messages = await self._read(topic, stream, consumer)
+            if not messages:
+                messages = await self._reclaim(stream, consumer)
+
+    async def _read(
+        self, topic: str, stream: str, consumer: str
+    ) -> list[tuple[str, dict[str, str]]]:
+        max_batch_size, max_wait_ms = self._batch_options.get(topic, (1, 0.0))
+        messages = await self._read_once(stream, consumer, max_batch_size, self._block_ms)
+        if not messages or max_batch_size == 1:
+            return messages
+        deadline = time.monotonic() + max_wait_ms / 1000
+        while len(messages) < max_batch_size:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                break
+            more = await self._read_once(
+                stream, consumer, max_batch_size - len(messages), remaining_ms
+            )
+            if not more:
+                break
+            messages.extend(more)
+        return messages
+
+    async def _read_once(
+        self, stream: str, consumer: str, count: int, block_ms: int
+    ) -> list[tuple[str, dict[str, str]]]:
+        response = await self._client.xreadgroup(
+            self._group, consumer, {stream: ">"}, count=count, block=block_ms
+        )
+        return [message for _, entries in response or [] for message in entries]
+
+    async def _reclaim(self, stream: str, consumer: str) -> list[tuple[str, dict[str, str]]]:
+        response = await self._client.xautoclaim(
+            stream, self._group, consumer, self._claim_idle_ms, start_id="0-0", count=1
+        )
+        messages: list[tuple[str, dict[str, str]]] = []
+        for message in response[1]:
+            if not message or not message[1]:
+                continue
+            message_id, fields = message
+            pending = await self._client.xpending_range(
+                stream, self._group, min=message_id, max=message_id, count=1
+            )
+            # The claim counted as a delivery, so the count includes this attempt.
+            deliveries = pending[0]["times_delivered"] if pending else 1
+            if deliveries > self._max_deliveries:
+                await self._dead_letter(
+                    stream, message_id, fields, f"failed {deliveries - 1} deliveries"
+                )
+                continue
+            messages.append(message)
+        return messages
+
+    async def _dead_letter(
+        self, stream: str, message_id: str, fields: dict[str, str], reason: str
+    ) -> None:
+        topic = stream[len(self._prefix) + 1 :]
+        await self._client.xadd(
+            f"{stream}:dead", {**fields, "message_id": message_id, "reason": reason}
+        )
+        await self._client.xack(stream, self._group, message_id)
+        await self._client.xdel(stream, message_id)
+        self._parked.get(stream, set()).discard(message_id)
+        self._metrics[topic].dead_lettered += 1
+        logger.error(
+            "Moved entry %s on %s to the dead-letter stream: %s", message_id, stream, reason
+        )
+
+    async def _deliver(
+        self, topic: str, stream: str, messages: list[tuple[str, dict[str, str]]]
+    ) -> None:
+        self._in_flight += len(messages)
+        try:
+            payloads: list[Any] = []
+            message_ids: list[str] = []
+            now = time.time()
+            for message_id, fields in messages:
+                try:
+                    payloads.append(json.loads(fields["payload"]))
+                except (KeyError, TypeError, ValueError):
+                    await self._dead_letter(stream, message_id, fields, "malformed payload")
+                    continue
+                message_ids.append(message_id)
+                published_at = fields.get("published_at")
+                if published_at is not None:
+                    self._record_wait(topic, now - float(published_at))
+            failed = await self._dispatch(topic, payloads) if payloads else set()
+            parked = self._parked.setdefault(stream, set())
+            done = []
+            for index, message_id in enumerate(message_ids):
+                if index in failed:
+                    # Left pending: reclaimed after ``claim_idle_ms`` and retried.
+                    parked.add(message_id)
+                else:
+                    parked.discard(message_id)
+                    done.append(message_id)
+            if done:
+                await self._client.xack(stream, self._group, *done)
+                await self._client.xdel(stream, *done)
+        finally:
+            self._in_flight -= len(messages)
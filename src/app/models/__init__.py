@@ -7,12 +7,23 @@ from .event import (
     EventEntryStatus,
     EventSession,
     EventSessionStatus,
+    MarkUnit,
 )
 from .club import Club
-from .federation import Federation, FederationSubmission, FederationSubmissionStatus
+from .federation import (
+    Federation,
+    FederationSubmission,
+    FederationSubmissionStatus,
+    FederationUpload,
+    FederationUploadStatus,
+)
+from .leaderboard import LeaderboardEntry
 from .news import NewsArticle, NewsAudience
+from .recent_result import RecentResult
 from .roster import Roster
+from .standing import EventStanding, StandingScope
 from .subscriber import EmailSubscriber
+from .token import RefreshToken
 from .user import AthleteProfile, User
 
 __all__ = [
@@ -23,15 +34,23 @@ __all__ = [
     "EventSession",
     "EventDiscipline",
     "EventEntry",
+    "EventStanding",
     "EventSessionStatus",
     "EventDisciplineStatus",
     "EventEntryStatus",
     "Federation",
     "FederationSubmission",
     "FederationSubmissionStatus",
+    "FederationUpload",
+    "FederationUploadStatus",
+    "LeaderboardEntry",
+    "MarkUnit",
     "NewsArticle",
     "NewsAudience",
+    "RecentResult",
+    "RefreshToken",
     "Roster",
+    "StandingScope",
     "EmailSubscriber",
     "User",
 ]
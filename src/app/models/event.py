@@ -3,7 +3,18 @@ from __future__ import annotations
 from datetime import date, datetime
 from enum import Enum
 
-from sqlalchemy import Date, DateTime, Enum as SqlEnum, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Enum as SqlEnum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -22,13 +33,14 @@ class Event(Base):
         "EventSession",
         back_populates="event",
         cascade="all, delete-orphan",
-        order_by="EventSession.start_time",
+        # Leading with the foreign key lets selectin loads read the index in order.
+        order_by="(EventSession.event_id, EventSession.start_time)",
     )
     disciplines: Mapped[list["EventDiscipline"]] = relationship(
         "EventDiscipline",
         back_populates="event",
         cascade="all, delete-orphan",
-        order_by="EventDiscipline.scheduled_start",
+        order_by="(EventDiscipline.event_id, EventDiscipline.scheduled_start)",
     )
 
 
@@ -54,8 +66,15 @@ class EventEntryStatus(str, Enum):
     DQ = "dq"
 
 
+class MarkUnit(str, Enum):
+    SECONDS = "s"
+    METRES = "m"
+    POINTS = "pts"
+
+
 class EventSession(Base):
     __tablename__ = "event_sessions"
+    __table_args__ = (Index("ix_event_sessions_event_start", "event_id", "start_time"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     event_id: Mapped[int] = mapped_column(ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
@@ -75,12 +94,16 @@ class EventSession(Base):
         "EventDiscipline",
         back_populates="session",
         cascade="all, delete-orphan",
-        order_by="EventDiscipline.scheduled_start",
+        order_by="(EventDiscipline.session_id, EventDiscipline.scheduled_start)",
     )
 
 
 class EventDiscipline(Base):
     __tablename__ = "event_disciplines"
+    __table_args__ = (
+        Index("ix_event_disciplines_event_start", "event_id", "scheduled_start"),
+        Index("ix_event_disciplines_session_start", "session_id", "scheduled_start"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     event_id: Mapped[int] = mapped_column(ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
@@ -106,12 +129,18 @@ class EventDiscipline(Base):
         "EventEntry",
         back_populates="discipline",
         cascade="all, delete-orphan",
-        order_by="EventEntry.lane",
+        order_by="(EventEntry.discipline_id, EventEntry.lane)",
     )
 
 
 class EventEntry(Base):
     __tablename__ = "event_entries"
+    __table_args__ = (
+        Index("ix_event_entries_discipline_mark", "discipline_id", "mark_value"),
+        Index("ix_event_entries_discipline_lane", "discipline_id", "lane"),
+        Index("ix_event_entries_athlete_mark", "athlete_name", "mark_unit", "mark_value"),
+        Index("ix_event_entries_updated_at", "updated_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     discipline_id: Mapped[int] = mapped_column(
@@ -132,8 +161,14 @@ class EventEntry(Base):
     )
     position: Mapped[int | None] = mapped_column(Integer, nullable=True)
     result: Mapped[str | None] = mapped_column(String(60), nullable=True)
+    # ``result`` as seconds, metres or points (see ``app.domain.marks``).
+    mark_value: Mapped[float | None] = mapped_column(Float, nullable=True)
+    mark_unit: Mapped[MarkUnit | None] = mapped_column(
+        SqlEnum(MarkUnit, name="mark_unit"), nullable=True
+    )
     points: Mapped[int | None] = mapped_column(Integer, nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    fingerprint: Mapped[str | None] = mapped_column(String(32), nullable=True)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -153,4 +188,5 @@ __all__ = [
     "EventSessionStatus",
     "EventDisciplineStatus",
     "EventEntryStatus",
+    "MarkUnit",
 ]
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import DateTime, Enum as SqlEnum, String
+from sqlalchemy import BigInteger, DateTime, Enum as SqlEnum, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -44,4 +44,33 @@ class FederationSubmission(Base):
     status_details: Mapped[str | None] = mapped_column(String(500), nullable=True)
     processed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     verified_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    checksum: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    checksum: Mapped[str | None] = mapped_column(String(128), nullable=True, index=True)
+
+
+class FederationUploadStatus(str, Enum):
+    UPLOADING = "uploading"
+    COMPLETED = "completed"
+
+
+class FederationUpload(Base):
+    """A resumable direct upload; becomes a ``FederationSubmission`` once complete."""
+
+    __tablename__ = "federation_uploads"
+
+    id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    federation_name: Mapped[str] = mapped_column(String(120), nullable=False)
+    contact_email: Mapped[str] = mapped_column(String(255), nullable=False)
+    notes: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    filename: Mapped[str] = mapped_column(String(255), nullable=False)
+    total_size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    received_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    status: Mapped[FederationUploadStatus] = mapped_column(
+        SqlEnum(FederationUploadStatus, native_enum=False, length=20),
+        nullable=False,
+        default=FederationUploadStatus.UPLOADING,
+    )
+    checksum: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    submission_id: Mapped[int | None] = mapped_column(
+        ForeignKey("federation_submissions.id", ondelete="SET NULL"), nullable=True
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
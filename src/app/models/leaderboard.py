@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import Date, Float, ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+# ``category`` value of the open list that ranks every category together.
+ALL_CATEGORIES = ""
+
+
+class LeaderboardEntry(Base):
+    """An athlete's season best in one discipline and category.
+
+    Maintained incrementally as entries are written (see
+    ``app.services.leaderboards``); each row points at the entry that set it.
+    """
+
+    __tablename__ = "leaderboard_entries"
+    __table_args__ = (
+        UniqueConstraint("discipline", "season", "category", "athlete_name"),
+        Index("ix_leaderboard_entries_ranking", "discipline", "season", "category", "mark_value"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    discipline: Mapped[str] = mapped_column(String(120), nullable=False)
+    season: Mapped[int] = mapped_column(Integer, nullable=False)
+    category: Mapped[str] = mapped_column(String(60), nullable=False, default=ALL_CATEGORIES)
+    athlete_name: Mapped[str] = mapped_column(String(120), nullable=False)
+    team_name: Mapped[str | None] = mapped_column(String(120), nullable=True)
+    mark_value: Mapped[float] = mapped_column(Float, nullable=False)
+    result: Mapped[str | None] = mapped_column(String(60), nullable=True)
+    entry_id: Mapped[int] = mapped_column(
+        ForeignKey("event_entries.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    event_id: Mapped[int] = mapped_column(ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
+    achieved_on: Mapped[date] = mapped_column(Date, nullable=False)
@@ -24,7 +24,7 @@ class NewsArticle(Base):
     excerpt: Mapped[str] = mapped_column(String(500), nullable=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     published_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
+        DateTime(timezone=True), nullable=False, server_default=func.now(), index=True
     )
     audience: Mapped[NewsAudience] = mapped_column(
         SqlEnum(NewsAudience, native_enum=False, length=20),
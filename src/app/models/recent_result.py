@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class RecentResult(Base):
+    """Denormalized copy of a recently written entry for the landing page.
+
+    Holds the entry with its event, discipline, roster, club and federation
+    names as they were at write time. ``updated_at`` is the entry's own
+    timestamp. The table is capped to the newest rows and maintained by
+    ``app.services.recent_results``.
+    """
+
+    __tablename__ = "recent_results"
+    __table_args__ = (Index("ix_recent_results_feed", "updated_at", "id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    entry_id: Mapped[int] = mapped_column(
+        ForeignKey("event_entries.id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+    event_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    event_name: Mapped[str] = mapped_column(String(120), nullable=False)
+    discipline_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    discipline_name: Mapped[str] = mapped_column(String(120), nullable=False)
+    athlete_name: Mapped[str] = mapped_column(String(120), nullable=False)
+    team_name: Mapped[str | None] = mapped_column(String(120), nullable=True)
+    position: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    result: Mapped[str | None] = mapped_column(String(60), nullable=True)
+    points: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    roster_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    roster_name: Mapped[str | None] = mapped_column(String(150), nullable=True)
+    club_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    club_name: Mapped[str | None] = mapped_column(String(150), nullable=True)
+    federation_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    federation_name: Mapped[str | None] = mapped_column(String(120), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from enum import Enum
+
+from sqlalchemy import Enum as SqlEnum, ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class StandingScope(str, Enum):
+    TEAM = "team"
+    ROSTER = "roster"
+    CLUB = "club"
+    FEDERATION = "federation"
+
+
+class EventStanding(Base):
+    """Running points total of one team, roster, club or federation at an event.
+
+    ``scope_key`` is the team name for ``TEAM`` and the id of the roster, club
+    or federation otherwise. Maintained by ``app.services.standings``.
+    """
+
+    __tablename__ = "event_standings"
+    __table_args__ = (
+        UniqueConstraint("event_id", "scope", "scope_key"),
+        Index("ix_event_standings_table", "event_id", "scope", "points"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    event_id: Mapped[int] = mapped_column(ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
+    scope: Mapped[StandingScope] = mapped_column(
+        SqlEnum(StandingScope, native_enum=False, length=20), nullable=False
+    )
+    scope_key: Mapped[str] = mapped_column(String(150), nullable=False)
+    label: Mapped[str] = mapped_column(String(150), nullable=False)
+    points: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    entries: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import RefreshToken
+
+from .base import SQLAlchemyRepository
+
+
+class RefreshTokenRepository(SQLAlchemyRepository[RefreshToken]):
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session, RefreshToken)
+
+    async def get_by_hash(self, token_hash: str) -> RefreshToken | None:
+        return await self.get_by(RefreshToken.token_hash, token_hash)
+
+    async def revoke_all_for_user(self, user_id: int, revoked_at: datetime) -> None:
+        await self._session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=revoked_at)
+        )
+
+    async def revoke(self, token_id: int, revoked_at: datetime) -> bool:
+        """Revoke a token only if it is still active; returns ``False`` if it lost a race."""
+
+        result = await self._session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.id == token_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=revoked_at)
+        )
+        return result.rowcount == 1
+
+    async def prune_for_user(self, user_id: int, now: datetime) -> None:
+        """Delete the user's expired tokens.
+
+        Revoked tokens stay until they expire: a rotated token that is presented
+        again must still be found, so the reuse is detected.
+        """
+
+        # SQLite hands back naive timestamps, which the in-session evaluator
+        # cannot compare with ``now``; pruned rows are never read again anyway.
+        await self._session.execute(
+            delete(RefreshToken)
+            .where(RefreshToken.user_id == user_id, RefreshToken.expires_at <= now)
+            .execution_options(synchronize_session=False)
+        )
@@ -3,6 +3,8 @@ from enum import Enum
 
 from pydantic import BaseModel, Field
 
+from app.models.event import MarkUnit
+
 
 class EventBase(BaseModel):
     name: str = Field(..., min_length=3, max_length=120)
@@ -120,6 +122,8 @@ class EventEntryRead(EventEntryBase):
     id: int
     position: int | None = None
     result: str | None = None
+    mark_value: float | None = None
+    mark_unit: MarkUnit | None = None
     points: int | None = None
     roster_id: int | None = None
     roster: EventRosterStub | None = None
@@ -2,7 +2,7 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from app.models.federation import FederationSubmissionStatus
+from app.models.federation import FederationSubmissionStatus, FederationUploadStatus
 from app.schemas.user import EmailField
 
 
@@ -26,3 +26,26 @@ class FederationSubmissionRead(FederationSubmissionBase):
     status_details: str | None = None
 
     model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+
+
+class FederationUploadCreate(BaseModel):
+    federation_name: str = Field(..., min_length=3, max_length=120)
+    contact_email: EmailField
+    access_token: str = Field(..., min_length=8, max_length=128)
+    filename: str = Field(..., min_length=1, max_length=255)
+    total_size: int = Field(..., gt=0, description="Size of the complete file in bytes")
+    notes: str | None = Field(default=None, max_length=500)
+
+
+class FederationUploadRead(BaseModel):
+    id: str
+    federation_name: str
+    filename: str
+    total_size: int
+    received_bytes: int
+    status: FederationUploadStatus
+    checksum: str | None = None
+    submission_id: int | None = None
+    expires_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
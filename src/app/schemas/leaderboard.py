@@ -0,0 +1,29 @@
+from datetime import date
+
+from pydantic import BaseModel, ConfigDict
+
+from app.models.event import MarkUnit
+
+
+class LeaderboardRow(BaseModel):
+    rank: int
+    athlete_name: str
+    team_name: str | None = None
+    mark_value: float
+    result: str | None = None
+    event_id: int
+    entry_id: int
+    achieved_on: date
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LeaderboardRead(BaseModel):
+    discipline: str
+    season: int | None = None
+    category: str | None = None
+    unit: MarkUnit
+    lower_is_better: bool
+    limit: int
+    offset: int
+    entries: list[LeaderboardRow]
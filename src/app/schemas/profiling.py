@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class ProfileSummary(BaseModel):
+    id: int
+    method: str
+    path: str
+    status: int
+    started_at: datetime
+    duration_ms: float
+    interval_ms: float
+    samples: int
+
+
+class ProfileFrame(BaseModel):
+    frame: str
+    samples: int
+    percent: float
+
+
+class ProfileDetail(ProfileSummary):
+    self_time: list[ProfileFrame]
+    inclusive_time: list[ProfileFrame]
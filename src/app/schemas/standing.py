@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+from app.models.standing import StandingScope
+
+
+class StandingRow(BaseModel):
+    rank: int
+    key: str
+    label: str
+    points: int
+    entries: int
+
+
+class EventStandingsRead(BaseModel):
+    event_id: int
+    scope: StandingScope
+    rows: list[StandingRow]
@@ -4,8 +4,10 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_session
-from app.core.security import PasswordHasher
-from app.models import AthleteProfile, User
+from app.core.security import PasswordHasher, TokenService
+from app.core.trusted_rows import row_loader
+from app.models import AthleteProfile, RefreshToken, User
+from app.repositories.token import RefreshTokenRepository
 from app.repositories.user import AthleteProfileRepository, UserRepository
 from app.schemas.user import UserCreate, UserRead
 
@@ -17,11 +19,15 @@ class AccountsService:
         password_hasher: PasswordHasher | None = None,
         user_repository: UserRepository | None = None,
         athlete_repository: AthleteProfileRepository | None = None,
+        refresh_token_repository: RefreshTokenRepository | None = None,
+        token_service: TokenService | None = None,
     ) -> None:
         self._session = session
         self._hasher = password_hasher or PasswordHasher()
         self._users = user_repository or UserRepository(session)
         self._athletes = athlete_repository or AthleteProfileRepository(session)
+        self._refresh_tokens = refresh_token_repository or RefreshTokenRepository(session)
+        self._tokens = token_service or TokenService()
 
     async def get_user_by_email(self, email: str) -> UserRead | None:
         user = await self._users.get_by_email(email)
@@ -37,7 +43,7 @@ class AccountsService:
             email=payload.email,
             full_name=payload.full_name,
             role=payload.role,
-            hashed_password=self._hasher.hash(payload.password),
+            hashed_password=await self._hasher.hash_async(payload.password),
         )
         await self._users.add(user)
 
@@ -59,17 +65,61 @@ class AccountsService:
 
     async def list_users(self) -> list[UserRead]:
         users = await self._users.list()
-        return [UserRead.model_validate(user) for user in users]
+        load = row_loader(UserRead)
+        return [load(user) for user in users]
 
     async def authenticate(self, email: str, password: str) -> User | None:
         user = await self._users.get_by_email(email)
-        if user and self._hasher.verify(password, user.hashed_password):
+        if user and await self._hasher.verify_async(password, user.hashed_password):
             return user
         return None
 
     async def get_user_model(self, user_id: int) -> User | None:
         return await self._users.get(user_id)
 
+    async def issue_refresh_token(self, user_id: int) -> tuple[str, datetime]:
+        await self._refresh_tokens.prune_for_user(user_id, datetime.now(tz=timezone.utc))
+        token, token_hash, expires_at = self._tokens.create_refresh_token()
+        await self._refresh_tokens.add(
+            RefreshToken(user_id=user_id, token_hash=token_hash, expires_at=expires_at)
+        )
+        await self._session.commit()
+        return token, expires_at
+
+    async def rotate_refresh_token(self, token: str) -> tuple[int, str, datetime] | None:
+        """Exchange a refresh token for a new one, revoking the presented token.
+
+        Presenting a token that was already rotated revokes every outstanding
+        token for the user, since it means the token chain has leaked.
+        """
+
+        now = datetime.now(tz=timezone.utc)
+        stored = await self._refresh_tokens.get_by_hash(self._tokens.hash_refresh_token(token))
+        if stored is None:
+            return None
+        if stored.revoked_at is not None:
+            await self._refresh_tokens.revoke_all_for_user(stored.user_id, now)
+            await self._session.commit()
+            return None
+        expires_at = stored.expires_at
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        if expires_at <= now:
+            return None
+
+        if not await self._refresh_tokens.revoke(stored.id, now):
+            # A concurrent refresh already rotated this token: treat it as reuse.
+            await self._refresh_tokens.revoke_all_for_user(stored.user_id, now)
+            await self._session.commit()
+            return None
+        await self._refresh_tokens.prune_for_user(stored.user_id, now)
+        new_token, new_hash, new_expires_at = self._tokens.create_refresh_token()
+        await self._refresh_tokens.add(
+            RefreshToken(user_id=stored.user_id, token_hash=new_hash, expires_at=new_expires_at)
+        )
+        await self._session.commit()
+        return stored.user_id, new_token, new_expires_at
+
 
 async def get_accounts_service(
     session: AsyncSession = Depends(get_session),
@@ -9,6 +9,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.database import get_session
+from app.core.trusted_rows import row_loader
+from app.domain.marks import parse_mark
 from app.models import (
     Event,
     EventDiscipline,
@@ -31,6 +33,9 @@ from app.schemas.event import (
     EventSessionCreate,
     EventSessionRead,
 )
+from app.services.leaderboards import LeaderboardService, candidate_for
+from app.services.recent_results import RecentResultsService
+from app.services.standings import StandingsContribution, StandingsService, contribution_for
 
 
 class EventsService:
@@ -61,6 +66,24 @@ class EventsService:
             raise HTTPException(status_code=404, detail="Event entry not found")
         return entry
 
+    async def _record_results(
+        self,
+        entries: list[EventEntry],
+        discipline: EventDiscipline,
+        previous: list[StandingsContribution] | None = None,
+    ) -> None:
+        """Update leaderboards, standings and the recent feed for entries written here."""
+
+        event = await self._require_event(discipline.event_id)
+        await LeaderboardService(self._session).record(
+            candidate_for(entry, discipline, event) for entry in entries
+        )
+        await StandingsService(self._session).apply(
+            removed=previous or [],
+            added=[contribution_for(entry, event.id) for entry in entries],
+        )
+        await RecentResultsService(self._session).record([entry.id for entry in entries])
+
     async def create_event(self, payload: EventCreate) -> EventRead:
         event = Event(**payload.model_dump())
         self._session.add(event)
@@ -71,7 +94,8 @@ class EventsService:
     async def list_events(self) -> list[EventRead]:
         result = await self._session.execute(select(Event))
         events = result.scalars().all()
-        return [EventRead.model_validate(event) for event in events]
+        load = row_loader(EventRead)
+        return [load(event) for event in events]
 
     async def get_event_detail(self, event_id: int) -> EventDetailRead:
         result = await self._session.execute(
@@ -130,7 +154,10 @@ class EventsService:
     ) -> EventEntryRead:
         discipline = await self._require_discipline(discipline_id)
         entry = EventEntry(discipline_id=discipline.id, **payload.model_dump())
+        _apply_mark(entry, discipline.name)
         self._session.add(entry)
+        await self._session.flush()
+        await self._record_results([entry], discipline)
         await self._session.commit()
         await self._session.refresh(entry, attribute_names=["roster", "updated_at"])
         return EventEntryRead.model_validate(entry)
@@ -140,9 +167,14 @@ class EventsService:
         data = payload.model_dump(exclude_unset=True)
         if not data:
             return EventEntryRead.model_validate(entry)
+        discipline = await self._require_discipline(entry.discipline_id)
+        previous = contribution_for(entry, discipline.event_id)
         for key, value in data.items():
             setattr(entry, key, value)
+        if "result" in data:
+            _apply_mark(entry, discipline.name)
         self._session.add(entry)
+        await self._record_results([entry], discipline, previous=[previous])
         await self._session.commit()
         await self._session.refresh(entry, attribute_names=["roster", "updated_at"])
         return EventEntryRead.model_validate(entry)
@@ -153,6 +185,17 @@ class EventsService:
         await self._require_event(event_id)
 
         # Clear existing structure for a clean demo slate.
+        leaderboards = LeaderboardService(self._session)
+        replaced_entries = await self._session.scalars(
+            select(EventEntry.id).where(
+                EventEntry.discipline_id.in_(
+                    select(EventDiscipline.id).where(EventDiscipline.event_id == event_id)
+                )
+            )
+        )
+        stale_boards = await leaderboards.keys_for_entries(replaced_entries.all())
+        standings = StandingsService(self._session)
+        await standings.reset(event_id)
         await self._session.execute(
             delete(EventEntry).where(
                 EventEntry.discipline_id.in_(
@@ -275,6 +318,7 @@ class EventsService:
 
         await self._session.flush()
 
+        generated_entries: list[tuple[EventEntry, EventDiscipline]] = []
         for discipline_index, discipline in enumerate(generated_disciplines):
             entries_to_use = sample(athlete_names, k=min(len(athlete_names), payload.lanes))
             teams_cycle = sample(team_names, k=min(len(team_names), payload.lanes))
@@ -304,12 +348,30 @@ class EventsService:
                     points=points,
                     notes="Demo entry",
                 )
+                _apply_mark(entry, discipline.name)
                 self._session.add(entry)
+                generated_entries.append((entry, discipline))
 
+        await self._session.flush()
+        await leaderboards.refresh(stale_boards)
+        event = await self._require_event(event_id)
+        await leaderboards.record(
+            candidate_for(entry, discipline, event) for entry, discipline in generated_entries
+        )
+        await standings.apply(
+            added=[contribution_for(entry, event_id) for entry, _ in generated_entries]
+        )
+        await RecentResultsService(self._session).rebuild()
         await self._session.commit()
 
         return await self.get_event_detail(event_id)
 
 
+def _apply_mark(entry: EventEntry, discipline_name: str) -> None:
+    mark = parse_mark(entry.result, discipline_name)
+    entry.mark_value = mark.value if mark else None
+    entry.mark_unit = mark.unit if mark else None
+
+
 async def get_events_service(session: AsyncSession = Depends(get_session)) -> EventsService:
     return EventsService(session)
@@ -0,0 +1,281 @@
+"""Resumable direct uploads of federation results files.
+
+A federation opens an upload with the file's name and size, then sends the
+bytes with ``PUT`` requests carrying an ``Upload-Offset`` header. Each request
+body is streamed straight to ``<upload_dir>/<id>.part`` while a sha256 digest
+is updated, so no chunk is ever held in memory in full. If a connection drops
+the bytes already written are kept and the client resumes from the offset
+reported by ``GET``. The upload id is a random capability token, so only the
+federation that opened the upload can continue it. Once the last byte arrives
+the file is renamed and queued as a regular ``FederationSubmission``.
+
+A request holds an exclusive ``flock`` on the ``.part`` file while it checks
+the offset and appends. Workers in other processes therefore cannot both pass
+the offset check and interleave their bytes. A request that finds the file
+locked gets a 409 and resumes like any other offset mismatch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import secrets
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+from typing import Any
+from weakref import WeakValueDictionary
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import SettingsSingleton
+from app.core.database import get_session
+from app.core.rate_limit import enforce_rate_limit
+from app.core.singleton import SingletonMeta
+from app.integrations.message_bus import MessageBus
+from app.integrations.payload_sources import read_file
+from app.models import (
+    FederationSubmission,
+    FederationSubmissionStatus,
+    FederationUpload,
+    FederationUploadStatus,
+)
+from app.schemas.federation import FederationUploadCreate, FederationUploadRead
+from app.services.federations import FederationIngestionService
+
+try:  # POSIX only; without it uploads are serialized per process.
+    import fcntl
+except ImportError:  # pragma: no cover - exercised on Windows
+    fcntl = None
+
+UPLOAD_EXTENSIONS = (".csv", ".json", ".jsonl", ".ndjson")
+MAX_CACHED_DIGESTS = 256
+
+
+class UploadDigests(metaclass=SingletonMeta):
+    """Running sha256 state for uploads in progress, plus one lock per upload.
+
+    Digests cannot be persisted, so a bounded LRU keeps them between chunk
+    requests. On a miss (another process served the previous chunk, or the
+    entry was evicted) the digest is rebuilt from the bytes already on disk.
+    """
+
+    def __init__(self) -> None:
+        self._digests: OrderedDict[str, tuple[int, Any]] = OrderedDict()
+        self._locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
+        self._mutex = Lock()
+
+    def lock(self, upload_id: str) -> asyncio.Lock:
+        with self._mutex:
+            lock = self._locks.get(upload_id)
+            if lock is None:
+                lock = self._locks[upload_id] = asyncio.Lock()
+            return lock
+
+    async def digest(self, upload_id: str, path: Path, offset: int) -> Any:
+        with self._mutex:
+            cached = self._digests.pop(upload_id, None)
+        if cached is not None and cached[0] == offset:
+            return cached[1]
+        digest = sha256()
+        if offset:
+            async for chunk in read_file(path):
+                digest.update(chunk)
+        return digest
+
+    def store(self, upload_id: str, offset: int, digest: Any) -> None:
+        with self._mutex:
+            self._digests[upload_id] = (offset, digest)
+            self._digests.move_to_end(upload_id)
+            while len(self._digests) > MAX_CACHED_DIGESTS:
+                self._digests.popitem(last=False)
+
+    def forget(self, upload_id: str) -> None:
+        with self._mutex:
+            self._digests.pop(upload_id, None)
+
+
+class UploadOffsetMismatch(HTTPException):
+    def __init__(self, offset: int, detail: str | None = None) -> None:
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=detail or f"Upload offset mismatch; resume from byte {offset}",
+            headers={"Upload-Offset": str(offset)},
+        )
+
+
+class FederationUploadService:
+    def __init__(self, session: AsyncSession, message_bus: MessageBus | None = None) -> None:
+        self._session = session
+        self._ingestion = FederationIngestionService(session, message_bus)
+
+    async def create_upload(self, payload: FederationUploadCreate) -> FederationUploadRead:
+        settings = SettingsSingleton().instance
+        federation = await self._ingestion.authenticate_federation(
+            payload.federation_name, payload.access_token
+        )
+        enforce_rate_limit("federation_submissions", str(federation.id))
+        if not payload.filename.lower().endswith(UPLOAD_EXTENSIONS):
+            raise ValueError("Uploads must be CSV or JSON results files")
+        if payload.total_size > settings.upload_max_bytes:
+            raise ValueError(f"Uploads are limited to {settings.upload_max_bytes} bytes")
+
+        await self._prune_expired()
+        upload = FederationUpload(
+            id=secrets.token_urlsafe(24),
+            federation_name=payload.federation_name,
+            contact_email=payload.contact_email,
+            notes=payload.notes,
+            filename=Path(payload.filename).name,
+            total_size=payload.total_size,
+            received_bytes=0,
+            status=FederationUploadStatus.UPLOADING,
+            expires_at=_expiry(),
+        )
+        path = _part_path(upload.id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+        self._session.add(upload)
+        await self._session.commit()
+        return FederationUploadRead.model_validate(upload)
+
+    async def get_upload(self, upload_id: str) -> FederationUploadRead:
+        return FederationUploadRead.model_validate(await self._require_upload(upload_id))
+
+    async def append_chunk(
+        self, upload_id: str, offset: int, chunks: AsyncIterator[bytes]
+    ) -> FederationUploadRead:
+        """Write ``chunks`` at ``offset``; the file on disk is the source of truth."""
+
+        digests = UploadDigests()
+        async with digests.lock(upload_id):
+            upload = await self._require_upload(upload_id)
+            if upload.status != FederationUploadStatus.UPLOADING:
+                raise UploadOffsetMismatch(upload.total_size)
+            path = _part_path(upload_id)
+            try:
+                # "r+b" rather than "ab": a completed upload's file was renamed
+                # and must not be recreated.
+                handle = await asyncio.to_thread(path.open, "r+b")
+            except FileNotFoundError as exc:
+                raise HTTPException(status_code=404, detail="Upload not found") from exc
+            try:
+                received = os.fstat(handle.fileno()).st_size
+                if not _try_lock(handle):
+                    raise UploadOffsetMismatch(
+                        received, "Another request is writing to this upload; retry later"
+                    )
+                # Another process may have finished the upload before the lock.
+                await self._session.refresh(upload)
+                received = os.fstat(handle.fileno()).st_size
+                if upload.status != FederationUploadStatus.UPLOADING:
+                    raise UploadOffsetMismatch(upload.total_size)
+                if offset != received:
+                    raise UploadOffsetMismatch(received)
+                await asyncio.to_thread(handle.seek, received)
+            except BaseException:
+                await asyncio.to_thread(handle.close)
+                raise
+
+            try:
+                digest = await digests.digest(upload_id, path, received)
+                try:
+                    async for chunk in chunks:
+                        if received + len(chunk) > upload.total_size:
+                            # Drop the whole request so the client resends from ``offset``.
+                            await asyncio.to_thread(handle.truncate, offset)
+                            received = offset
+                            digests.forget(upload_id)
+                            digest = None
+                            raise ValueError("Upload is larger than its declared size")
+                        await asyncio.to_thread(handle.write, chunk)
+                        digest.update(chunk)
+                        received += len(chunk)
+                finally:
+                    # Keep whatever arrived before a dropped connection so the
+                    # client can resume from there.
+                    await asyncio.to_thread(handle.flush)
+                    if digest is not None:
+                        digests.store(upload_id, received, digest)
+                    upload.received_bytes = received
+                    upload.expires_at = _expiry()
+                    await self._session.commit()
+
+                if received == upload.total_size:
+                    # Still under the lock, so no other request appends meanwhile.
+                    await self._complete(upload, digest.hexdigest())
+                    digests.forget(upload_id)
+            finally:
+                # Closing the file releases the lock.
+                await asyncio.to_thread(handle.close)
+            return FederationUploadRead.model_validate(upload)
+
+    async def _complete(self, upload: FederationUpload, checksum: str) -> None:
+        path = _part_path(upload.id).rename(
+            _part_path(upload.id).with_suffix(Path(upload.filename).suffix.lower())
+        )
+        upload.status = FederationUploadStatus.COMPLETED
+        upload.checksum = checksum
+        submission = FederationSubmission(
+            federation_name=upload.federation_name,
+            contact_email=upload.contact_email,
+            payload_url=path.resolve().as_uri(),
+            notes=upload.notes,
+            status=FederationSubmissionStatus.QUEUED,
+            checksum=checksum,
+        )
+        try:
+            await self._ingestion.queue_submission(submission)
+        finally:
+            # Link even when the queue was full so the failed submission is traceable.
+            upload.submission_id = submission.id
+            await self._session.commit()
+
+    async def _require_upload(self, upload_id: str) -> FederationUpload:
+        upload = await self._session.get(FederationUpload, upload_id)
+        if upload is None:
+            raise HTTPException(status_code=404, detail="Upload not found")
+        return upload
+
+    async def _prune_expired(self) -> None:
+        """Delete uploads, finished or not, that have been idle past their expiry."""
+
+        result = await self._session.execute(
+            select(FederationUpload).where(
+                FederationUpload.expires_at < datetime.now(tz=timezone.utc)
+            )
+        )
+        for upload in result.scalars().all():
+            for path in _part_path(upload.id).parent.glob(f"{upload.id}.*"):
+                path.unlink(missing_ok=True)
+            await self._session.delete(upload)
+
+
+def _try_lock(handle: Any) -> bool:
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    return True
+
+
+def _part_path(upload_id: str) -> Path:
+    return Path(SettingsSingleton().instance.upload_dir) / f"{upload_id}.part"
+
+
+def _expiry() -> datetime:
+    hours = SettingsSingleton().instance.upload_expire_hours
+    return datetime.now(tz=timezone.utc) + timedelta(hours=hours)
+
+
+async def get_federation_upload_service(
+    session: AsyncSession = Depends(get_session),
+) -> FederationUploadService:
+    return FederationUploadService(session)
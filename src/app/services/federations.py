@@ -1,15 +1,30 @@
+import logging
 from datetime import datetime, timezone
 from hashlib import sha256
 from urllib.parse import urlparse
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import SettingsSingleton
 from app.core.database import DatabaseSessionManager, get_session
-from app.integrations.message_bus import MessageBus
+from app.core.rate_limit import enforce_rate_limit
+from app.domain.results_feed import PayloadFormatError
+from app.integrations.message_bus import MessageBus, MessageBusBackpressureError
+from app.integrations.payload_sources import (
+    PayloadFetchError,
+    SpooledPayload,
+    hash_local_payload,
+    local_payload_path,
+    open_payload,
+    spool_payload,
+)
 from app.models import Federation, FederationSubmission, FederationSubmissionStatus
 from app.schemas.federation import FederationSubmissionCreate, FederationSubmissionRead
+from app.services.result_imports import ResultsImporter
+
+logger = logging.getLogger(__name__)
 
 
 class FederationIngestionService:
@@ -20,35 +35,47 @@ class FederationIngestionService:
     async def enqueue_submission(
         self, payload: FederationSubmissionCreate
     ) -> FederationSubmissionRead:
-        federation = await self._validate_payload(payload)
+        self._validate_payload_url(payload.payload_url)
+        federation = await self.authenticate_federation(
+            payload.federation_name, payload.access_token
+        )
+        # Charged only after the ingest token checks out so a caller who merely
+        # knows a federation's name cannot drain its bucket.
+        enforce_rate_limit("federation_submissions", str(federation.id))
         submission = FederationSubmission(
             **payload.model_dump(exclude={"access_token"}),
             status=FederationSubmissionStatus.QUEUED,
         )
+        await self.queue_submission(submission)
+        return FederationSubmissionRead.model_validate(submission)
+
+    async def queue_submission(self, submission: FederationSubmission) -> None:
+        """Persist ``submission`` and hand it to the ingestion workers."""
+
         self._session.add(submission)
         await self._session.commit()
         await self._session.refresh(submission)
 
-        await self._message_bus.publish("federation.submission", submission.id)
-        return FederationSubmissionRead.model_validate(submission)
+        try:
+            await self._message_bus.publish("federation.submission", submission.id)
+        except MessageBusBackpressureError:
+            submission.status = FederationSubmissionStatus.FAILED
+            submission.status_details = "Ingestion queue is full; please resubmit shortly."
+            await self._session.commit()
+            raise
 
     async def list_submissions(self) -> list[FederationSubmissionRead]:
         result = await self._session.execute(select(FederationSubmission))
         submissions = result.scalars().all()
         return [FederationSubmissionRead.model_validate(item) for item in submissions]
 
-    async def _validate_payload(self, payload: FederationSubmissionCreate) -> Federation:
-        parsed = urlparse(payload.payload_url)
-        if parsed.scheme not in {"https", "s3"}:
-            raise ValueError("Payload URL must be HTTPS or signed storage URL")
-        if not parsed.netloc:
-            raise ValueError("Payload URL must include a host")
-        token = payload.access_token.strip()
+    async def authenticate_federation(self, federation_name: str, access_token: str) -> Federation:
+        token = access_token.strip()
         if not token:
             raise ValueError("Federation access token is required")
 
         result = await self._session.execute(
-            select(Federation).where(Federation.name == payload.federation_name)
+            select(Federation).where(Federation.name == federation_name)
         )
         federation = result.scalar_one_or_none()
         if federation is None or not federation.ingest_token_hash:
@@ -60,6 +87,16 @@ class FederationIngestionService:
 
         return federation
 
+    def _validate_payload_url(self, payload_url: str) -> None:
+        parsed = urlparse(payload_url)
+        allowed_schemes = {"https", "s3"}
+        if SettingsSingleton().instance.ingestion_allow_local_payloads:
+            allowed_schemes |= {"http", "file"}
+        if parsed.scheme not in allowed_schemes:
+            raise ValueError("Payload URL must be HTTPS or signed storage URL")
+        if not parsed.netloc and parsed.scheme != "file":
+            raise ValueError("Payload URL must include a host")
+
 
 async def get_federation_service(
     session: AsyncSession = Depends(get_session),
@@ -68,37 +105,162 @@ async def get_federation_service(
 
 
 class FederationSubmissionProcessor:
+    """Imports queued submissions; a micro-batch is claimed in one transaction,
+    then each payload is streamed into the results tables chunk by chunk."""
+
     def __init__(self, message_bus: MessageBus | None = None) -> None:
+        settings = SettingsSingleton().instance
         self._bus = message_bus or MessageBus()
-        self._bus.subscribe("federation.submission", self._handle)
+        self._bus.configure_topic("federation.submission", workers=settings.ingestion_workers)
+        self._bus.subscribe_batch(
+            "federation.submission",
+            self._handle_batch,
+            max_batch_size=settings.ingestion_batch_size,
+            max_wait_ms=settings.ingestion_batch_wait_ms,
+        )
 
-    async def _handle(self, submission_id: int) -> None:
+    async def _handle_batch(self, submission_ids: list[int]) -> None:
+        for submission_id in await self._claim(submission_ids):
+            await self._import(submission_id)
+
+    async def _claim(self, submission_ids: list[int]) -> list[int]:
+        session = DatabaseSessionManager().session()
+        try:
+            result = await session.execute(
+                select(FederationSubmission).where(
+                    FederationSubmission.id.in_(set(submission_ids)),
+                    # PROCESSING covers redelivery after a worker died mid-import;
+                    # imports are idempotent so picking those up again is safe.
+                    FederationSubmission.status.in_(
+                        [FederationSubmissionStatus.QUEUED, FederationSubmissionStatus.PROCESSING]
+                    ),
+                )
+            )
+            submissions = result.scalars().all()
+            for submission in submissions:
+                submission.status = FederationSubmissionStatus.PROCESSING
+                submission.status_details = "Import in progress."
+            await session.commit()
+            # Import in publish order so a revision lands after the file it revises.
+            order = {submission_id: index for index, submission_id in enumerate(submission_ids)}
+            return sorted((submission.id for submission in submissions), key=order.__getitem__)
+        except Exception:
+            logger.exception("Unable to claim submissions %s", submission_ids)
+            await session.rollback()
+            await self._fail_batch(session, submission_ids)
+            return []
+        finally:
+            await session.close()
+
+    async def _import(self, submission_id: int) -> None:
+        settings = SettingsSingleton().instance
         session = DatabaseSessionManager().session()
         try:
             submission = await session.get(FederationSubmission, submission_id)
             if submission is None:
                 return
-            submission.status = FederationSubmissionStatus.PROCESSING
-            submission.processed_at = datetime.now(tz=timezone.utc)
-            session.add(submission)
-            await session.commit()
-
-            checksum = sha256(submission.payload_url.encode("utf-8")).hexdigest()
-            submission.checksum = checksum
-            submission.verified_at = datetime.now(tz=timezone.utc)
-            submission.status = FederationSubmissionStatus.PROCESSED
-            submission.status_details = "Validated payload URL and queued ingestion."
-            session.add(submission)
+            federation_id = await session.scalar(
+                select(Federation.id).where(Federation.name == submission.federation_name)
+            )
+            importer = ResultsImporter(session, federation_id, settings.ingestion_chunk_size)
+            spooled: SpooledPayload | None = None
+            try:
+                uploaded = local_payload_path(submission.payload_url, [settings.upload_dir])
+                if uploaded is not None:
+                    # Direct uploads are already on disk and were hashed as they
+                    # arrived; only files placed there some other way are read.
+                    spooled = await hash_local_payload(uploaded, submission.checksum)
+                else:
+                    spooled = await spool_payload(
+                        open_payload(
+                            submission.payload_url,
+                            allow_local=settings.ingestion_allow_local_payloads,
+                            timeout=settings.ingestion_fetch_timeout_seconds,
+                        )
+                    )
+                submission.checksum = spooled.checksum
+                previous = await self._latest_processed(session, submission)
+                if previous is not None and previous.checksum == spooled.checksum:
+                    self._finish(
+                        submission,
+                        FederationSubmissionStatus.PROCESSED,
+                        f"Identical to submission #{previous.id}; nothing to import.",
+                    )
+                else:
+                    report = await importer.import_payload(
+                        submission.payload_url, spooled.chunks()
+                    )
+                    imported = report.rows - report.rejected
+                    status = (
+                        FederationSubmissionStatus.PROCESSED
+                        if imported
+                        else FederationSubmissionStatus.FAILED
+                    )
+                    detail = (
+                        report.summary() if report.rows else "Payload contained no result rows."
+                    )
+                    self._finish(submission, status, detail)
+            except (PayloadFetchError, PayloadFormatError) as exc:
+                await session.rollback()
+                detail = str(exc)
+                if importer.report.rows:
+                    detail += f" (after {importer.report.rows} rows; {importer.report.summary()})"
+                self._finish(submission, FederationSubmissionStatus.FAILED, detail)
+            finally:
+                if spooled is not None:
+                    spooled.discard()
             await session.commit()
-        except Exception as exc:  # pragma: no cover - defensive fallback
-            if "submission" in locals() and submission is not None:
-                submission.status = FederationSubmissionStatus.FAILED
-                submission.status_details = str(exc)
-                session.add(submission)
-                await session.commit()
+        except Exception:
+            logger.exception("Import of submission %s failed", submission_id)
+            await session.rollback()
+            await self._fail_batch(session, [submission_id])
         finally:
             await session.close()
 
+    async def _latest_processed(
+        self, session: AsyncSession, submission: FederationSubmission
+    ) -> FederationSubmission | None:
+        """The federation's most recently imported submission.
+
+        Only that one can be skipped against: if anything was imported after an
+        identical file, re-importing it may legitimately revert those changes.
+        """
+
+        return await session.scalar(
+            select(FederationSubmission)
+            .where(
+                FederationSubmission.federation_name == submission.federation_name,
+                FederationSubmission.status == FederationSubmissionStatus.PROCESSED,
+                FederationSubmission.id != submission.id,
+            )
+            .order_by(FederationSubmission.processed_at.desc(), FederationSubmission.id.desc())
+            .limit(1)
+        )
+
+    def _finish(
+        self, submission: FederationSubmission, status: FederationSubmissionStatus, detail: str
+    ) -> None:
+        now = datetime.now(tz=timezone.utc)
+        submission.processed_at = now
+        if status == FederationSubmissionStatus.PROCESSED:
+            submission.verified_at = now
+        submission.status = status
+        submission.status_details = detail[:500]
+
+    async def _fail_batch(self, session: AsyncSession, submission_ids: list[int]) -> None:
+        try:
+            await session.execute(
+                update(FederationSubmission)
+                .where(FederationSubmission.id.in_(set(submission_ids)))
+                .values(
+                    status=FederationSubmissionStatus.FAILED,
+                    status_details="Processing failed unexpectedly; please resubmit.",
+                )
+            )
+            await session.commit()
+        except Exception:  # pragma: no cover - defensive fallback
+            logger.exception("Unable to mark submissions %s as failed", submission_ids)
+
 
 _processor = FederationSubmissionProcessor()
 
@@ -6,11 +6,13 @@ from datetime import datetime, timedelta, timezone
 from typing import Iterable
 
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.database import DatabaseSessionManager
-from app.models import Club, Event, EventDiscipline, EventEntry, Federation, Roster
+from app.core.trusted_rows import row_builder
+from app.models import Club, EventDiscipline, EventSession, Federation
 from app.schemas.event import (
     EventDetailRead,
     EventDisciplineRead,
@@ -31,6 +33,7 @@ from app.services.bootstrap import (
 )
 from app.services.events import EventsService
 from app.services.news import NewsService
+from app.services.recent_results import RecentResultsService
 
 
 def _fallback_events() -> list[EventRead]:
@@ -330,8 +333,10 @@ def _ensure_list(value: Iterable) -> list:
     return list(value) if value else []
 
 
-async def get_home_snapshot() -> HomeSnapshot:
-    session = DatabaseSessionManager().session()
+async def get_home_snapshot(session: AsyncSession | None = None) -> HomeSnapshot:
+    owns_session = session is None
+    if session is None:
+        session = DatabaseSessionManager().session()
     federations: list[HomeFederation] = []
     recent_results: list[HomeResult] = []
     try:
@@ -348,12 +353,13 @@ async def get_home_snapshot() -> HomeSnapshot:
         )
         federation_entities = federations_result.scalars().unique().all()
 
+        build_roster = row_builder(HomeRoster)
         federations = []
         for federation in federation_entities:
             clubs: list[HomeClub] = []
             for club in sorted(federation.clubs, key=lambda item: item.name.lower()):
                 rosters = [
-                    HomeRoster(
+                    build_roster(
                         id=roster.id,
                         name=roster.name,
                         division=roster.division,
@@ -385,70 +391,21 @@ async def get_home_snapshot() -> HomeSnapshot:
                 )
             )
 
-        recent_rows = await session.execute(
-            select(
-                EventEntry.id.label("entry_id"),
-                EventEntry.updated_at,
-                EventEntry.athlete_name,
-                EventEntry.team_name,
-                EventEntry.position,
-                EventEntry.result,
-                EventEntry.points,
-                Event.id.label("event_id"),
-                Event.name.label("event_name"),
-                EventDiscipline.id.label("discipline_id"),
-                EventDiscipline.name.label("discipline_name"),
-                Federation.id.label("federation_id"),
-                Federation.name.label("federation_name"),
-                Roster.id.label("roster_id"),
-                Roster.name.label("roster_name"),
-                Club.id.label("club_id"),
-                Club.name.label("club_name"),
-            )
-            .select_from(EventEntry)
-            .join(EventDiscipline, EventEntry.discipline_id == EventDiscipline.id)
-            .join(Event, EventDiscipline.event_id == Event.id)
-            .outerjoin(Federation, Event.federation_id == Federation.id)
-            .outerjoin(Roster, EventEntry.roster_id == Roster.id)
-            .outerjoin(Club, Roster.club_id == Club.id)
-            .order_by(EventEntry.updated_at.desc())
-            .limit(12)
-        )
-
-        recent_results = [
-            HomeResult(
-                entry_id=row.entry_id,
-                event_id=row.event_id,
-                event_name=row.event_name,
-                discipline_id=row.discipline_id,
-                discipline_name=row.discipline_name,
-                athlete_name=row.athlete_name,
-                team_name=row.team_name,
-                position=row.position,
-                result=row.result,
-                points=row.points,
-                roster_id=row.roster_id,
-                roster_name=row.roster_name or row.team_name,
-                club_id=row.club_id,
-                club_name=row.club_name,
-                federation_id=row.federation_id,
-                federation_name=row.federation_name,
-                updated_at=row.updated_at,
-            )
-            for row in recent_rows
-        ]
+        recent_results = await RecentResultsService(session).list_recent(limit=12)
 
+        # The first event with a programme, found from the event_id indexes
+        # instead of loading every event's detail in turn.
         live_event: EventDetailRead | None = None
-        for event in events:
-            try:
-                detail = await events_service.get_event_detail(event.id)
-            except HTTPException:
-                continue
-            if detail.disciplines or detail.sessions:
-                live_event = detail
-                break
+        candidates = [
+            await session.scalar(select(func.min(EventDiscipline.event_id))),
+            await session.scalar(select(func.min(EventSession.event_id))),
+        ]
+        candidates = [event_id for event_id in candidates if event_id is not None]
+        if candidates:
+            live_event = await events_service.get_event_detail(min(candidates))
     finally:
-        await session.close()
+        if owns_session:
+            await session.close()
 
     events_list = _ensure_list(events) or _fallback_events()
     federations_list = federations or _fallback_federations()
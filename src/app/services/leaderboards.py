@@ -0,0 +1,304 @@
+"""Season leaderboards: each athlete's best mark per discipline and category.
+
+Boards live in ``leaderboard_entries`` and are kept current as entries are
+written, instead of being aggregated from ``event_entries`` on request.
+Writers pass the entries they touched to ``LeaderboardService.record``,
+which compares each one with the athlete's stored season best. It inserts
+or improves that row, and only re-queries the athlete's entries when the
+entry that held the best got worse or lost its mark. Every entry counts for
+its own category and for the open list (``ALL_CATEGORIES``). Marks whose
+unit does not match the discipline (a time recorded for a jump) are left
+out. Reading a page is one range scan over the ranking index.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import date
+from typing import NamedTuple
+
+from fastapi import Depends, HTTPException
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_session
+from app.domain.marks import discipline_unit, lower_is_better
+from app.models import Event, EventDiscipline, EventEntry, LeaderboardEntry, MarkUnit
+from app.models.leaderboard import ALL_CATEGORIES
+from app.schemas.leaderboard import LeaderboardRead, LeaderboardRow
+
+# (discipline, season, category, athlete_name)
+BoardKey = tuple[str, int, str, str]
+
+
+class LeaderboardCandidate(NamedTuple):
+    entry_id: int
+    discipline: str
+    category: str | None
+    athlete_name: str
+    team_name: str | None
+    mark_value: float | None
+    mark_unit: MarkUnit | None
+    result: str | None
+    event_id: int
+    achieved_on: date
+
+
+def candidate_for(
+    entry: EventEntry, discipline: EventDiscipline, event: Event
+) -> LeaderboardCandidate:
+    return LeaderboardCandidate(
+        entry_id=entry.id,
+        discipline=discipline.name,
+        category=discipline.category,
+        athlete_name=entry.athlete_name,
+        team_name=entry.team_name,
+        mark_value=entry.mark_value,
+        mark_unit=entry.mark_unit,
+        result=entry.result,
+        event_id=event.id,
+        achieved_on=event.start_date,
+    )
+
+
+class LeaderboardService:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_leaderboard(
+        self,
+        discipline: str,
+        season: int | None = None,
+        category: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> LeaderboardRead:
+        unit = discipline_unit(discipline)
+        if season is None:
+            season = await self._session.scalar(
+                select(func.max(LeaderboardEntry.season)).where(
+                    LeaderboardEntry.discipline == discipline
+                )
+            )
+            if season is None:
+                raise HTTPException(status_code=404, detail="No results for discipline")
+        result = await self._session.execute(
+            select(LeaderboardEntry)
+            .where(
+                LeaderboardEntry.discipline == discipline,
+                LeaderboardEntry.season == season,
+                LeaderboardEntry.category == (category or ALL_CATEGORIES),
+            )
+            .order_by(_ranking(unit), LeaderboardEntry.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        rows = [
+            LeaderboardRow(
+                rank=offset + index,
+                athlete_name=row.athlete_name,
+                team_name=row.team_name,
+                mark_value=row.mark_value,
+                result=row.result,
+                event_id=row.event_id,
+                entry_id=row.entry_id,
+                achieved_on=row.achieved_on,
+            )
+            for index, row in enumerate(result.scalars().all(), start=1)
+        ]
+        return LeaderboardRead(
+            discipline=discipline,
+            season=season,
+            category=category,
+            unit=unit,
+            lower_is_better=lower_is_better(unit),
+            limit=limit,
+            offset=offset,
+            entries=rows,
+        )
+
+    async def record(self, candidates: Iterable[LeaderboardCandidate]) -> None:
+        """Fold written entries into the boards; the caller commits."""
+
+        best: dict[BoardKey, LeaderboardCandidate] = {}
+        touched: dict[BoardKey, set[int]] = defaultdict(set)
+        for candidate in candidates:
+            unit = discipline_unit(candidate.discipline)
+            for key in _keys(candidate):
+                touched[key].add(candidate.entry_id)
+                if candidate.mark_value is None or candidate.mark_unit != unit:
+                    continue
+                current = best.get(key)
+                if current is None or _better(candidate.mark_value, current.mark_value, unit):
+                    best[key] = candidate
+        if not touched:
+            return
+
+        entry_ids = {entry_id for ids in touched.values() for entry_id in ids}
+        result = await self._session.execute(
+            select(LeaderboardEntry).where(
+                or_(
+                    and_(
+                        LeaderboardEntry.discipline.in_({key[0] for key in touched}),
+                        LeaderboardEntry.athlete_name.in_({key[3] for key in touched}),
+                    ),
+                    LeaderboardEntry.entry_id.in_(entry_ids),
+                )
+            )
+        )
+        existing = {_row_key(row): row for row in result.scalars().all()}
+        stale: list[BoardKey] = []
+        for key, row in existing.items():
+            if key not in touched and row.entry_id in entry_ids:
+                # The entry moved to another athlete or discipline.
+                stale.append(key)
+        for key, ids in touched.items():
+            row = existing.get(key)
+            candidate = best.get(key)
+            if row is None:
+                if candidate is not None:
+                    self._session.add(_new_row(key, candidate))
+            elif candidate is not None and _better(
+                candidate.mark_value, row.mark_value, discipline_unit(key[0])
+            ):
+                _assign(row, candidate)
+            elif row.entry_id in ids:
+                # The entry holding the season best got worse or lost its mark.
+                stale.append(key)
+        await self.refresh(stale)
+
+    async def rebuild(self, batch_size: int = 1000) -> None:
+        """Recompute every board from all entries, e.g. when the table is new.
+
+        Entries are folded in through ``record`` in id order, so a rebuild
+        ranks marks exactly as live writes do. The caller commits.
+        """
+
+        await self._session.execute(delete(LeaderboardEntry))
+        # Plain columns in ``LeaderboardCandidate`` order: this also runs while
+        # ensure_schema upgrades older databases, whose other tables may still
+        # lack columns the ORM entities would load.
+        statement = (
+            select(
+                EventEntry.id,
+                EventDiscipline.name,
+                EventDiscipline.category,
+                EventEntry.athlete_name,
+                EventEntry.team_name,
+                EventEntry.mark_value,
+                EventEntry.mark_unit,
+                EventEntry.result,
+                Event.id,
+                Event.start_date,
+            )
+            .join(EventDiscipline, EventEntry.discipline_id == EventDiscipline.id)
+            .join(Event, EventDiscipline.event_id == Event.id)
+            .where(EventEntry.mark_value.is_not(None))
+            .order_by(EventEntry.id)
+            .limit(batch_size)
+        )
+        last_id = 0
+        while True:
+            rows = (await self._session.execute(statement.where(EventEntry.id > last_id))).all()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            await self.record(LeaderboardCandidate(*row) for row in rows)
+
+    async def keys_for_entries(self, entry_ids: Iterable[int]) -> list[BoardKey]:
+        """Boards that an entry holds a place on, e.g. before deleting it."""
+
+        result = await self._session.execute(
+            select(LeaderboardEntry).where(LeaderboardEntry.entry_id.in_(set(entry_ids)))
+        )
+        return [_row_key(row) for row in result.scalars().all()]
+
+    async def refresh(self, keys: Iterable[BoardKey]) -> None:
+        """Recompute the given athletes' season bests from their entries."""
+
+        for key in keys:
+            discipline, season, category, athlete_name = key
+            unit = discipline_unit(discipline)
+            statement = (
+                select(EventEntry, EventDiscipline, Event)
+                .join(EventDiscipline, EventEntry.discipline_id == EventDiscipline.id)
+                .join(Event, EventDiscipline.event_id == Event.id)
+                .where(
+                    EventDiscipline.name == discipline,
+                    EventEntry.athlete_name == athlete_name,
+                    EventEntry.mark_unit == unit,
+                    EventEntry.mark_value.is_not(None),
+                    Event.start_date >= date(season, 1, 1),
+                    Event.start_date < date(season + 1, 1, 1),
+                )
+                .order_by(_ranking(unit, EventEntry.mark_value), EventEntry.id)
+                .limit(1)
+            )
+            if category != ALL_CATEGORIES:
+                statement = statement.where(EventDiscipline.category == category)
+            found = (await self._session.execute(statement)).first()
+            row = await self._session.scalar(select(LeaderboardEntry).where(*_key_filter(key)))
+            if found is None:
+                if row is not None:
+                    await self._session.execute(
+                        delete(LeaderboardEntry).where(LeaderboardEntry.id == row.id)
+                    )
+            elif row is None:
+                self._session.add(_new_row(key, candidate_for(*found)))
+            else:
+                _assign(row, candidate_for(*found))
+
+
+def _keys(candidate: LeaderboardCandidate) -> list[BoardKey]:
+    season = candidate.achieved_on.year
+    keys = [(candidate.discipline, season, ALL_CATEGORIES, candidate.athlete_name)]
+    if candidate.category:
+        keys.append((candidate.discipline, season, candidate.category, candidate.athlete_name))
+    return keys
+
+
+def _row_key(row: LeaderboardEntry) -> BoardKey:
+    return (row.discipline, row.season, row.category, row.athlete_name)
+
+
+def _key_filter(key: BoardKey) -> tuple:
+    discipline, season, category, athlete_name = key
+    return (
+        LeaderboardEntry.discipline == discipline,
+        LeaderboardEntry.season == season,
+        LeaderboardEntry.category == category,
+        LeaderboardEntry.athlete_name == athlete_name,
+    )
+
+
+def _better(value: float, other: float, unit: MarkUnit) -> bool:
+    return value < other if lower_is_better(unit) else value > other
+
+
+def _ranking(unit: MarkUnit, column=LeaderboardEntry.mark_value):
+    return column.asc() if lower_is_better(unit) else column.desc()
+
+
+def _new_row(key: BoardKey, candidate: LeaderboardCandidate) -> LeaderboardEntry:
+    discipline, season, category, athlete_name = key
+    row = LeaderboardEntry(
+        discipline=discipline, season=season, category=category, athlete_name=athlete_name
+    )
+    _assign(row, candidate)
+    return row
+
+
+def _assign(row: LeaderboardEntry, candidate: LeaderboardCandidate) -> None:
+    row.team_name = candidate.team_name
+    row.mark_value = candidate.mark_value
+    row.result = candidate.result
+    row.entry_id = candidate.entry_id
+    row.event_id = candidate.event_id
+    row.achieved_on = candidate.achieved_on
+
+
+async def get_leaderboard_service(
+    session: AsyncSession = Depends(get_session),
+) -> LeaderboardService:
+    return LeaderboardService(session)
@@ -5,6 +5,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_session
+from app.core.trusted_rows import row_loader
 from app.models import NewsArticle
 from app.schemas.news import NewsCreate, NewsRead
 
@@ -33,7 +34,8 @@ class NewsService:
             select(NewsArticle).order_by(NewsArticle.published_at.desc())
         )
         articles = result.scalars().all()
-        return [NewsRead.model_validate(item) for item in articles]
+        load = row_loader(NewsRead)
+        return [load(item) for item in articles]
 
 
 async def get_news_service(session: AsyncSession = Depends(get_session)) -> NewsService:
@@ -0,0 +1,158 @@
+"""Recent-results feed shown on the landing page.
+
+Reading the latest entries straight from ``event_entries`` means joining
+events, disciplines, federations, rosters and clubs and sorting by
+``updated_at`` on every page view. ``recent_results`` instead keeps a
+denormalized copy of the newest ``FEED_SIZE`` entries. Writers pass the ids
+they touched to ``RecentResultsService.record`` in the same transaction,
+and the page becomes a single read over the ``(updated_at, id)`` index.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.trusted_rows import row_builder
+from app.models import Club, Event, EventDiscipline, EventEntry, Federation, RecentResult, Roster
+from app.schemas.home import HomeResult
+
+# Rows kept in the feed; comfortably more than any page shows.
+FEED_SIZE = 50
+
+_FEED_COLUMNS = (
+    "entry_id",
+    "event_id",
+    "event_name",
+    "discipline_id",
+    "discipline_name",
+    "athlete_name",
+    "team_name",
+    "position",
+    "result",
+    "points",
+    "roster_id",
+    "roster_name",
+    "club_id",
+    "club_name",
+    "federation_id",
+    "federation_name",
+    "updated_at",
+)
+
+
+def feed_source():
+    """Entries joined with the names the feed stores, in feed column order."""
+
+    return (
+        select(
+            EventEntry.id,
+            Event.id,
+            Event.name,
+            EventDiscipline.id,
+            EventDiscipline.name,
+            EventEntry.athlete_name,
+            EventEntry.team_name,
+            EventEntry.position,
+            EventEntry.result,
+            EventEntry.points,
+            Roster.id,
+            Roster.name,
+            Club.id,
+            Club.name,
+            Federation.id,
+            Federation.name,
+            EventEntry.updated_at,
+        )
+        .select_from(EventEntry)
+        .join(EventDiscipline, EventEntry.discipline_id == EventDiscipline.id)
+        .join(Event, EventDiscipline.event_id == Event.id)
+        .outerjoin(Federation, Event.federation_id == Federation.id)
+        .outerjoin(Roster, EventEntry.roster_id == Roster.id)
+        .outerjoin(Club, Roster.club_id == Club.id)
+    )
+
+
+class RecentResultsService:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def list_recent(self, limit: int = 12) -> list[HomeResult]:
+        result = await self._session.execute(
+            select(RecentResult)
+            .order_by(RecentResult.updated_at.desc(), RecentResult.id.desc())
+            .limit(limit)
+        )
+        build = row_builder(HomeResult)
+        return [
+            build(
+                entry_id=row.entry_id,
+                event_id=row.event_id,
+                event_name=row.event_name,
+                discipline_id=row.discipline_id,
+                discipline_name=row.discipline_name,
+                athlete_name=row.athlete_name,
+                team_name=row.team_name,
+                position=row.position,
+                result=row.result,
+                points=row.points,
+                roster_id=row.roster_id,
+                roster_name=row.roster_name or row.team_name,
+                club_id=row.club_id,
+                club_name=row.club_name,
+                federation_id=row.federation_id,
+                federation_name=row.federation_name,
+                updated_at=row.updated_at,
+            )
+            for row in result.scalars().all()
+        ]
+
+    async def record(self, entry_ids: Sequence[int]) -> None:
+        """Move written entries to the head of the feed; the caller commits.
+
+        Only the last ``FEED_SIZE`` ids can still be in the feed afterwards,
+        so a large import copies at most that many rows.
+        """
+
+        entry_ids = list(dict.fromkeys(entry_ids))[-FEED_SIZE:]
+        if not entry_ids:
+            return
+        await self._session.execute(
+            delete(RecentResult).where(RecentResult.entry_id.in_(entry_ids))
+        )
+        await self._session.execute(
+            insert(RecentResult).from_select(
+                _FEED_COLUMNS, feed_source().where(EventEntry.id.in_(entry_ids))
+            )
+        )
+        await self._trim()
+
+    async def rebuild(self) -> None:
+        """Refill the feed from the newest entries, e.g. after deleting some.
+
+        Served by the ``updated_at`` index on ``event_entries``.
+        """
+
+        await self._session.execute(delete(RecentResult))
+        await self._session.execute(
+            insert(RecentResult).from_select(
+                _FEED_COLUMNS,
+                feed_source()
+                .order_by(EventEntry.updated_at.desc(), EventEntry.id.desc())
+                .limit(FEED_SIZE),
+            )
+        )
+
+    async def _trim(self) -> None:
+        newest = (
+            select(RecentResult.id)
+            .order_by(RecentResult.updated_at.desc(), RecentResult.id.desc())
+            .limit(FEED_SIZE)
+        )
+        await self._session.execute(
+            delete(RecentResult)
+            .where(RecentResult.id.not_in(newest))
+            .execution_options(synchronize_session=False)
+        )
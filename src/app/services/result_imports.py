@@ -0,0 +1,384 @@
+"""Bulk import of normalized result rows into events, disciplines and entries.
+
+Parsing and normalization run in ``ResultsParsePool`` (a process pool) a few
+blocks ahead of the database writes; only compact ``ParsedBlock`` results
+come back to the event loop. Rows are then written in chunks of
+``chunk_size`` with a handful of set-based statements and a commit per chunk,
+so memory stays bounded no matter how large the payload is. Imports are idempotent: events are
+matched on (federation, name, start date), disciplines on (event, name,
+category, round) and entries on bib, or athlete name when no bib is given, so
+re-running a submission updates rows instead of duplicating them. Each entry
+stores the fingerprint of the row that last wrote it, and rows whose
+fingerprint is unchanged are not written again. Written rows are folded into
+the season leaderboards, event standings and recent-results feed in the same
+transaction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import date
+from threading import Lock
+from typing import Any, NamedTuple
+
+from sqlalchemy import insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import SettingsSingleton
+from app.core.singleton import SingletonMeta
+from app.domain.results_feed import ParsedBlock, ParsedRow, ResultRow, iter_blocks
+from app.models import Event, EventDiscipline, EventEntry
+from app.services.leaderboards import LeaderboardCandidate, LeaderboardService
+from app.services.recent_results import RecentResultsService
+from app.services.standings import StandingsContribution, StandingsService
+
+MAX_REPORTED_ERRORS = 10
+
+EventKey = tuple[str, date]
+DisciplineKey = tuple[int, str, str | None, str | None]
+EntryKey = tuple[int, str, str]
+
+
+class ExistingEntry(NamedTuple):
+    id: int
+    fingerprint: str | None
+    team_name: str | None
+    roster_id: int | None
+    points: int | None
+
+
+@dataclass
+class ImportReport:
+    rows: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    rejected: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def add_block(self, block: ParsedBlock) -> None:
+        self.rows += block.records
+        self.rejected += block.rejected
+        for line_number, message in block.errors[: MAX_REPORTED_ERRORS - len(self.errors)]:
+            self.errors.append(f"line {line_number}: {message}")
+
+    def summary(self, limit: int = 500) -> str:
+        text = (
+            f"Imported {self.rows - self.rejected} of {self.rows} rows "
+            f"({self.inserted} new, {self.updated} updated, {self.unchanged} unchanged, "
+            f"{self.rejected} rejected)."
+        )
+        if self.errors:
+            text += " Errors: " + "; ".join(self.errors)
+            if self.rejected > len(self.errors):
+                text += f"; +{self.rejected - len(self.errors)} more"
+        return text if len(text) <= limit else text[: limit - 3] + "..."
+
+
+class ResultsParsePool(metaclass=SingletonMeta):
+    """Process pool for the CPU-bound parse and normalize stage of imports.
+
+    Sized by ``Settings.ingestion_parse_workers`` (all cores when unset); ``0``
+    parses inline on the event loop. Workers are spawned rather than forked so
+    they never inherit the API process's threads and open connections.
+    """
+
+    def __init__(self) -> None:
+        self._executor: ProcessPoolExecutor | None = None
+        self._workers: int | None = None
+        self._lock = Lock()
+
+    @property
+    def workers(self) -> int:
+        if self._workers is None:
+            configured = SettingsSingleton().instance.ingestion_parse_workers
+            if configured is None:
+                configured = os.cpu_count() or 1
+            self._workers = max(0, configured)
+        return self._workers
+
+    @property
+    def max_in_flight(self) -> int:
+        """Blocks parsed ahead of the writer: enough to keep every worker busy."""
+
+        return max(1, self.workers * 2)
+
+    def submit(self, func: Callable[..., ParsedBlock], *args: Any) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        if executor is None:
+            future = loop.create_future()
+            try:
+                future.set_result(func(*args))
+            except Exception as exc:
+                future.set_exception(exc)
+            return future
+        return loop.run_in_executor(executor, func, *args)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_executor(self) -> ProcessPoolExecutor | None:
+        if self.workers == 0:
+            return None
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._executor
+
+
+class ResultsImporter:
+    def __init__(
+        self, session: AsyncSession, federation_id: int | None, chunk_size: int = 1000
+    ) -> None:
+        self._session = session
+        self._federation_id = federation_id
+        self._chunk_size = max(1, chunk_size)
+        self.report = ImportReport()
+        self._pending: list[ParsedRow] = []
+        self._events: dict[EventKey, tuple[int, date]] = {}
+        self._disciplines: dict[DisciplineKey, int] = {}
+
+    async def import_payload(self, url: str, chunks: AsyncIterator[bytes]) -> ImportReport:
+        """Stream ``chunks`` into the database; ``self.report`` tracks progress."""
+
+        pool = ResultsParsePool()
+        in_flight: deque[asyncio.Future] = deque()
+        try:
+            async for func, args in iter_blocks(url, chunks):
+                in_flight.append(pool.submit(func, *args))
+                if len(in_flight) >= pool.max_in_flight:
+                    await self._apply(await in_flight.popleft())
+            while in_flight:
+                await self._apply(await in_flight.popleft())
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM); start a fresh pool for the next import.
+            pool.shutdown()
+            raise
+        finally:
+            for future in in_flight:
+                future.cancel()
+        if self._pending:
+            await self._write_chunk(self._pending, self.report)
+            self._pending = []
+        return self.report
+
+    async def _apply(self, block: ParsedBlock) -> None:
+        self.report.add_block(block)
+        for row in block.rows:
+            self._pending.append(row)
+            if len(self._pending) >= self._chunk_size:
+                await self._write_chunk(self._pending, self.report)
+                self._pending = []
+
+    async def _write_chunk(self, batch: list[ParsedRow], report: ImportReport) -> None:
+        entries: dict[EntryKey, dict[str, Any]] = {}
+        sources: dict[EntryKey, ResultRow] = {}
+        for _, row, fingerprint in batch:
+            discipline_id = await self._discipline_id(row)
+            values = {
+                "discipline_id": discipline_id,
+                "athlete_name": row.athlete_name,
+                "team_name": row.team_name,
+                "bib": row.bib,
+                "lane": row.lane,
+                "status": row.status,
+                "position": row.position,
+                "result": row.result,
+                "mark_value": row.mark_value,
+                "mark_unit": row.mark_unit,
+                "points": row.points,
+                "notes": row.notes,
+                "fingerprint": fingerprint,
+            }
+            # Later rows for the same athlete win, matching what a re-import does.
+            key = _entry_key(discipline_id, row.bib, row.athlete_name)
+            entries[key] = values
+            sources[key] = row
+
+        existing = await self._existing_entries(entries)
+        inserts: list[dict[str, Any]] = []
+        inserted_keys: list[EntryKey] = []
+        updates: list[dict[str, Any]] = []
+        written: list[tuple[int, ResultRow]] = []
+        removed: list[StandingsContribution] = []
+        added: list[StandingsContribution] = []
+        unchanged = 0
+        for key, values in entries.items():
+            match = existing.get(key)
+            row = sources[key]
+            if match is None:
+                inserts.append(values)
+                inserted_keys.append(key)
+                added.append(self._contribution(row, None))
+            elif match.fingerprint == values["fingerprint"]:
+                # Revisions of a file usually change a handful of rows; skip the rest.
+                unchanged += 1
+            else:
+                updates.append({"id": match.id, **values})
+                written.append((match.id, row))
+                # Imports never set rosters, so an entry keeps the one it had.
+                removed.append(
+                    StandingsContribution(
+                        self._events[(row.event, row.event_date)][0],
+                        match.team_name,
+                        match.roster_id,
+                        match.points,
+                    )
+                )
+                added.append(self._contribution(row, match.roster_id))
+        if inserts:
+            result = await self._session.execute(
+                insert(EventEntry).returning(EventEntry.id, sort_by_parameter_order=True),
+                inserts,
+            )
+            written.extend(
+                (entry_id, sources[key])
+                for entry_id, key in zip(result.scalars().all(), inserted_keys)
+            )
+        if updates:
+            await self._session.execute(update(EventEntry), updates)
+        if written:
+            await LeaderboardService(self._session).record(
+                self._candidate(entry_id, row) for entry_id, row in written
+            )
+            await StandingsService(self._session).apply(removed=removed, added=added)
+            await RecentResultsService(self._session).record(
+                [entry_id for entry_id, _ in written]
+            )
+        await self._session.commit()
+        report.inserted += len(inserts)
+        report.updated += len(updates)
+        report.unchanged += unchanged
+
+    def _contribution(self, row: ResultRow, roster_id: int | None) -> StandingsContribution:
+        event_id, _ = self._events[(row.event, row.event_date)]
+        return StandingsContribution(event_id, row.team_name, roster_id, row.points)
+
+    def _candidate(self, entry_id: int, row: ResultRow) -> LeaderboardCandidate:
+        event_id, _ = self._events[(row.event, row.event_date)]
+        return LeaderboardCandidate(
+            entry_id=entry_id,
+            discipline=row.discipline,
+            category=row.category,
+            athlete_name=row.athlete_name,
+            team_name=row.team_name,
+            mark_value=row.mark_value,
+            mark_unit=row.mark_unit,
+            result=row.result,
+            event_id=event_id,
+            achieved_on=row.event_date,
+        )
+
+    async def _existing_entries(
+        self, entries: dict[EntryKey, dict[str, Any]]
+    ) -> dict[EntryKey, ExistingEntry]:
+        discipline_ids = {key[0] for key in entries}
+        bibs = {key[2] for key in entries if key[1] == "bib"}
+        names = {key[2] for key in entries if key[1] == "name"}
+        conditions = []
+        if bibs:
+            conditions.append(EventEntry.bib.in_(bibs))
+        if names:
+            conditions.append(EventEntry.athlete_name.in_(names))
+        result = await self._session.execute(
+            select(
+                EventEntry.id,
+                EventEntry.discipline_id,
+                EventEntry.bib,
+                EventEntry.athlete_name,
+                EventEntry.fingerprint,
+                EventEntry.team_name,
+                EventEntry.roster_id,
+                EventEntry.points,
+            )
+            .where(EventEntry.discipline_id.in_(discipline_ids))
+            .where(or_(*conditions))
+        )
+        existing: dict[EntryKey, ExistingEntry] = {}
+        for row in result.all():
+            match = ExistingEntry(row.id, row.fingerprint, row.team_name, row.roster_id, row.points)
+            existing.setdefault((row.discipline_id, "name", row.athlete_name), match)
+            if row.bib:
+                existing.setdefault((row.discipline_id, "bib", row.bib), match)
+        return existing
+
+    async def _event_id(self, row: ResultRow) -> int:
+        key = (row.event, row.event_date)
+        cached = self._events.get(key)
+        if cached is None:
+            result = await self._session.execute(
+                select(Event.id, Event.end_date).where(
+                    Event.federation_id == self._federation_id,
+                    Event.name == row.event,
+                    Event.start_date == row.event_date,
+                )
+            )
+            found = result.first()
+            if found is None:
+                event = Event(
+                    name=row.event,
+                    location=row.location,
+                    start_date=row.event_date,
+                    end_date=row.event_end_date,
+                    federation_id=self._federation_id,
+                )
+                self._session.add(event)
+                await self._session.flush()
+                cached = (event.id, event.end_date)
+            else:
+                cached = (found.id, found.end_date)
+            self._events[key] = cached
+        event_id, end_date = cached
+        if row.event_end_date > end_date:
+            await self._session.execute(
+                update(Event).where(Event.id == event_id).values(end_date=row.event_end_date)
+            )
+            self._events[key] = (event_id, row.event_end_date)
+        return event_id
+
+    async def _discipline_id(self, row: ResultRow) -> int:
+        event_id = await self._event_id(row)
+        key = (event_id, row.discipline, row.category, row.round_name)
+        discipline_id = self._disciplines.get(key)
+        if discipline_id is not None:
+            return discipline_id
+        result = await self._session.execute(
+            select(EventDiscipline.id).where(
+                EventDiscipline.event_id == event_id,
+                EventDiscipline.name == row.discipline,
+                EventDiscipline.category == row.category,
+                EventDiscipline.round_name == row.round_name,
+            )
+        )
+        discipline_id = result.scalars().first()
+        if discipline_id is None:
+            discipline = EventDiscipline(
+                event_id=event_id,
+                name=row.discipline,
+                category=row.category,
+                round_name=row.round_name,
+            )
+            self._session.add(discipline)
+            await self._session.flush()
+            discipline_id = discipline.id
+        self._disciplines[key] = discipline_id
+        return discipline_id
+
+
+def _entry_key(discipline_id: int, bib: str | None, athlete_name: str) -> EntryKey:
+    return (discipline_id, "bib", bib) if bib else (discipline_id, "name", athlete_name)
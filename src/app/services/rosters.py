@@ -5,6 +5,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_session
+from app.core.trusted_rows import row_builder
 from app.models import Club, Federation, Roster
 from app.repositories.user import RosterRepository
 from app.schemas.roster import RosterCreate, RosterDetail, RosterRead
@@ -52,8 +53,9 @@ class RostersService:
         )
         result = await self._session.execute(stmt)
         rows = result.all()
+        build = row_builder(RosterRead)
         return [
-            RosterRead(
+            build(
                 id=roster.id,
                 name=roster.name,
                 country=roster.country,
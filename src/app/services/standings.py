@@ -0,0 +1,204 @@
+"""Live points standings per event for teams, rosters, clubs and federations.
+
+``event_standings`` keeps one running total per (event, scope, key). Writers
+describe an entry's scoring before and after a change as
+``StandingsContribution`` values, and ``StandingsService.apply`` turns the
+difference into ``points = points + delta`` updates. A results table is then
+one indexed read that does not depend on how many entries the event has.
+Entries only score when they have ``points``. Rosters are attributed to
+their club and to the club's federation.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from fastapi import Depends
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_session
+from app.models import (
+    Club,
+    EventDiscipline,
+    EventEntry,
+    EventStanding,
+    Federation,
+    Roster,
+    StandingScope,
+)
+from app.schemas.standing import EventStandingsRead, StandingRow
+
+StandingKey = tuple[int, StandingScope, str]
+
+
+class StandingsContribution(NamedTuple):
+    event_id: int
+    team_name: str | None
+    roster_id: int | None
+    points: int | None
+
+
+def contribution_for(entry: EventEntry, event_id: int) -> StandingsContribution:
+    return StandingsContribution(event_id, entry.team_name, entry.roster_id, entry.points)
+
+
+class StandingsService:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_standings(
+        self, event_id: int, scope: StandingScope, limit: int = 100
+    ) -> EventStandingsRead:
+        result = await self._session.execute(
+            select(EventStanding)
+            .where(EventStanding.event_id == event_id, EventStanding.scope == scope)
+            .order_by(EventStanding.points.desc(), EventStanding.label)
+            .limit(limit)
+        )
+        rows = [
+            StandingRow(
+                rank=index,
+                key=row.scope_key,
+                label=row.label,
+                points=row.points,
+                entries=row.entries,
+            )
+            for index, row in enumerate(result.scalars().all(), start=1)
+        ]
+        return EventStandingsRead(event_id=event_id, scope=scope, rows=rows)
+
+    async def apply(
+        self,
+        removed: Iterable[StandingsContribution] = (),
+        added: Iterable[StandingsContribution] = (),
+    ) -> None:
+        """Move totals from ``removed`` to ``added`` scoring; the caller commits."""
+
+        removed, added = list(removed), list(added)
+        labels = await self._roster_labels(
+            {item.roster_id for item in (*removed, *added) if item.roster_id is not None}
+        )
+        deltas: dict[StandingKey, list] = defaultdict(lambda: ["", 0, 0])
+        for sign, contributions in ((-1, removed), (1, added)):
+            for contribution in contributions:
+                if contribution.points is None:
+                    continue
+                for key, label in self._scoring_keys(contribution, labels):
+                    delta = deltas[key]
+                    delta[0] = label
+                    delta[1] += sign * contribution.points
+                    delta[2] += sign
+
+        events: set[int] = set()
+        for (event_id, scope, scope_key), (label, points, entries) in deltas.items():
+            if not points and not entries:
+                continue
+            events.add(event_id)
+            result = await self._session.execute(
+                update(EventStanding)
+                .where(
+                    EventStanding.event_id == event_id,
+                    EventStanding.scope == scope,
+                    EventStanding.scope_key == scope_key,
+                )
+                .values(
+                    points=EventStanding.points + points,
+                    entries=EventStanding.entries + entries,
+                    label=label,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 0 and entries > 0:
+                self._session.add(
+                    EventStanding(
+                        event_id=event_id,
+                        scope=scope,
+                        scope_key=scope_key,
+                        label=label,
+                        points=points,
+                        entries=entries,
+                    )
+                )
+        if events:
+            await self._session.execute(
+                delete(EventStanding)
+                .where(EventStanding.event_id.in_(events), EventStanding.entries <= 0)
+                .execution_options(synchronize_session=False)
+            )
+
+    async def rebuild(self, batch_size: int = 1000) -> None:
+        """Recompute every event's totals from its entries; the caller commits.
+
+        Entries go through ``apply`` in id order, so rebuilt totals score
+        exactly as live writes do.
+        """
+
+        await self._session.execute(delete(EventStanding))
+        # Plain columns in ``StandingsContribution`` order, as ensure_schema
+        # also runs this on older databases whose tables lack newer columns.
+        statement = (
+            select(
+                EventEntry.id,
+                EventDiscipline.event_id,
+                EventEntry.team_name,
+                EventEntry.roster_id,
+                EventEntry.points,
+            )
+            .join(EventDiscipline, EventEntry.discipline_id == EventDiscipline.id)
+            .where(EventEntry.points.is_not(None))
+            .order_by(EventEntry.id)
+            .limit(batch_size)
+        )
+        last_id = 0
+        while True:
+            rows = (await self._session.execute(statement.where(EventEntry.id > last_id))).all()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            await self.apply(added=[StandingsContribution(*row[1:]) for row in rows])
+
+    async def reset(self, event_id: int) -> None:
+        await self._session.execute(
+            delete(EventStanding).where(EventStanding.event_id == event_id)
+        )
+
+    def _scoring_keys(
+        self, contribution: StandingsContribution, labels: dict[int, list[tuple]]
+    ) -> list[tuple[StandingKey, str]]:
+        event_id = contribution.event_id
+        keys: list[tuple[StandingKey, str]] = []
+        if contribution.team_name:
+            keys.append(
+                ((event_id, StandingScope.TEAM, contribution.team_name), contribution.team_name)
+            )
+        for scope, scope_id, label in labels.get(contribution.roster_id, []):
+            keys.append(((event_id, scope, str(scope_id)), label))
+        return keys
+
+    async def _roster_labels(self, roster_ids: set[int]) -> dict[int, list[tuple]]:
+        if not roster_ids:
+            return {}
+        result = await self._session.execute(
+            select(Roster.id, Roster.name, Club.id, Club.name, Federation.id, Federation.name)
+            .join(Club, Roster.club_id == Club.id)
+            .outerjoin(Federation, Club.federation_id == Federation.id)
+            .where(Roster.id.in_(roster_ids))
+        )
+        labels: dict[int, list[tuple]] = {}
+        for roster_id, roster, club_id, club, federation_id, federation in result.all():
+            labels[roster_id] = [
+                (StandingScope.ROSTER, roster_id, roster),
+                (StandingScope.CLUB, club_id, club),
+            ]
+            if federation_id is not None:
+                labels[roster_id].append((StandingScope.FEDERATION, federation_id, federation))
+        return labels
+
+
+async def get_standings_service(
+    session: AsyncSession = Depends(get_session),
+) -> StandingsService:
+    return StandingsService(session)
@@ -0,0 +1,610 @@
+"""Reproducible synthetic championship seasons for performance work.
+
+``SyntheticDataset`` builds a season from a ``DatasetSize`` and a seed:
+federations with clubs and rosters, athletes drawn from those rosters, users
+with athlete profiles, meets with sessions, heats and finals, and news. The
+same size and seed always give the same rows. Rows carry explicit primary
+keys, so they can be bulk inserted in batches without reading ids back.
+
+``load_dataset`` writes a dataset into an empty database (SQLite or
+PostgreSQL) with multi-row inserts in one transaction. It then lets
+``DatabaseSchemaManager`` build the derived tables (leaderboards, standings,
+the home feed) from the loaded entries. ``src/generate_dataset.py`` is the
+command-line front end.
+"""
+
+from __future__ import annotations
+
+import math
+import unicodedata
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass, fields, replace
+from datetime import date, datetime, time, timedelta, timezone
+from hashlib import sha256
+from random import Random
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.database import DatabaseSchemaManager
+from app.core.security import PasswordHasher
+from app.models import (
+    AthleteProfile,
+    Base,
+    Club,
+    Event,
+    EventDiscipline,
+    EventDisciplineStatus,
+    EventEntry,
+    EventEntryStatus,
+    EventSession,
+    EventSessionStatus,
+    EventStanding,
+    Federation,
+    LeaderboardEntry,
+    MarkUnit,
+    NewsArticle,
+    NewsAudience,
+    RecentResult,
+    Roster,
+    User,
+)
+
+# Every synthetic user signs in with this password.
+SYNTHETIC_PASSWORD = "Synthetic-Season-2025"
+# Every synthetic federation uploads results with this token.
+SYNTHETIC_INGEST_TOKEN = "synthetic-ingest-token"
+
+LANES = 8
+FINAL_POINTS = (10, 8, 6, 5, 4, 3, 2, 1)
+
+COUNTRIES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Argentina", ("Buenos Aires", "Córdoba", "Rosario", "Mendoza")),
+    ("Brazil", ("São Paulo", "Rio de Janeiro", "Belo Horizonte", "Curitiba")),
+    ("Chile", ("Santiago", "Valparaíso", "Concepción")),
+    ("Colombia", ("Bogotá", "Medellín", "Cali", "Barranquilla")),
+    ("Ecuador", ("Quito", "Guayaquil", "Cuenca")),
+    ("Peru", ("Lima", "Cusco", "Arequipa")),
+    ("Mexico", ("Ciudad de México", "Guadalajara", "Monterrey", "Puebla")),
+    ("Uruguay", ("Montevideo", "Punta del Este")),
+    ("Venezuela", ("Caracas", "Maracaibo", "Valencia")),
+    ("Cuba", ("La Habana", "Santiago de Cuba")),
+    ("Jamaica", ("Kingston", "Montego Bay")),
+    ("Bolivia", ("La Paz", "Cochabamba", "Santa Cruz")),
+    ("Paraguay", ("Asunción", "Encarnación")),
+    ("Canada", ("Toronto", "Montreal", "Vancouver")),
+    ("United States", ("Eugene", "Austin", "Des Moines")),
+)
+CLUB_PATTERNS = (
+    "Club Atlético {city}",
+    "{city} Track Club",
+    "{city} Runners",
+    "Deportivo {city}",
+    "{city} Athletics",
+    "Sociedad Atlética {city}",
+)
+DIVISIONS = ("Senior", "U20", "U18", "Masters")
+FIRST_NAMES = (
+    "Valentina", "Mateo", "Camila", "Thiago", "Luisa", "Daniel", "Renata", "Pablo",
+    "Sofía", "Gabriel", "Mariana", "Felipe", "Isabela", "Santiago", "Ana", "Joaquín",
+    "Lucía", "Diego", "Fernanda", "Tomás", "Paula", "Andrés", "Carolina", "Emiliano",
+    "Juliana", "Nicolás", "Daniela", "Sebastián", "Gabriela", "Rafael", "Elena", "Bruno",
+)
+LAST_NAMES = (
+    "Ríos", "Herrera", "Ibáñez", "López", "Carvalho", "Torres", "Gómez", "Medina",
+    "Vargas", "da Costa", "Núñez", "Cruz", "Silva", "Fernández", "Rojas", "Pereira",
+    "Castillo", "Morales", "Santos", "Ortiz", "Mendoza", "Salazar", "Oliveira", "Ramírez",
+    "Acosta", "Benítez", "Sosa", "Aguilar", "Campos", "Figueroa", "Paredes", "Duarte",
+)
+MEET_NAMES = (
+    "Grand Prix",
+    "Open",
+    "Championships",
+    "Invitational",
+    "Memorial",
+    "Classic",
+    "Relays",
+    "Indoor Series",
+)
+OTHER_ROLES = ("fan", "fan", "fan", "coach", "scout")
+
+
+@dataclass(frozen=True)
+class DisciplineSpec:
+    name: str
+    unit: MarkUnit
+    best: float
+    # Added to ``best`` for the weakest athletes; negative for field events.
+    spread: float
+
+
+DISCIPLINE_PROGRAM: tuple[DisciplineSpec, ...] = (
+    DisciplineSpec("100m", MarkUnit.SECONDS, 10.0, 1.4),
+    DisciplineSpec("200m", MarkUnit.SECONDS, 20.2, 2.8),
+    DisciplineSpec("400m", MarkUnit.SECONDS, 45.0, 6.0),
+    DisciplineSpec("800m", MarkUnit.SECONDS, 104.0, 14.0),
+    DisciplineSpec("1500m", MarkUnit.SECONDS, 212.0, 30.0),
+    DisciplineSpec("5000m", MarkUnit.SECONDS, 790.0, 110.0),
+    DisciplineSpec("110m Hurdles", MarkUnit.SECONDS, 13.2, 1.8),
+    DisciplineSpec("400m Hurdles", MarkUnit.SECONDS, 48.5, 7.0),
+    DisciplineSpec("Long Jump", MarkUnit.METRES, 8.3, -1.8),
+    DisciplineSpec("Triple Jump", MarkUnit.METRES, 17.4, -3.0),
+    DisciplineSpec("High Jump", MarkUnit.METRES, 2.33, -0.45),
+    DisciplineSpec("Pole Vault", MarkUnit.METRES, 5.9, -1.6),
+    DisciplineSpec("Shot Put", MarkUnit.METRES, 21.5, -6.0),
+    DisciplineSpec("Discus Throw", MarkUnit.METRES, 67.0, -18.0),
+    DisciplineSpec("Javelin Throw", MarkUnit.METRES, 86.0, -24.0),
+    DisciplineSpec("Decathlon", MarkUnit.POINTS, 8500.0, -2000.0),
+)
+# Women's marks relative to men's, per unit.
+_WOMEN_FACTOR = {MarkUnit.SECONDS: 1.1, MarkUnit.METRES: 0.84, MarkUnit.POINTS: 0.78}
+
+
+@dataclass(frozen=True)
+class DatasetSize:
+    federations: int = 10
+    clubs_per_federation: int = 8
+    rosters_per_club: int = 2
+    athletes_per_roster: int = 15
+    events: int = 60
+    days_per_event: int = 2
+    disciplines_per_event: int = 16
+    entries_per_discipline: int = 16
+    users: int = 2000
+    news: int = 200
+
+    def scaled(self, factor: float) -> DatasetSize:
+        """Multiply the top-level counts; per-parent fan-out stays the same."""
+
+        return replace(
+            self,
+            federations=max(1, round(self.federations * factor)),
+            events=max(1, round(self.events * factor)),
+            users=max(1, round(self.users * factor)),
+            news=max(0, round(self.news * factor)),
+        )
+
+    def as_dict(self) -> dict[str, int]:
+        return {item.name: getattr(self, item.name) for item in fields(self)}
+
+
+@dataclass(frozen=True)
+class _Athlete:
+    name: str
+    roster_id: int
+    club: str
+    women: bool
+
+
+class SyntheticDataset:
+    def __init__(
+        self,
+        size: DatasetSize,
+        seed: int = 0,
+        season: int | None = None,
+        today: date | None = None,
+        password_hash: str | None = None,
+    ) -> None:
+        if size.entries_per_discipline < 1 or size.disciplines_per_event < 1:
+            raise ValueError("Events need at least one discipline with one entry")
+        self.size = size
+        self.seed = seed
+        self.today = today or date.today()
+        self.season = season or self.today.year
+        self._password_hash = password_hash
+        # Entries for meets that have not happened yet were registered before
+        # any result of the season, so they never lead the recent-results feed.
+        self._registered_at = min(
+            datetime(self.season, 1, 10, 12, tzinfo=timezone.utc),
+            datetime.combine(self.today - timedelta(days=1), time(12), tzinfo=timezone.utc),
+        )
+
+    def batches(self, batch_size: int = 5000) -> Iterator[tuple[sa.Table, list[dict[str, Any]]]]:
+        """Yield ``(table, rows)`` in foreign-key order, at most ``batch_size`` rows each."""
+
+        rng = Random(self.seed)
+        federations, clubs, rosters, athletes = self._organisations(rng)
+        yield from _chunks(Federation.__table__, federations, batch_size)
+        yield from _chunks(Club.__table__, clubs, batch_size)
+        yield from _chunks(Roster.__table__, rosters, batch_size)
+
+        users, profiles = self._users(rng, athletes)
+        yield from _chunks(User.__table__, users, batch_size)
+        yield from _chunks(AthleteProfile.__table__, profiles, batch_size)
+
+        # Meets are generated one at a time; parents are flushed with or
+        # before their children whenever the entry buffer fills.
+        tables = (
+            Event.__table__,
+            EventSession.__table__,
+            EventDiscipline.__table__,
+            EventEntry.__table__,
+        )
+        buffers: dict[sa.Table, list[dict[str, Any]]] = {table: [] for table in tables}
+        ids = Counter()
+        meet_names: list[str] = []
+        pools = {
+            women: [athlete for athlete in athletes if athlete.women == women] or athletes
+            for women in (False, True)
+        }
+        for index in range(self.size.events):
+            self._meet(rng, index, federations, pools, buffers, ids, meet_names)
+            if len(buffers[EventEntry.__table__]) >= batch_size:
+                for table in tables:
+                    yield from _chunks(table, buffers[table], batch_size)
+                    buffers[table] = []
+        for table in tables:
+            yield from _chunks(table, buffers[table], batch_size)
+
+        yield from _chunks(NewsArticle.__table__, self._news(rng, meet_names), batch_size)
+
+    def _organisations(self, rng: Random):
+        federations: list[dict[str, Any]] = []
+        clubs: list[dict[str, Any]] = []
+        rosters: list[dict[str, Any]] = []
+        athletes: list[_Athlete] = []
+        club_names: set[str] = set()
+        updated_at = datetime.combine(self.today, time(8), tzinfo=timezone.utc)
+        token_hash = sha256(SYNTHETIC_INGEST_TOKEN.encode("utf-8")).hexdigest()
+        for federation_index in range(self.size.federations):
+            country, cities = COUNTRIES[federation_index % len(COUNTRIES)]
+            cycle = federation_index // len(COUNTRIES)
+            name = f"Federación de Atletismo de {country}" + (f" {cycle + 1}" if cycle else "")
+            federation_id = federation_index + 1
+            federations.append(
+                {
+                    "id": federation_id,
+                    "name": name,
+                    "country": country,
+                    "website": f"https://{_slug(country)}{cycle or ''}.athletics.example.org",
+                    "ingest_token_hash": token_hash,
+                }
+            )
+            for _ in range(self.size.clubs_per_federation):
+                city = rng.choice(cities)
+                club_name = _unique(rng.choice(CLUB_PATTERNS).format(city=city), club_names)
+                club_id = len(clubs) + 1
+                clubs.append(
+                    {
+                        "id": club_id,
+                        "federation_id": federation_id,
+                        "name": club_name,
+                        "city": city,
+                        "country": country,
+                    }
+                )
+                for roster_index in range(self.size.rosters_per_club):
+                    division = DIVISIONS[roster_index % len(DIVISIONS)]
+                    cycle = roster_index // len(DIVISIONS)
+                    suffix = f" {cycle + 1}" if cycle else ""
+                    roster_id = len(rosters) + 1
+                    rosters.append(
+                        {
+                            "id": roster_id,
+                            "club_id": club_id,
+                            "name": f"{club_name} {division}{suffix}",
+                            "country": country,
+                            "division": division,
+                            "coach_name": _person(rng),
+                            "athlete_count": self.size.athletes_per_roster,
+                            "updated_at": updated_at,
+                        }
+                    )
+                    for _ in range(self.size.athletes_per_roster):
+                        women = rng.random() < 0.5
+                        athletes.append(_Athlete(_person(rng), roster_id, club_name, women))
+        return federations, clubs, rosters, athletes
+
+    def _users(self, rng: Random, athletes: list[_Athlete]):
+        password_hash = self._password_hash or PasswordHasher().hash(SYNTHETIC_PASSWORD)
+        users: list[dict[str, Any]] = []
+        profiles: list[dict[str, Any]] = []
+        for index in range(self.size.users):
+            user_id = index + 1
+            athlete = athletes[index] if index < len(athletes) else None
+            full_name = athlete.name if athlete else _person(rng)
+            role = "athlete" if athlete else rng.choice(OTHER_ROLES)
+            users.append(
+                {
+                    "id": user_id,
+                    "email": f"{_slug(full_name, '.')}.{user_id}@example.org",
+                    "full_name": full_name,
+                    "role": role,
+                    "hashed_password": password_hash,
+                }
+            )
+            if athlete is not None:
+                profiles.append(
+                    {
+                        "id": len(profiles) + 1,
+                        "user_id": user_id,
+                        "bio": f"{athlete.club} athlete.",
+                        "track_history": [],
+                    }
+                )
+        return users, profiles
+
+    def _meet(
+        self,
+        rng: Random,
+        index: int,
+        federations: list[dict[str, Any]],
+        pools: dict[bool, list[_Athlete]],
+        buffers: dict[sa.Table, list[dict[str, Any]]],
+        ids: Counter,
+        meet_names: list[str],
+    ) -> None:
+        federation = federations[index % len(federations)]
+        cities = dict(COUNTRIES)[federation["country"]]
+        city = rng.choice(cities)
+        # Meets are spread over the season, February to November.
+        start_date = date(self.season, 2, 1) + timedelta(
+            days=index * 300 // max(1, self.size.events)
+        )
+        end_date = start_date + timedelta(days=self.size.days_per_event - 1)
+        name = f"{city} {rng.choice(MEET_NAMES)} {self.season}"
+        meet_names.append(name)
+        ids["events"] += 1
+        event_id = ids["events"]
+        buffers[Event.__table__].append(
+            {
+                "id": event_id,
+                "name": name,
+                "location": city,
+                "start_date": start_date,
+                "end_date": end_date,
+                "federation_id": federation["id"],
+            }
+        )
+        finished = end_date < self.today
+
+        sessions: list[tuple[int, datetime]] = []
+        for day in range(self.size.days_per_event):
+            for label, hour in (("Morning Session", 9), ("Evening Session", 17)):
+                ids["sessions"] += 1
+                start = datetime.combine(
+                    start_date + timedelta(days=day), time(hour), tzinfo=timezone.utc
+                )
+                sessions.append((ids["sessions"], start))
+                session_date = start.date()
+                buffers[EventSession.__table__].append(
+                    {
+                        "id": ids["sessions"],
+                        "event_id": event_id,
+                        "name": f"Day {day + 1} {label}",
+                        "start_time": start,
+                        "end_time": start + timedelta(hours=3, minutes=30),
+                        "venue": f"Estadio {city}",
+                        "status": EventSessionStatus.COMPLETED
+                        if session_date < self.today
+                        else EventSessionStatus.LIVE
+                        if session_date == self.today
+                        else EventSessionStatus.SCHEDULED,
+                    }
+                )
+
+        offset = rng.randrange(len(DISCIPLINE_PROGRAM) * 2)
+        slots: Counter = Counter()
+        for order in range(self.size.disciplines_per_event):
+            program_index = (offset + order) % (len(DISCIPLINE_PROGRAM) * 2)
+            spec = DISCIPLINE_PROGRAM[program_index // 2]
+            women = program_index % 2 == 1
+            pool = pools[women]
+            field = rng.sample(pool, min(self.size.entries_per_discipline, len(pool)))
+            marks = [_mark(rng, spec, women) for _ in field]
+            day = order * self.size.days_per_event // self.size.disciplines_per_event
+            heats = (
+                math.ceil(len(field) / LANES)
+                if spec.unit == MarkUnit.SECONDS and len(field) > LANES
+                else 0
+            )
+            rounds: list[tuple[str, int, list[int]]] = []
+            if heats:
+                morning = sessions[day * 2][0]
+                for heat in range(heats):
+                    members = list(range(heat, len(field), heats))
+                    rounds.append((f"Heat {heat + 1}", morning, members))
+                ranked = sorted(range(len(field)), key=lambda i: _rank_key(spec, marks[i]))
+                rounds.append(("Final", sessions[day * 2 + 1][0], ranked[:LANES]))
+            else:
+                rounds.append(("Final", sessions[day * 2 + 1][0], list(range(len(field)))))
+
+            for round_name, session_id, members in rounds:
+                session_start = dict(sessions)[session_id]
+                scheduled_start = session_start + timedelta(minutes=15 * slots[session_id])
+                slots[session_id] += 1
+                ids["disciplines"] += 1
+                discipline_id = ids["disciplines"]
+                buffers[EventDiscipline.__table__].append(
+                    {
+                        "id": discipline_id,
+                        "event_id": event_id,
+                        "session_id": session_id,
+                        "name": spec.name,
+                        "category": f"Senior {'Women' if women else 'Men'}",
+                        "round_name": round_name,
+                        "scheduled_start": scheduled_start,
+                        "scheduled_end": scheduled_start + timedelta(minutes=12),
+                        "status": EventDisciplineStatus.FINALIZED
+                        if finished
+                        else EventDisciplineStatus.SCHEDULED,
+                        "venue": "Track" if spec.unit == MarkUnit.SECONDS else "Field",
+                        "order": order,
+                    }
+                )
+                ranked = sorted(members, key=lambda i: _rank_key(spec, marks[i]))
+                positions = {member: position for position, member in enumerate(ranked, start=1)}
+                for lane, member in enumerate(members, start=1):
+                    athlete = field[member]
+                    value = marks[member]
+                    ids["entries"] += 1
+                    row: dict[str, Any] = {
+                        "id": ids["entries"],
+                        "discipline_id": discipline_id,
+                        "roster_id": athlete.roster_id,
+                        "athlete_name": athlete.name,
+                        "team_name": athlete.club,
+                        "bib": str(1000 + member),
+                        "lane": str(lane) if spec.unit == MarkUnit.SECONDS else None,
+                        "seed_mark": _format_mark(spec.unit, value),
+                        "status": EventEntryStatus.SCHEDULED,
+                        "position": None,
+                        "result": None,
+                        "mark_value": None,
+                        "mark_unit": None,
+                        "points": None,
+                        "updated_at": self._registered_at,
+                    }
+                    if finished and value is None:
+                        row.update(status=EventEntryStatus.DNS, result="DNS")
+                    elif finished:
+                        position = positions[member]
+                        scored = round_name == "Final" and position <= len(FINAL_POINTS)
+                        row.update(
+                            status=EventEntryStatus.FINISHED,
+                            position=position,
+                            result=_format_mark(spec.unit, value),
+                            mark_value=value,
+                            mark_unit=spec.unit,
+                            points=FINAL_POINTS[position - 1] if scored else None,
+                            updated_at=scheduled_start + timedelta(minutes=10),
+                        )
+                    buffers[EventEntry.__table__].append(row)
+
+    def _news(self, rng: Random, meet_names: list[str]) -> list[dict[str, Any]]:
+        articles: list[dict[str, Any]] = []
+        season_start = datetime(self.season, 1, 15, 12, tzinfo=timezone.utc)
+        for index in range(self.size.news):
+            meet = rng.choice(meet_names) if meet_names else f"Season {self.season}"
+            country, _ = rng.choice(COUNTRIES)
+            headline = rng.choice(
+                (
+                    "{meet}: results and highlights",
+                    "Records fall at {meet}",
+                    "What to watch at {meet}",
+                    "{country} squad named for {meet}",
+                )
+            ).format(meet=meet, country=country)
+            articles.append(
+                {
+                    "id": index + 1,
+                    "title": headline[:200],
+                    "region": country,
+                    "excerpt": f"Coverage of {meet} from our correspondents in {country}.",
+                    "content": (
+                        f"Full report from {meet}: finals, heats, personal bests and the "
+                        f"points race between the clubs of {country} and their rivals."
+                    ),
+                    "published_at": season_start
+                    + timedelta(hours=index * 24 * 300 // max(1, self.size.news)),
+                    "audience": rng.choices(
+                        (NewsAudience.PUBLIC, NewsAudience.PREMIUM, NewsAudience.COACH),
+                        weights=(8, 1, 1),
+                    )[0],
+                }
+            )
+        return articles
+
+
+_SOURCE_TABLES = (
+    Federation.__table__,
+    Club.__table__,
+    Roster.__table__,
+    User.__table__,
+    AthleteProfile.__table__,
+    Event.__table__,
+    EventSession.__table__,
+    EventDiscipline.__table__,
+    EventEntry.__table__,
+    NewsArticle.__table__,
+)
+_DERIVED_TABLES = (
+    LeaderboardEntry.__table__,
+    EventStanding.__table__,
+    RecentResult.__table__,
+)
+
+
+async def load_dataset(
+    engine: AsyncEngine, dataset: SyntheticDataset, batch_size: int = 5000
+) -> dict[str, int]:
+    """Bulk insert ``dataset`` into an empty database and build derived tables.
+
+    Returns the number of rows written per table.
+    """
+
+    counts: Counter = Counter()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        for table in _SOURCE_TABLES:
+            if await conn.scalar(sa.select(sa.literal(1)).select_from(table).limit(1)):
+                raise ValueError(f"load_dataset needs an empty database; {table.name} has rows")
+        # Derived tables are empty too; dropping them makes ensure_schema
+        # recreate them and backfill from the loaded entries.
+        await conn.run_sync(Base.metadata.drop_all, tables=list(_DERIVED_TABLES))
+        for table, rows in dataset.batches(batch_size):
+            await conn.execute(sa.insert(table), rows)
+            counts[table.name] += len(rows)
+        if conn.dialect.name == "postgresql":
+            # Explicit ids leave the serial sequences behind.
+            for table in _SOURCE_TABLES:
+                await conn.execute(
+                    sa.text(
+                        f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                        f"COALESCE((SELECT MAX(id) FROM {table.name}), 1))"
+                    )
+                )
+    await DatabaseSchemaManager(engine).ensure_schema()
+    return dict(counts)
+
+
+def _chunks(
+    table: sa.Table, rows: list[dict[str, Any]], size: int
+) -> Iterator[tuple[sa.Table, list[dict[str, Any]]]]:
+    for start in range(0, len(rows), size):
+        yield table, rows[start : start + size]
+
+
+def _person(rng: Random) -> str:
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+def _slug(text: str, separator: str = "-") -> str:
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return separator.join(ascii_text.lower().split())
+
+
+def _unique(name: str, seen: set[str]) -> str:
+    candidate, number = name, 2
+    while candidate in seen:
+        candidate, number = f"{name} {number}", number + 1
+    seen.add(candidate)
+    return candidate
+
+
+def _mark(rng: Random, spec: DisciplineSpec, women: bool) -> float | None:
+    if rng.random() < 0.02:
+        return None
+    value = (spec.best + spec.spread * rng.random() ** 1.5) * (
+        _WOMEN_FACTOR[spec.unit] if women else 1.0
+    )
+    return round(value) if spec.unit == MarkUnit.POINTS else round(value, 2)
+
+
+def _rank_key(spec: DisciplineSpec, value: float | None) -> float:
+    if value is None:
+        return math.inf
+    return value if spec.unit == MarkUnit.SECONDS else -value
+
+
+def _format_mark(unit: MarkUnit, value: float | None) -> str | None:
+    if value is None:
+        return None
+    if unit == MarkUnit.POINTS:
+        return str(int(value))
+    if unit == MarkUnit.SECONDS and value >= 60:
+        minutes, seconds = divmod(value, 60)
+        return f"{int(minutes)}:{seconds:05.2f}"
+    return f"{value:.2f}"
@@ -1,13 +1,17 @@
-import { request } from "./api.js";
+import { API_BASE, request } from "./api.js";
 import { formatDate } from "./format.js";
 import { readAuthToken, storeAuthToken } from "./auth-storage.js";
 import { state } from "./state.js";
 
+const UPLOAD_CHUNK_BYTES = 5 * 1024 * 1024;
+const UPLOAD_RETRIES = 5;
+
 export function initializeFederationsUploadPage({ notify }) {
   const form = document.querySelector("#federations-upload-form");
   const refreshButton = document.querySelector("#federations-refresh");
   const list = document.querySelector("#federations-submissions");
   const empty = document.querySelector("#federations-submissions-empty");
+  const progress = document.querySelector("#federations-upload-progress");
 
   function normalizeToken(value) {
     if (!value) {
@@ -48,6 +52,88 @@ export function initializeFederationsUploadPage({ notify }) {
       });
   }
 
+  function uploadKey(file, federationName) {
+    return `trackeo.upload:${federationName}:${file.name}:${file.size}:${file.lastModified}`;
+  }
+
+  async function openUpload(file, payload) {
+    // Resume an upload of the same file that was interrupted earlier.
+    const key = uploadKey(file, payload.federation_name);
+    const storedId = window.localStorage.getItem(key);
+    if (storedId) {
+      try {
+        const existing = await request(`/federations/uploads/${storedId}`);
+        if (existing.status === "uploading") {
+          return existing;
+        }
+      } catch (error) {
+        window.localStorage.removeItem(key);
+      }
+    }
+    const upload = await request("/federations/uploads", {
+      method: "POST",
+      body: JSON.stringify({
+        federation_name: payload.federation_name,
+        contact_email: payload.contact_email,
+        access_token: payload.access_token,
+        notes: payload.notes || null,
+        filename: file.name,
+        total_size: file.size,
+      }),
+    });
+    window.localStorage.setItem(key, upload.id);
+    return upload;
+  }
+
+  async function uploadFile(file, payload) {
+    const key = uploadKey(file, payload.federation_name);
+    let upload = await openUpload(file, payload);
+    let offset = upload.received_bytes;
+    let failures = 0;
+    if (progress) {
+      progress.hidden = false;
+    }
+    while (offset < file.size) {
+      if (progress) {
+        progress.value = Math.floor((offset / file.size) * 100);
+      }
+      const chunk = file.slice(offset, offset + UPLOAD_CHUNK_BYTES);
+      try {
+        const response = await fetch(`${API_BASE}/federations/uploads/${upload.id}`, {
+          method: "PUT",
+          headers: { "Upload-Offset": String(offset), "Content-Type": "application/octet-stream" },
+          body: chunk,
+        });
+        if (response.status === 409) {
+          offset = Number(response.headers.get("Upload-Offset"));
+          continue;
+        }
+        if (!response.ok) {
+          const detail = await response.json().catch(() => null);
+          const error = new Error(detail?.detail || response.statusText);
+          error.status = response.status;
+          throw error;
+        }
+        upload = await response.json();
+        offset = upload.received_bytes;
+        failures = 0;
+      } catch (error) {
+        if ((error.status && error.status < 500) || ++failures > UPLOAD_RETRIES) {
+          throw error;
+        }
+        // The connection dropped mid-chunk: ask the server how much it kept.
+        await new Promise((resolve) => setTimeout(resolve, 1000 * failures));
+        upload = await request(`/federations/uploads/${upload.id}`).catch(() => upload);
+        offset = upload.received_bytes;
+      }
+    }
+    window.localStorage.removeItem(key);
+    if (progress) {
+      progress.hidden = true;
+    }
+    return upload;
+  }
+
   async function loadSubmissions(token) {
     const authHeader = token || normalizeToken(state.federationToken) || normalizeToken(readAuthToken().token);
     if (!authHeader) {
@@ -87,18 +173,29 @@ export function initializeFederationsUploadPage({ notify }) {
         const rawToken = tokenInput.toString().replace(/^Bearer\s+/i, "");
         storeAuthToken(rawToken, new Date(Date.now() + 3600_000).toISOString(), readAuthToken().tier);
       }
+      const file = formData.get("file");
+      formData.delete("file");
       const payload = Object.fromEntries(formData.entries());
       const cleanedToken = (tokenInput || authHeader)?.toString().replace(/^Bearer\s+/i, "");
       payload.access_token = cleanedToken;
       delete payload.token;
+      const hasFile = file instanceof File && file.size > 0;
+      if (!hasFile && !payload.payload_url) {
+        notify("error", "Provide a payload URL or choose a results file.");
+        return;
+      }
       try {
-        await request("/federations/submissions", {
-          method: "POST",
-          headers: {
-            Authorization: authHeader,
-          },
-          body: JSON.stringify(payload),
-        });
+        if (hasFile) {
+          await uploadFile(file, payload);
+        } else {
+          await request("/federations/submissions", {
+            method: "POST",
+            headers: {
+              Authorization: authHeader,
+            },
+            body: JSON.stringify(payload),
+          });
+        }
         form.reset();
         notify("success", "Submission queued for processing.");
         await loadSubmissions(authHeader);
@@ -137,6 +137,7 @@ export const translations = {
     "federations.email_placeholder": "contact@federation.org",
     "federations.payload": "Secure package URL",
     "federations.payload_placeholder": "https://storage.example.com/results.json",
+    "federations.file": "Or upload a results file",
     "federations.notes": "Notes (optional)",
     "federations.notes_placeholder": "Describe the meet or include validation details",
     "federations.submit": "Submit for processing",
@@ -300,6 +301,7 @@ export const translations = {
     "federations.email_placeholder": "contacto@federacion.org",
     "federations.payload": "URL segura del paquete",
     "federations.payload_placeholder": "https://storage.ejemplo.com/resultados.json",
+    "federations.file": "O sube un archivo de resultados",
     "federations.notes": "Notas (opcional)",
     "federations.notes_placeholder": "Describe el evento o incluye detalles de validación",
     "federations.submit": "Enviar a procesamiento",
@@ -463,6 +465,7 @@ export const translations = {
     "federations.email_placeholder": "contato@federacao.org",
     "federations.payload": "URL segura do pacote",
     "federations.payload_placeholder": "https://storage.exemplo.com/resultados.json",
+    "federations.file": "Ou envie um arquivo de resultados",
     "federations.notes": "Notas (opcional)",
     "federations.notes_placeholder": "Descreva o evento ou inclua detalhes de validação",
     "federations.submit": "Enviar para processamento",
@@ -0,0 +1,43 @@
+"""Standalone consumer process for durable message bus backends.
+
+Run alongside API workers that set ``ATHLETICS_MESSAGE_BUS_CONSUME=false``::
+
+    ATHLETICS_MESSAGE_BUS_BACKEND=redis PYTHONPATH=src python src/ingestion_worker.py
+"""
+
+import asyncio
+import logging
+import signal
+
+from app.core.config import SettingsSingleton
+from app.core.database import init_models
+from app.integrations.message_bus import MessageBus
+from app.services import federations  # noqa: F401  - registers the submission processor
+
+
+async def run() -> None:
+    settings = SettingsSingleton().instance
+    if settings.message_bus_backend.lower() == "memory":
+        raise SystemExit(
+            "The in-memory message bus cannot be shared across processes; "
+            "set ATHLETICS_MESSAGE_BUS_BACKEND=redis."
+        )
+    if not settings.message_bus_consume:
+        raise SystemExit("ATHLETICS_MESSAGE_BUS_CONSUME must be true for the ingestion worker.")
+
+    await init_models()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    bus = MessageBus()
+    await bus.start()
+    logging.getLogger(__name__).info("Ingestion worker consuming via %s", settings.redis_url)
+    await stop.wait()
+    await bus.stop()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run())
@@ -13,15 +13,26 @@ from app.api.v1.routes import (
     events,
     federations,
     health,
+    leaderboards,
+    metrics,
     news,
+    profiling,
     rosters,
     search,
     subscribers,
 )
 from app.core.config import SettingsSingleton
 from app.core.database import init_models
+from app.core.loop_monitor import LoopLagMonitor
+from app.core.profiling import ProfilingMiddleware
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.request_metrics import MetricsMiddleware
+from app.core.serialization import embed_json, model_json
+from app.core.security import PasswordHasher
+from app.integrations.message_bus import MessageBus
 from app.services.bootstrap import seed_initial_data
 from app.services.home import get_event_detail_snapshot, get_home_snapshot
+from app.services.result_imports import ResultsParsePool
 
 
 def create_app() -> FastAPI:
@@ -30,9 +41,23 @@ def create_app() -> FastAPI:
     async def lifespan(application: FastAPI):
         await init_models()
         await seed_initial_data()
+        await MessageBus().start()
+        if settings.loop_monitor_enabled:
+            await LoopLagMonitor().start()
         yield
+        await LoopLagMonitor().stop()
+        await MessageBus().stop()
+        PasswordHasher().shutdown()
+        ResultsParsePool().shutdown()
 
     application = FastAPI(title=settings.project_name, version="1.0.0", lifespan=lifespan)
+    if settings.profiling_token:
+        application.add_middleware(ProfilingMiddleware)
+    if settings.query_stats_header:
+        application.add_middleware(QueryStatsMiddleware)
+    if settings.metrics_enabled:
+        # Added last so it is the outermost middleware and times the others too.
+        application.add_middleware(MetricsMiddleware)
 
     base_dir = Path(__file__).resolve().parent
     template_dir = base_dir / "app" / "web" / "templates"
@@ -76,9 +101,7 @@ def create_app() -> FastAPI:
             page_id="home",
             fallback_markup=index_markup,
             context={
-                "initial_home": home_snapshot.model_dump(mode="json", exclude_none=True)
-                if home_snapshot
-                else None,
+                "initial_home": embed_json(model_json(home_snapshot)) if home_snapshot else None,
             },
         )
 
@@ -122,7 +145,7 @@ def create_app() -> FastAPI:
             fallback_markup=f"<h1>Event #{event_id}</h1>",
             context={
                 "event_id": event_id,
-                "initial_event": detail_snapshot.model_dump(mode="json")
+                "initial_event": embed_json(model_json(detail_snapshot))
                 if detail_snapshot
                 else None,
             },
@@ -193,6 +216,11 @@ def create_app() -> FastAPI:
     application.include_router(search.router, prefix=settings.api_v1_prefix)
     application.include_router(subscribers.router, prefix=settings.api_v1_prefix)
     application.include_router(federations.router, prefix=settings.api_v1_prefix)
+    application.include_router(leaderboards.router, prefix=settings.api_v1_prefix)
+    application.include_router(profiling.router, prefix=settings.api_v1_prefix)
+    if settings.metrics_enabled:
+        # Served at /metrics, where Prometheus scrapers look by default.
+        application.include_router(metrics.router)
 
     return application
 
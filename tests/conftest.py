@@ -31,6 +31,10 @@ def configure_settings(tmp_path_factory: pytest.TempPathFactory):
     db_path = tmp_path_factory.mktemp("db") / "test_app.db"
     os.environ["ATHLETICS_DATABASE_URL"] = f"sqlite+aiosqlite:///{db_path}"
     os.environ["ATHLETICS_SEED_DEMO_DATA"] = "false"
+    # Every test request shares one client host; test_rate_limiting opts back in.
+    os.environ["ATHLETICS_RATE_LIMIT_ENABLED"] = "false"
+    # Read models built from rows skip validation in production; check them here.
+    os.environ["ATHLETICS_VALIDATE_TRUSTED_ROWS"] = "true"
     SettingsSingleton.reset_instance()
     DatabaseSessionManager.reset_instance()
     asyncio.run(init_models())
@@ -38,6 +42,7 @@ def configure_settings(tmp_path_factory: pytest.TempPathFactory):
     DatabaseSessionManager.reset_instance()
     SettingsSingleton.reset_instance()
     os.environ.pop("ATHLETICS_SEED_DEMO_DATA", None)
+    os.environ.pop("ATHLETICS_RATE_LIMIT_ENABLED", None)
     if Path(db_path).exists():
         Path(db_path).unlink()
 
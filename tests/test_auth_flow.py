@@ -45,3 +45,109 @@ async def test_public_history_access_is_free(client):
     assert history_response.status_code == 200
     body = history_response.json()
     assert body["athlete_id"] == athlete_id
+
+
+async def test_refresh_token_rotation_revokes_reused_tokens(client):
+    unique = uuid4().hex[:6]
+    payload = {
+        "email": f"official_{unique}@example.com",
+        "full_name": "Meet Official",
+        "role": "fan",
+        "password": "Official123!",
+    }
+    register_response = await client.post("/api/v1/accounts/register", json=payload)
+    assert register_response.status_code == 201
+
+    login_response = await client.post(
+        "/api/v1/accounts/login",
+        data={"username": payload["email"], "password": payload["password"]},
+    )
+    assert login_response.status_code == 200
+    first_refresh = login_response.json()["refresh_token"]
+    assert first_refresh
+
+    refresh_response = await client.post(
+        "/api/v1/accounts/refresh", json={"refresh_token": first_refresh}
+    )
+    assert refresh_response.status_code == 200
+    body = refresh_response.json()
+    assert body["access_token"]
+    second_refresh = body["refresh_token"]
+    assert second_refresh and second_refresh != first_refresh
+
+    reused_response = await client.post(
+        "/api/v1/accounts/refresh", json={"refresh_token": first_refresh}
+    )
+    assert reused_response.status_code == 401
+
+    revoked_response = await client.post(
+        "/api/v1/accounts/refresh", json={"refresh_token": second_refresh}
+    )
+    assert revoked_response.status_code == 401
+
+
+async def test_refresh_tokens_are_kept_until_they_expire(client):
+    from datetime import datetime, timedelta, timezone
+
+    from sqlalchemy import select
+
+    from app.core.database import DatabaseSessionManager
+    from app.models import RefreshToken, User
+
+    unique = uuid4().hex[:6]
+    payload = {
+        "email": f"tablet_{unique}@example.com",
+        "full_name": "Tablet Official",
+        "role": "fan",
+        "password": "Tablet123!",
+    }
+    assert (await client.post("/api/v1/accounts/register", json=payload)).status_code == 201
+    credentials = {"username": payload["email"], "password": payload["password"]}
+
+    first = await client.post("/api/v1/accounts/login", data=credentials)
+    rotated = first.json()["refresh_token"]
+    refreshed = await client.post("/api/v1/accounts/refresh", json={"refresh_token": rotated})
+    assert refreshed.status_code == 200
+
+    session = DatabaseSessionManager().session()
+    try:
+        user_id = (
+            await session.execute(select(User.id).where(User.email == payload["email"]))
+        ).scalar_one()
+        session.add(
+            RefreshToken(
+                user_id=user_id,
+                token_hash=f"expired-{unique}",
+                expires_at=datetime.now(tz=timezone.utc) - timedelta(days=1),
+            )
+        )
+        await session.commit()
+    finally:
+        await session.close()
+
+    # Refreshing prunes the expired row but keeps the revoked one.
+    latest = await client.post(
+        "/api/v1/accounts/refresh", json={"refresh_token": refreshed.json()["refresh_token"]}
+    )
+    assert latest.status_code == 200
+    assert (await client.post("/api/v1/accounts/login", data=credentials)).status_code == 200
+
+    session = DatabaseSessionManager().session()
+    try:
+        hashes = (
+            await session.execute(
+                select(RefreshToken.token_hash).where(RefreshToken.user_id == user_id)
+            )
+        ).scalars().all()
+        assert f"expired-{unique}" not in hashes
+        assert len(hashes) == 4
+    finally:
+        await session.close()
+
+    # The first rotated token is still on record, so replaying it is caught as reuse.
+    replay = await client.post("/api/v1/accounts/refresh", json={"refresh_token": rotated})
+    assert replay.status_code == 401
+    revoked = await client.post(
+        "/api/v1/accounts/refresh", json={"refresh_token": latest.json()["refresh_token"]}
+    )
+    assert revoked.status_code == 401
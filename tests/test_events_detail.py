@@ -48,6 +48,8 @@ async def test_event_detail_generation_flow(client):
     updated_entry = update_response.json()
     assert updated_entry["result"] == "10.05s"
     assert updated_entry["status"] == "finished"
+    assert updated_entry["mark_value"] == 10.05
+    assert updated_entry["mark_unit"] == "s"
 
     session_response = await client.post(
         f"/api/v1/events/{event_id}/sessions",
@@ -0,0 +1,135 @@
+from hashlib import sha256
+from uuid import uuid4
+
+import pytest
+
+from app.core.config import SettingsSingleton
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+PAYLOAD = (
+    "event,event_date,location,discipline,category,round,athlete_name,team,bib,position,result\n"
+    + "".join(
+        f"Upload Open,2024-06-01,Quito,400m,Senior Men,Final,Runner {index},Club,{index},"
+        f"{index},{50 + index / 100:.2f}\n"
+        for index in range(1, 200)
+    )
+).encode("utf-8")
+
+
+@pytest.fixture
+async def federation(tmp_path, monkeypatch):
+    from app.core.database import DatabaseSessionManager
+    from app.models import Federation
+
+    monkeypatch.setattr(SettingsSingleton().instance, "upload_dir", str(tmp_path / "uploads"))
+    name = f"Upload Federation {uuid4().hex[:6]}"
+    token = f"token-{uuid4().hex}"
+    session = DatabaseSessionManager().session()
+    try:
+        federation = Federation(name=name, ingest_token_hash=sha256(token.encode()).hexdigest())
+        session.add(federation)
+        await session.commit()
+        yield {"federation_name": name, "access_token": token, "contact_email": "up@example.com"}
+        # The home snapshot falls back to sample data only while no federation exists.
+        await session.delete(federation)
+        await session.commit()
+    finally:
+        await session.close()
+
+
+async def test_chunked_upload_resumes_and_queues_submission(client, federation, tmp_path):
+    from app.core.database import DatabaseSessionManager
+    from app.models import FederationSubmission
+
+    response = await client.post(
+        "/api/v1/federations/uploads",
+        json={**federation, "filename": "results.csv", "total_size": len(PAYLOAD)},
+    )
+    assert response.status_code == 201
+    upload = response.json()
+    url = f"/api/v1/federations/uploads/{upload['id']}"
+
+    first = await client.put(url, content=PAYLOAD[:4000], headers={"Upload-Offset": "0"})
+    assert first.status_code == 200
+    assert first.json()["received_bytes"] == 4000
+
+    # A retried chunk at a stale offset is refused and told where to resume.
+    stale = await client.put(url, content=PAYLOAD[:4000], headers={"Upload-Offset": "0"})
+    assert stale.status_code == 409
+    assert stale.headers["Upload-Offset"] == "4000"
+
+    too_long = await client.put(
+        url, content=PAYLOAD[4000:] + b"extra", headers={"Upload-Offset": "4000"}
+    )
+    assert too_long.status_code == 400
+    assert (await client.get(url)).json()["received_bytes"] == 4000
+
+    done = await client.put(url, content=PAYLOAD[4000:], headers={"Upload-Offset": "4000"})
+    assert done.status_code == 200
+    body = done.json()
+    assert body["status"] == "completed"
+    assert body["checksum"] == sha256(PAYLOAD).hexdigest()
+    assert body["submission_id"]
+
+    session = DatabaseSessionManager().session()
+    try:
+        submission = await session.get(FederationSubmission, body["submission_id"])
+        assert submission.checksum == body["checksum"]
+        assert submission.payload_url.startswith("file://")
+        assert (tmp_path / "uploads" / f"{upload['id']}.csv").read_bytes() == PAYLOAD
+    finally:
+        await session.close()
+
+
+async def test_interrupted_chunk_keeps_received_bytes(federation):
+    from starlette.requests import ClientDisconnect
+
+    from app.core.database import DatabaseSessionManager
+    from app.integrations.message_bus import InMemoryMessageBus
+    from app.schemas.federation import FederationUploadCreate
+    from app.services.federation_uploads import FederationUploadService
+
+    async def dropped_connection():
+        yield PAYLOAD[:1000]
+        yield PAYLOAD[1000:2500]
+        raise ClientDisconnect()
+
+    async def rest():
+        yield PAYLOAD[2500:]
+
+    bus = InMemoryMessageBus(workers=1, max_queue_size=10, publish_timeout=1)
+    session = DatabaseSessionManager().session()
+    try:
+        service = FederationUploadService(session, bus)
+        upload = await service.create_upload(
+            FederationUploadCreate(**federation, filename="day1.csv", total_size=len(PAYLOAD))
+        )
+        with pytest.raises(ClientDisconnect):
+            await service.append_chunk(upload.id, 0, dropped_connection())
+        assert (await service.get_upload(upload.id)).received_bytes == 2500
+
+        completed = await service.append_chunk(upload.id, 2500, rest())
+        assert completed.checksum == sha256(PAYLOAD).hexdigest()
+    finally:
+        await session.close()
+
+
+async def test_chunk_is_refused_while_another_process_holds_the_file(client, federation, tmp_path):
+    fcntl = pytest.importorskip("fcntl")
+    response = await client.post(
+        "/api/v1/federations/uploads",
+        json={**federation, "filename": "locked.csv", "total_size": len(PAYLOAD)},
+    )
+    upload_id = response.json()["id"]
+    url = f"/api/v1/federations/uploads/{upload_id}"
+
+    # A separate open file stands in for a worker process mid-request.
+    with open(tmp_path / "uploads" / f"{upload_id}.part", "r+b") as other:
+        fcntl.flock(other.fileno(), fcntl.LOCK_EX)
+        busy = await client.put(url, content=PAYLOAD[:100], headers={"Upload-Offset": "0"})
+    assert busy.status_code == 409
+    assert busy.headers["Upload-Offset"] == "0"
+
+    resumed = await client.put(url, content=PAYLOAD[:100], headers={"Upload-Offset": "0"})
+    assert resumed.json()["received_bytes"] == 100
@@ -3,6 +3,8 @@ from uuid import uuid4
 
 import pytest
 
+from app.core.config import SettingsSingleton
+
 pytestmark = pytest.mark.anyio("asyncio")
 
 
@@ -50,3 +52,128 @@ async def test_federation_submission_uses_ingest_token(client):
     assert submissions
     processed = submissions[0]
     assert processed["status"] in {"processed", "processing", "queued"}
+
+
+async def test_submission_processor_imports_results_payloads(tmp_path, monkeypatch):
+    from sqlalchemy import select
+
+    from app.core.database import DatabaseSessionManager
+    from app.integrations.message_bus import InMemoryMessageBus
+    from app.models import (
+        Event,
+        EventDiscipline,
+        EventEntry,
+        FederationSubmission,
+        FederationSubmissionStatus,
+        MarkUnit,
+    )
+    from app.services.federations import FederationSubmissionProcessor
+
+    monkeypatch.setattr(SettingsSingleton().instance, "ingestion_allow_local_payloads", True)
+    monkeypatch.setattr(SettingsSingleton().instance, "ingestion_chunk_size", 2)
+    event_name = f"Nacional U20 {uuid4().hex[:6]}"
+    results = tmp_path / "results.csv"
+    results.write_text(
+        "event,event_date,location,discipline,category,round,"
+        "athlete_name,team,bib,position,result\n"
+        f"{event_name},2024-05-04,Lima,100m,U20 Men,Final,Ana Ruiz,Club A,101,1,10.52\n"
+        f'{event_name},2024-05-04,Lima,100m,U20 Men,Final,"Perez, Luis",Club B,102,2,10.61\n'
+        f"{event_name},2024-05-04,Lima,100m,U20 Men,Final,Joao Lima,Club C,103,third,10.70\n"
+        f"{event_name},2024-05-05,Lima,Long Jump,U20 Women,Final,Maria Silva,Club A,201,1,6.12\n",
+        encoding="utf-8",
+    )
+    revised = tmp_path / "revised.csv"
+    revised.write_text(
+        results.read_text(encoding="utf-8").replace("10.52", "10.49")
+        + f"{event_name},2024-05-05,Lima,Long Jump,U20 Women,Final,Rosa Diaz,Club B,202,2,6.01\n",
+        encoding="utf-8",
+    )
+    missing = tmp_path / "missing.csv"
+
+    session = DatabaseSessionManager().session()
+    try:
+        submissions = [
+            FederationSubmission(
+                federation_name="Batch Federation",
+                contact_email="batch@example.com",
+                payload_url=url,
+                status=FederationSubmissionStatus.QUEUED,
+            )
+            for url in (results.as_uri(), results.as_uri(), revised.as_uri(), missing.as_uri())
+        ]
+        session.add_all(submissions)
+        await session.commit()
+        submission_ids = [submission.id for submission in submissions]
+    finally:
+        await session.close()
+
+    bus = InMemoryMessageBus(workers=1, max_queue_size=10, publish_timeout=1)
+    FederationSubmissionProcessor(bus)
+    for submission_id in submission_ids:
+        await bus.publish("federation.submission", submission_id)
+    await bus.join()
+    await bus.stop()
+
+    session = DatabaseSessionManager().session()
+    try:
+        first, repeat, revision, failed = [
+            await session.get(FederationSubmission, submission_id)
+            for submission_id in submission_ids
+        ]
+        assert first.status == FederationSubmissionStatus.PROCESSED
+        assert first.checksum
+        assert "3 new" in first.status_details
+        assert "line 4: position must be a whole number" in first.status_details
+        assert repeat.status == FederationSubmissionStatus.PROCESSED
+        assert repeat.checksum == first.checksum
+        assert f"Identical to submission #{first.id}" in repeat.status_details
+        # A revision only writes the rows that changed.
+        assert "1 new, 1 updated, 2 unchanged" in revision.status_details
+        assert failed.status == FederationSubmissionStatus.FAILED
+        assert "Cannot open payload" in failed.status_details
+
+        entries = (
+            await session.execute(
+                select(EventEntry.athlete_name, EventEntry.result)
+                .join(EventDiscipline)
+                .join(Event)
+                .where(Event.name == event_name)
+                .order_by(EventEntry.bib)
+            )
+        ).all()
+        assert [tuple(entry) for entry in entries] == [
+            ("Ana Ruiz", "10.49"),
+            ("Perez, Luis", "10.61"),
+            ("Maria Silva", "6.12"),
+            ("Rosa Diaz", "6.01"),
+        ]
+        marks = (
+            await session.execute(
+                select(EventEntry.mark_value, EventEntry.mark_unit)
+                .join(EventDiscipline)
+                .join(Event)
+                .where(Event.name == event_name, EventEntry.bib == "201")
+            )
+        ).one()
+        assert tuple(marks) == (6.12, MarkUnit.METRES)
+    finally:
+        await session.close()
+
+
+async def test_message_bus_stats_are_exposed(client, monkeypatch):
+    from app.core.config import SettingsSingleton
+
+    response = await client.get("/api/v1/health/message-bus")
+    assert response.status_code == 200
+    public = response.json()["federation.submission"]
+    assert "queue_depth" in public
+    assert "handler_seconds" not in public
+
+    monkeypatch.setattr(SettingsSingleton().instance, "profiling_token", "bus-secret")
+    assert (await client.get("/api/v1/profiling/message-bus")).status_code == 403
+    detailed = await client.get(
+        "/api/v1/profiling/message-bus", headers={"X-Profile": "bus-secret"}
+    )
+    stats = detailed.json()
+    assert stats["federation.submission"]["batch"] is not None
+    assert "wait_seconds" in stats["federation.submission"]
@@ -1,5 +1,10 @@
+import json
+
 import pytest
 
+from app.core.serialization import embed_json, model_json
+from app.schemas.home import HomeRoster
+
 pytestmark = pytest.mark.anyio("asyncio")
 
 
@@ -36,3 +41,28 @@ async def test_templates_embed_initial_data(client):
     event_response = await client.get("/events/9999")
     assert event_response.status_code == 200
     assert 'id="initial-event-data"' in event_response.text
+
+
+async def test_embedded_home_data_matches_api_payload(client):
+    api_response = await client.get("/api/v1/bootstrap/home")
+    assert api_response.headers["content-type"] == "application/json"
+
+    page = (await client.get("/")).text
+    start = page.index(">", page.index('id="initial-home-data"')) + 1
+    embedded = page[start : page.index("</script>", start)]
+    assert "<" not in embedded
+    data, expected = json.loads(embedded), api_response.json()
+    # Fallback results and news are stamped with the current time, so compare
+    # the stored parts and the shape of the rest.
+    assert data.keys() == expected.keys()
+    assert data["federations"] == expected["federations"]
+    assert data["events"] == expected["events"]
+    assert [item["entry_id"] for item in data["recent_results"]] == [
+        item["entry_id"] for item in expected["recent_results"]
+    ]
+
+
+async def test_embed_json_escapes_markup():
+    embedded = str(embed_json(model_json(HomeRoster(name="</script><b>&'"))))
+    assert "<" not in embedded and "&" not in embedded and "'" not in embedded
+    assert json.loads(embedded)["name"] == "</script><b>&'"
@@ -0,0 +1,102 @@
+from uuid import uuid4
+
+import pytest
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+async def create_discipline(client, name: str, start_date: str, category: str | None) -> int:
+    event = await client.post(
+        "/api/v1/events/",
+        json={
+            "name": f"Leaderboard Meet {uuid4().hex[:6]}",
+            "location": "Bogotá",
+            "start_date": start_date,
+            "end_date": start_date,
+        },
+    )
+    discipline = await client.post(
+        f"/api/v1/events/{event.json()['id']}/disciplines",
+        json={"name": name, "category": category},
+    )
+    assert discipline.status_code == 201
+    return discipline.json()["id"]
+
+
+async def add_result(client, discipline_id: int, athlete: str, result: str) -> int:
+    entry = await client.post(
+        f"/api/v1/events/disciplines/{discipline_id}/entries",
+        json={"athlete_name": athlete, "team_name": "Club"},
+    )
+    assert entry.status_code == 201
+    entry_id = entry.json()["id"]
+    response = await client.patch(f"/api/v1/events/entries/{entry_id}", json={"result": result})
+    assert response.status_code == 200
+    return entry_id
+
+
+async def test_leaderboard_keeps_season_bests_incrementally(client):
+    name = f"Long Jump {uuid4().hex[:6]}"
+    url = f"/api/v1/leaderboards/{name}"
+    first = await create_discipline(client, name, "2031-03-01", "U20 Women")
+    second = await create_discipline(client, name, "2031-06-01", "Senior Women")
+
+    await add_result(client, first, "Ana", "6.10")
+    best_ana = await add_result(client, second, "Ana", "6.40m")
+    await add_result(client, first, "Bea", "6.25 (+1.1)")
+    await add_result(client, second, "Cris", "11.2s")  # wrong unit for a jump
+    await add_result(client, first, "Dora", "NM")
+
+    board = (await client.get(url)).json()
+    assert board["season"] == 2031
+    assert board["unit"] == "m" and board["lower_is_better"] is False
+    assert [(row["rank"], row["athlete_name"], row["mark_value"]) for row in board["entries"]] == [
+        (1, "Ana", 6.4),
+        (2, "Bea", 6.25),
+    ]
+    u20 = (await client.get(url, params={"category": "U20 Women"})).json()
+    assert [(row["athlete_name"], row["mark_value"]) for row in u20["entries"]] == [
+        ("Ana", 6.1),
+        ("Bea", 6.25),
+    ][::-1]
+
+    # Losing the best mark falls back to the athlete's next best result.
+    await client.patch(f"/api/v1/events/entries/{best_ana}", json={"result": "NM"})
+    board = (await client.get(url, params={"season": 2031, "offset": 1})).json()
+    assert [(row["rank"], row["athlete_name"], row["mark_value"]) for row in board["entries"]] == [
+        (2, "Ana", 6.1)
+    ]
+
+    missing = await client.get(f"/api/v1/leaderboards/Unknown {uuid4().hex[:6]}")
+    assert missing.status_code == 404
+
+
+async def test_rebuild_matches_the_boards_kept_by_writes(client):
+    from sqlalchemy import select
+
+    from app.core.database import DatabaseSessionManager
+    from app.models import LeaderboardEntry
+    from app.services.leaderboards import LeaderboardService
+
+    name = f"Shot Put {uuid4().hex[:6]}"
+    first = await create_discipline(client, name, "2032-04-01", "Senior Men")
+    second = await create_discipline(client, name, "2032-07-01", None)
+    await add_result(client, first, "Ivo", "17.20")
+    await add_result(client, second, "Ivo", "18.05m")
+    await add_result(client, second, "Jon", "16.90")
+
+    def rows(result):
+        return sorted(
+            (row.discipline, row.season, row.category, row.athlete_name, row.entry_id)
+            for row in result.scalars()
+        )
+
+    session = DatabaseSessionManager().session()
+    try:
+        kept = rows(await session.execute(select(LeaderboardEntry)))
+        await LeaderboardService(session).rebuild()
+        await session.flush()
+        assert rows(await session.execute(select(LeaderboardEntry))) == kept
+    finally:
+        await session.rollback()
+        await session.close()
@@ -0,0 +1,66 @@
+import asyncio
+import time
+
+import pytest
+
+from app.core.loop_monitor import LoopLagMonitor
+from app.core.metrics import PrometheusText
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+def _render_synchronously() -> None:
+    time.sleep(0.3)
+
+
+async def test_monitor_records_lag_and_names_the_blocking_call(monkeypatch):
+    from app.core.config import SettingsSingleton
+
+    settings = SettingsSingleton().instance
+    monkeypatch.setattr(settings, "loop_monitor_interval_ms", 10)
+    monkeypatch.setattr(settings, "loop_lag_threshold_ms", 50)
+    LoopLagMonitor.reset_instance()
+    monitor = LoopLagMonitor()
+    await monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+
+        async def slow_handler() -> None:
+            _render_synchronously()
+
+        await asyncio.create_task(slow_handler(), name="slow-request")
+        await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+        LoopLagMonitor.reset_instance()
+
+    assert monitor.stall_count == 1
+    stall = monitor.stalls[0]
+    assert stall.lag >= 0.2
+    assert stall.task.startswith("slow-request")
+    assert "_render_synchronously" in stall.stack[-1]
+    assert monitor.lag.count > 3
+
+    output = PrometheusText()
+    monitor.write(output)
+    text = output.render()
+    assert 'event_loop_lag_seconds_bucket{le="+Inf"}' in text
+    assert 'event_loop_lag_quantile_seconds{quantile="0.99"}' in text
+    assert "event_loop_stalls_total 1" in text
+
+
+async def test_event_loop_stacks_need_the_profiling_token(client, monkeypatch):
+    from app.core.config import SettingsSingleton
+
+    response = await client.get("/api/v1/health/event-loop")
+    assert response.status_code == 200
+    assert {"lag_seconds", "stalls"} <= response.json().keys()
+    assert "recent_stalls" not in response.json()
+
+    monkeypatch.setattr(SettingsSingleton().instance, "profiling_token", "loop-secret")
+    assert (await client.get("/api/v1/profiling/event-loop")).status_code == 403
+    detailed = await client.get(
+        "/api/v1/profiling/event-loop", headers={"X-Profile": "loop-secret"}
+    )
+    assert detailed.status_code == 200
+    assert "recent_stalls" in detailed.json()
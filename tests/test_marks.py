@@ -0,0 +1,85 @@
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from app.domain.marks import Mark, lower_is_better, parse_marks
+from app.models import MarkUnit
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+def test_parse_marks_handles_clock_times_units_and_annotations():
+    results = ["10.52", "2:03.45", "2:10:05", "10,61w", "DNF", None, "11.3s (+2.1)"]
+    assert parse_marks(results, "800m") == [
+        Mark(10.52, MarkUnit.SECONDS),
+        Mark(123.45, MarkUnit.SECONDS),
+        Mark(7805.0, MarkUnit.SECONDS),
+        Mark(10.61, MarkUnit.SECONDS),
+        None,
+        None,
+        Mark(11.3, MarkUnit.SECONDS),
+    ]
+    assert parse_marks(["6.48", "6.51m", "NM", "7250"], ["Long Jump"] * 3 + ["Decathlon"]) == [
+        Mark(6.48, MarkUnit.METRES),
+        Mark(6.51, MarkUnit.METRES),
+        None,
+        Mark(7250.0, MarkUnit.POINTS),
+    ]
+    assert lower_is_better(MarkUnit.SECONDS) and not lower_is_better(MarkUnit.METRES)
+
+
+async def test_backfill_fills_marks_without_touching_updated_at():
+    from sqlalchemy import select, update
+
+    from app.core.database import DatabaseSchemaManager, DatabaseSessionManager
+    from app.models import Event, EventDiscipline, EventEntry
+
+    session = DatabaseSessionManager().session()
+    try:
+        event = Event(
+            name=f"Backfill Open {uuid4().hex[:6]}",
+            location="Lima",
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 1),
+        )
+        discipline = EventDiscipline(event=event, name="Shot Put")
+        session.add_all(
+            [
+                EventEntry(discipline=discipline, athlete_name="A", result="18.20m"),
+                EventEntry(discipline=discipline, athlete_name="B", result="17.95"),
+                EventEntry(discipline=discipline, athlete_name="C", result="NM"),
+            ]
+        )
+        await session.commit()
+        # Rows written before the column existed have no mark.
+        await session.execute(
+            update(EventEntry)
+            .where(EventEntry.discipline_id == discipline.id)
+            .values(mark_value=None, mark_unit=None, updated_at=EventEntry.updated_at)
+        )
+        await session.commit()
+        before = (
+            await session.execute(
+                select(EventEntry.updated_at).where(EventEntry.discipline_id == discipline.id)
+            )
+        ).scalars().all()
+
+        async with DatabaseSessionManager().engine.begin() as conn:
+            await conn.run_sync(DatabaseSchemaManager()._backfill_entry_marks)
+
+        rows = (
+            await session.execute(
+                select(EventEntry.athlete_name, EventEntry.mark_value, EventEntry.updated_at)
+                .where(EventEntry.discipline_id == discipline.id)
+                .order_by(EventEntry.mark_value.desc())
+            )
+        ).all()
+        assert [(name, value) for name, value, _ in rows] == [
+            ("A", 18.2),
+            ("B", 17.95),
+            ("C", None),
+        ]
+        assert sorted(before) == sorted(updated_at for _, _, updated_at in rows)
+    finally:
+        await session.close()
@@ -0,0 +1,237 @@
+import asyncio
+
+import pytest
+
+from app.core.config import SettingsSingleton
+from app.integrations.message_bus import (
+    BaseMessageBus,
+    InMemoryMessageBus,
+    MessageBus,
+    MessageBusBackpressureError,
+)
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+def make_bus(**options) -> InMemoryMessageBus:
+    return InMemoryMessageBus(**options)
+
+
+async def test_topic_handlers_run_concurrently_up_to_worker_count():
+    bus = make_bus(workers=3, max_queue_size=10, publish_timeout=1)
+    active = 0
+    peak = 0
+
+    async def handler(_payload):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+
+    bus.subscribe("results", handler)
+    for index in range(9):
+        await bus.publish("results", index)
+    await bus.join()
+    await bus.stop()
+
+    assert peak == 3
+
+
+async def test_slow_topic_does_not_block_other_topics():
+    bus = make_bus(workers=1, max_queue_size=10, publish_timeout=1)
+    release = asyncio.Event()
+    fast_done = asyncio.Event()
+
+    async def slow_handler(_payload):
+        await release.wait()
+
+    async def fast_handler(_payload):
+        fast_done.set()
+
+    bus.subscribe("slow", slow_handler)
+    bus.subscribe("fast", fast_handler)
+    await bus.publish("slow", 1)
+    await bus.publish("fast", 1)
+
+    await asyncio.wait_for(fast_done.wait(), timeout=1)
+    release.set()
+    await bus.join()
+    await bus.stop()
+
+
+async def test_publish_times_out_when_queue_is_full():
+    bus = make_bus(workers=1, max_queue_size=1, publish_timeout=0.05)
+    release = asyncio.Event()
+    seen: list[int] = []
+
+    async def handler(payload):
+        await release.wait()
+        seen.append(payload)
+
+    bus.subscribe("ingest", handler)
+    await bus.publish("ingest", 1)
+    await asyncio.sleep(0)
+    await bus.publish("ingest", 2)
+    with pytest.raises(MessageBusBackpressureError):
+        await bus.publish("ingest", 3)
+
+    release.set()
+    await bus.join()
+    await bus.stop()
+    assert seen == [1, 2]
+
+
+async def test_failing_handler_does_not_kill_worker():
+    bus = make_bus(workers=1, max_queue_size=10, publish_timeout=1)
+    seen: list[int] = []
+
+    async def handler(payload):
+        if payload == 1:
+            raise RuntimeError("boom")
+        seen.append(payload)
+
+    bus.subscribe("flaky", handler)
+    await bus.publish("flaky", 1)
+    await bus.publish("flaky", 2)
+    await bus.join()
+    await bus.stop()
+
+    assert seen == [2]
+
+
+async def test_configured_topic_concurrency_overrides_default_workers():
+    bus = make_bus(workers=4, max_queue_size=20, publish_timeout=1)
+    bus.configure_topic("federation.submission", workers=2)
+    active = 0
+    peak = 0
+
+    async def handler(_payload):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+
+    bus.subscribe("federation.submission", handler)
+    bus.subscribe("other", handler)
+    for index in range(8):
+        await bus.publish("federation.submission", index)
+    await bus.join()
+    assert peak == 2
+
+    peak = 0
+    for index in range(8):
+        await bus.publish("other", index)
+    await bus.join()
+    await bus.stop()
+    assert peak == 4
+
+
+def test_submission_processor_configures_ingestion_concurrency():
+    import app.services.federations  # noqa: F401  - registers the processor
+
+    expected = SettingsSingleton().instance.ingestion_workers
+    assert MessageBus().topic_workers("federation.submission") == expected
+
+
+async def test_batch_subscribers_receive_micro_batches():
+    bus = make_bus(workers=1, max_queue_size=20, publish_timeout=1)
+    batches: list[list[int]] = []
+    singles: list[int] = []
+
+    async def batch_handler(payloads):
+        batches.append(payloads)
+
+    async def single_handler(payload):
+        singles.append(payload)
+
+    bus.subscribe_batch("results", batch_handler, max_batch_size=4, max_wait_ms=20)
+    bus.subscribe("results", single_handler)
+    for index in range(10):
+        await bus.publish("results", index)
+    await bus.join()
+    await bus.stop()
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert [item for batch in batches for item in batch] == list(range(10))
+    assert singles == list(range(10))
+
+
+def test_backends_must_implement_the_bus_operations():
+    class PublishOnlyBus(BaseMessageBus):
+        async def publish(self, topic, payload):
+            return None
+
+    with pytest.raises(TypeError, match="queue_depth"):
+        PublishOnlyBus()
+
+
+def test_conflicting_batch_options_are_rejected():
+    bus = make_bus()
+
+    async def handler(_payloads):
+        return None
+
+    bus.subscribe_batch("results", handler, max_batch_size=10, max_wait_ms=5)
+    with pytest.raises(ValueError):
+        bus.subscribe_batch("results", handler, max_batch_size=20, max_wait_ms=5)
+
+
+async def test_metrics_track_wait_latency_and_failures():
+    bus = make_bus(workers=1, max_queue_size=2, publish_timeout=0)
+
+    async def handler(payload):
+        await asyncio.sleep(0.01)
+        if payload == "boom":
+            raise RuntimeError(payload)
+
+    bus.subscribe("results", handler)
+    await bus.publish("results", "ok")
+    await bus.publish("results", "boom")
+    with pytest.raises(MessageBusBackpressureError):
+        await bus.publish("results", "overflow")
+    await bus.join()
+
+    stats = (await bus.stats())["results"]
+    await bus.stop()
+
+    assert stats["published"] == 2
+    assert stats["rejected"] == 1
+    assert stats["delivered"] == 2
+    assert stats["failed"] == 1
+    assert stats["queue_depth"] == 0
+    assert stats["wait_seconds"]["count"] == 2
+    (handler_stats,) = stats["handler_seconds"].values()
+    assert handler_stats["count"] == 2
+    assert handler_stats["sum"] >= 0.02
+
+
+async def test_crashed_workers_are_restarted():
+    bus = make_bus(workers=1, max_queue_size=10, publish_timeout=1, restart_delay=0)
+    received: list[int] = []
+    crashes = iter([True])
+    fill_batch = bus._fill_batch
+
+    async def flaky_fill_batch(*args):
+        if next(crashes, False):
+            raise RuntimeError("worker bug")
+        await fill_batch(*args)
+
+    async def handler(payloads):
+        received.extend(payloads)
+
+    bus._fill_batch = flaky_fill_batch
+    bus.subscribe_batch("results", handler, max_batch_size=5, max_wait_ms=5)
+    for index in range(3):
+        await bus.publish("results", index)
+    await asyncio.wait_for(bus.join(), timeout=1)
+    await bus.publish("results", 3)
+    await asyncio.wait_for(bus.join(), timeout=1)
+    stats = await bus.stats()
+    await bus.stop()
+
+    assert stats["results"]["worker_restarts"] == 1
+    assert stats["results"]["failed"] == 0
+    # The payload dequeued before the crash is handed back, not lost.
+    assert sorted(received) == [0, 1, 2, 3]
@@ -0,0 +1,53 @@
+import pytest
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+async def test_metrics_endpoint_reports_requests_pool_and_bus(client):
+    from app.core.request_metrics import RequestMetrics
+
+    RequestMetrics.reset_instance()
+    await client.get("/api/v1/health")
+    await client.get("/api/v1/events/999999")
+    await client.get("/no-such-page")
+
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+
+    assert 'http_requests_total{method="GET",route="/api/v1/health",status="200"} 1' in body
+    assert (
+        'http_requests_total{method="GET",route="/api/v1/events/{event_id}",status="404"} 1'
+        in body
+    )
+    assert 'http_requests_total{method="GET",route="other",status="404"} 1' in body
+    assert (
+        'http_request_duration_seconds_bucket{method="GET",route="/api/v1/health",le="+Inf"} 1'
+        in body
+    )
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/v1/health"} 1' in body
+    # The scrape itself is in flight while the page renders.
+    assert "http_requests_in_flight 1" in body
+    assert "# TYPE message_bus_queue_depth gauge" in body
+    assert "# TYPE db_pool_connections_in_use gauge" in body
+
+
+def test_prometheus_text_escapes_labels():
+    from app.core.metrics import Histogram, PrometheusText
+
+    histogram = Histogram(buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(2.5)
+    output = PrometheusText()
+    output.metric("demo_seconds", "histogram", "Demo")
+    output.histogram(
+        "demo_seconds", histogram.buckets(), histogram.sum, histogram.count, {"path": 'a"b'}
+    )
+    assert output.render().splitlines()[2:] == [
+        'demo_seconds_bucket{path="a\\"b",le="0.1"} 1',
+        'demo_seconds_bucket{path="a\\"b",le="1"} 1',
+        'demo_seconds_bucket{path="a\\"b",le="+Inf"} 2',
+        'demo_seconds_sum{path="a\\"b"} 2.55',
+        'demo_seconds_count{path="a\\"b"} 2',
+    ]
@@ -0,0 +1,92 @@
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.profiling import ProfileStore, RequestProfile, StackSampler
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+TOKEN = "profile-secret"
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_stack_sampler_records_running_frames():
+    sampler = StackSampler(threading.get_ident(), 0.001)
+    sampler.start()
+    _busy(0.1)
+    samples = sampler.stop()
+
+    assert sum(samples.values()) > 0
+    assert any(stack[-1].startswith("_busy (test_profiling.py") for stack in samples)
+
+
+def test_profile_collapsed_and_top():
+    profile = RequestProfile(
+        id=1,
+        method="GET",
+        path="/",
+        started_at=datetime.now(tz=timezone.utc),
+        interval=0.002,
+        samples=Counter({("main", "render", "validate"): 3, ("main", "render"): 1}),
+    )
+
+    assert profile.collapsed() == "main;render;validate 3\nmain;render 1\n"
+    own, inclusive = profile.top(3)
+    assert own == [("validate", 3), ("render", 1)]
+    assert dict(inclusive) == {"main": 4, "render": 4, "validate": 3}
+
+
+async def test_profiled_request_is_retrievable(monkeypatch):
+    from app.core.config import SettingsSingleton
+    from main import create_app
+
+    monkeypatch.setattr(SettingsSingleton().instance, "profiling_token", TOKEN)
+    ProfileStore.reset_instance()
+    async with AsyncClient(app=create_app(), base_url="http://testserver") as client:
+        plain = await client.get("/api/v1/events/")
+        assert "x-profile-id" not in plain.headers
+        wrong = await client.get("/api/v1/events/", headers={"X-Profile": "nope"})
+        assert "x-profile-id" not in wrong.headers
+
+        # The token is only accepted as a header, never from the URL.
+        in_query = await client.get(f"/api/v1/events/?profile={TOKEN}")
+        assert "x-profile-id" not in in_query.headers
+
+        profiled = await client.get("/api/v1/events/", headers={"X-Profile": TOKEN})
+        assert profiled.status_code == 200
+        profile_id = profiled.headers["x-profile-id"]
+
+        assert (await client.get("/api/v1/profiling/requests")).status_code == 403
+        headers = {"X-Profile": TOKEN}
+        listing = await client.get("/api/v1/profiling/requests", headers=headers)
+        assert [item["path"] for item in listing.json()] == ["/api/v1/events/"]
+
+        detail = await client.get(f"/api/v1/profiling/requests/{profile_id}", headers=headers)
+        assert detail.status_code == 200
+        assert detail.json()["status"] == 200
+        assert sum(frame["samples"] for frame in detail.json()["self_time"]) <= (
+            detail.json()["samples"]
+        )
+
+        collapsed = await client.get(
+            f"/api/v1/profiling/requests/{profile_id}/collapsed", headers=headers
+        )
+        assert collapsed.headers["content-type"].startswith("text/plain")
+
+        missing = await client.get("/api/v1/profiling/requests/999", headers=headers)
+        assert missing.status_code == 404
+    ProfileStore.reset_instance()
+
+
+async def test_profiling_endpoints_disabled_without_token(client):
+    response = await client.get("/api/v1/profiling/requests", headers={"X-Profile": ""})
+    assert response.status_code == 404
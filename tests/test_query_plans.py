@@ -0,0 +1,163 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+EVENTS = 60
+SESSIONS_PER_EVENT = 3
+DISCIPLINES_PER_EVENT = 12
+ENTRIES_PER_DISCIPLINE = 16
+
+# Substring ILIKE matches cannot use a b-tree index; search scans on purpose.
+ALLOWED = {"search": r"^SCAN \w+"}
+
+
+async def _seed(engine) -> None:
+    from sqlalchemy import insert
+
+    from app.core.database import DatabaseSchemaManager
+    from app.models import Club, Event, EventDiscipline, EventEntry, EventSession, Federation, Roster
+
+    await DatabaseSchemaManager(engine).ensure_schema()
+    start = datetime(2025, 3, 1, 9, tzinfo=timezone.utc)
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(Federation), [{"name": f"Federation {n}", "country": "Peru"} for n in range(6)]
+        )
+        await conn.execute(
+            insert(Club),
+            [{"name": f"Club {n}", "city": "Lima", "federation_id": n % 6 + 1} for n in range(30)],
+        )
+        await conn.execute(
+            insert(Roster),
+            [
+                {
+                    "name": f"Roster {n}",
+                    "country": "Peru",
+                    "division": "Senior",
+                    "coach_name": "Coach",
+                    "club_id": n % 30 + 1,
+                }
+                for n in range(90)
+            ],
+        )
+        await conn.execute(
+            insert(Event),
+            [
+                {
+                    "name": f"Meet {n}",
+                    "location": "Lima",
+                    "start_date": date(2025, 1, 1) + timedelta(days=n),
+                    "end_date": date(2025, 1, 2) + timedelta(days=n),
+                    "federation_id": n % 6 + 1,
+                }
+                for n in range(EVENTS)
+            ],
+        )
+        await conn.execute(
+            insert(EventSession),
+            [
+                {
+                    "event_id": event_id,
+                    "name": f"Session {n}",
+                    "start_time": start + timedelta(hours=n * 3),
+                }
+                for event_id in range(1, EVENTS + 1)
+                for n in range(SESSIONS_PER_EVENT)
+            ],
+        )
+        await conn.execute(
+            insert(EventDiscipline),
+            [
+                {
+                    "event_id": event_id,
+                    "session_id": (event_id - 1) * SESSIONS_PER_EVENT + n % SESSIONS_PER_EVENT + 1,
+                    "name": ("100m", "Long Jump", "Shot Put")[n % 3],
+                    "category": "Senior",
+                    "round_name": f"Round {n}",
+                    "scheduled_start": start + timedelta(minutes=n * 30),
+                }
+                for event_id in range(1, EVENTS + 1)
+                for n in range(DISCIPLINES_PER_EVENT)
+            ],
+        )
+        await conn.execute(
+            insert(EventEntry),
+            [
+                {
+                    "discipline_id": discipline_id,
+                    "athlete_name": f"Athlete {lane}",
+                    "team_name": f"Team {lane % 8}",
+                    "roster_id": lane * 5 + 1,
+                    "lane": str(lane),
+                    "result": f"{10 + lane / 10:.2f}",
+                    "mark_value": 10 + lane / 10,
+                    "points": lane,
+                }
+                for discipline_id in range(1, EVENTS * DISCIPLINES_PER_EVENT + 1)
+                for lane in range(1, ENTRIES_PER_DISCIPLINE + 1)
+            ],
+        )
+
+
+async def test_hot_queries_use_indexes(tmp_path):
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from app.core.query_plans import QueryPlanRecorder
+    from app.schemas.event import EventEntryCreate, EventEntryUpdate
+    from app.services.events import EventsService
+    from app.services.home import get_home_snapshot
+    from app.services.rosters import RostersService
+    from app.services.search import SearchService
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'plans.db'}")
+    try:
+        await _seed(engine)
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        with QueryPlanRecorder(engine) as recorder:
+            async with sessions() as session:
+                events = EventsService(session)
+                with recorder.label("events"):
+                    await events.list_events()
+                    await events.get_event_detail(EVENTS // 2)
+                    entry = await events.create_entry(7, EventEntryCreate(athlete_name="Athlete 3"))
+                    for result in ("10.01", "10.90"):
+                        # The slower mark makes the leaderboard re-query the athlete.
+                        await events.update_entry(
+                            entry.id, EventEntryUpdate(result=result, points=20)
+                        )
+                with recorder.label("rosters"):
+                    rosters = RostersService(session)
+                    await rosters.list_rosters()
+                    await rosters.get_roster(12)
+                with recorder.label("search"):
+                    await SearchService(session).search("Meet 4", ["all"])
+                with recorder.label("home"):
+                    await get_home_snapshot(session)
+
+        findings = await recorder.findings(ALLOWED)
+        assert not findings, "\n".join(map(str, findings))
+        assert {query.label for query in recorder.queries} == {
+            "events",
+            "rosters",
+            "search",
+            "home",
+        }
+    finally:
+        await engine.dispose()
+
+
+def test_plan_problems_flag_scans_and_sorts():
+    from app.core.query_plans import plan_problems
+
+    filtered = "SELECT * FROM events WHERE name = ? ORDER BY start_date"
+    assert plan_problems(
+        ["SCAN events", "USE TEMP B-TREE FOR ORDER BY"], filtered
+    ) == ["SCAN events", "USE TEMP B-TREE FOR ORDER BY"]
+    assert plan_problems(["SCAN events USING INDEX ix_events_start"], filtered) == [
+        "SCAN events USING INDEX ix_events_start"
+    ]
+    assert plan_problems(["SEARCH events USING INDEX ix_events_name (name=?)"], filtered) == []
+    assert plan_problems(["USE TEMP B-TREE FOR RIGHT PART OF ORDER BY"], filtered) == []
+    assert plan_problems(["SCAN events"], "SELECT * FROM events") == []
@@ -0,0 +1,88 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.query_stats import query_budget, statement_shape
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+def test_statement_shape_collapses_in_lists():
+    assert statement_shape("SELECT *\n  FROM clubs WHERE id IN (?, ?, ?)") == (
+        "SELECT * FROM clubs WHERE id IN (?)"
+    )
+    assert statement_shape("SELECT * FROM clubs WHERE id IN (?)") == (
+        "SELECT * FROM clubs WHERE id IN (?)"
+    )
+
+
+async def test_query_budget_flags_repeated_statements():
+    from sqlalchemy import select
+
+    from app.core.database import DatabaseSessionManager
+    from app.models import Event
+
+    session = DatabaseSessionManager().session()
+    try:
+        with pytest.raises(AssertionError, match="repeated 3x"):
+            with query_budget():
+                for event_id in range(3):
+                    await session.execute(select(Event).where(Event.id == event_id))
+    finally:
+        await session.close()
+
+
+async def test_failed_statements_leave_no_timing_state(client):
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+
+    from app.core.database import DatabaseSessionManager
+    from app.core.query_stats import track_queries
+
+    session = DatabaseSessionManager().session()
+    try:
+        with track_queries() as stats:
+            with pytest.raises(OperationalError):
+                await session.execute(text("SELECT * FROM no_such_table"))
+            await session.rollback()
+            await session.execute(text("SELECT 1"))
+            connection = await session.connection()
+            assert not any("query_stats" in str(key) for key in connection.info)
+        assert stats.count == 1
+    finally:
+        await session.close()
+
+
+async def test_read_endpoints_stay_within_query_budget(client):
+    event = await client.post(
+        "/api/v1/events/",
+        json={
+            "name": "Budget Meet",
+            "location": "Asunción",
+            "start_date": "2025-07-01",
+            "end_date": "2025-07-02",
+        },
+    )
+    event_id = event.json()["id"]
+    await client.post(f"/api/v1/events/{event_id}/demo", json={"sessions": 2})
+
+    with query_budget(max_queries=5) as stats:
+        response = await client.get(f"/api/v1/events/{event_id}")
+    assert response.status_code == 200
+    assert stats.count > 0
+
+    # Includes the club and roster loads that only run when federations exist.
+    with query_budget(max_queries=13):
+        response = await client.get("/api/v1/bootstrap/home")
+    assert response.status_code == 200
+
+
+async def test_query_stats_header(monkeypatch):
+    from app.core.config import SettingsSingleton
+    from main import create_app
+
+    monkeypatch.setattr(SettingsSingleton().instance, "query_stats_header", True)
+    async with AsyncClient(app=create_app(), base_url="http://testserver") as client:
+        response = await client.get("/api/v1/events/")
+    assert int(response.headers["x-db-queries"]) >= 1
+    assert float(response.headers["x-db-time-ms"]) >= 0
+    assert response.headers["x-db-repeated"] == "0"
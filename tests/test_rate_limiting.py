@@ -0,0 +1,97 @@
+import pytest
+
+from app.core.config import SettingsSingleton
+from app.core.rate_limit import AdmissionController, RateLimiter, RateLimitRegistry
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_refills_over_time():
+    clock = FakeClock()
+    limiter = RateLimiter(capacity=2, per_minute=60, clock=clock)
+
+    assert limiter.hit("client") == 0
+    assert limiter.hit("client") == 0
+    assert limiter.hit("client") == pytest.approx(1.0)
+    assert limiter.hit("other-client") == 0
+
+    clock.now = 1.0
+    assert limiter.hit("client") == 0
+
+
+def test_admission_controller_rejects_when_full():
+    controller = AdmissionController(limit=1)
+    assert controller.try_acquire()
+    assert not controller.try_acquire()
+    controller.release()
+    assert controller.try_acquire()
+
+
+@pytest.mark.anyio("asyncio")
+async def test_login_returns_429_once_bucket_is_empty(client, monkeypatch):
+    settings = SettingsSingleton().instance
+    monkeypatch.setattr(settings, "rate_limit_enabled", True)
+    monkeypatch.setattr(settings, "login_rate_burst", 2)
+    monkeypatch.setattr(settings, "login_rate_per_minute", 1)
+    RateLimitRegistry.reset_instance()
+    try:
+        statuses = []
+        for _ in range(3):
+            response = await client.post(
+                "/api/v1/accounts/login",
+                data={"username": "nobody@example.com", "password": "WrongPass123"},
+            )
+            statuses.append(response.status_code)
+        assert statuses == [401, 401, 429]
+        assert "retry-after" in response.headers
+    finally:
+        RateLimitRegistry.reset_instance()
+
+
+@pytest.mark.anyio("asyncio")
+async def test_invalid_tokens_do_not_drain_federation_bucket(client, monkeypatch):
+    from hashlib import sha256
+    from uuid import uuid4
+
+    from app.core.database import DatabaseSessionManager
+    from app.models import Federation
+
+    name = f"Federación Limitada {uuid4().hex[:6]}"
+    session = DatabaseSessionManager().session()
+    try:
+        session.add(
+            Federation(name=name, ingest_token_hash=sha256(b"limited-token").hexdigest())
+        )
+        await session.commit()
+    finally:
+        await session.close()
+
+    settings = SettingsSingleton().instance
+    monkeypatch.setattr(settings, "rate_limit_enabled", True)
+    monkeypatch.setattr(settings, "federation_submission_rate_burst", 1)
+    monkeypatch.setattr(settings, "federation_submission_rate_per_minute", 1)
+    RateLimitRegistry.reset_instance()
+    try:
+        payload = {
+            "federation_name": name,
+            "contact_email": "data@example.com",
+            "payload_url": "https://data.trackeo.test/results.csv",
+            "access_token": "not-the-token",
+        }
+        for _ in range(3):
+            response = await client.post("/api/v1/federations/submissions", json=payload)
+            assert response.status_code == 400
+
+        payload["access_token"] = "limited-token"
+        accepted = await client.post("/api/v1/federations/submissions", json=payload)
+        assert accepted.status_code == 202
+        limited = await client.post("/api/v1/federations/submissions", json=payload)
+        assert limited.status_code == 429
+    finally:
+        RateLimitRegistry.reset_instance()
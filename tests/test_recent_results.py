@@ -0,0 +1,51 @@
+from uuid import uuid4
+
+import pytest
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+async def test_recent_results_feed_follows_entry_writes(client):
+    from sqlalchemy import func, select
+
+    from app.core.database import DatabaseSessionManager
+    from app.models import RecentResult
+    from app.services.recent_results import FEED_SIZE
+
+    unique = uuid4().hex[:6]
+    event = await client.post(
+        "/api/v1/events/",
+        json={
+            "name": f"Feed Meet {unique}",
+            "location": "Quito",
+            "start_date": "2025-06-01",
+            "end_date": "2025-06-01",
+        },
+    )
+    event_id = event.json()["id"]
+    discipline = await client.post(f"/api/v1/events/{event_id}/disciplines", json={"name": "800m"})
+    entries_url = f"/api/v1/events/disciplines/{discipline.json()['id']}/entries"
+    first = await client.post(entries_url, json={"athlete_name": f"Feed Ana {unique}"})
+    await client.post(entries_url, json={"athlete_name": f"Feed Bea {unique}"})
+    await client.patch(
+        f"/api/v1/events/entries/{first.json()['id']}", json={"result": "2:01.50", "position": 1}
+    )
+
+    home = (await client.get("/api/v1/bootstrap/home")).json()
+    latest = home["recent_results"][:2]
+    assert [(row["athlete_name"], row["result"]) for row in latest] == [
+        (f"Feed Ana {unique}", "2:01.50"),
+        (f"Feed Bea {unique}", None),
+    ]
+    assert latest[0]["event_name"] == f"Feed Meet {unique}"
+    assert latest[0]["discipline_name"] == "800m"
+
+    await client.post(f"/api/v1/events/{event_id}/demo", json={"include_results": True})
+    session = DatabaseSessionManager().session()
+    try:
+        rows = await session.scalar(select(func.count()).select_from(RecentResult))
+        athletes = (await session.scalars(select(RecentResult.athlete_name))).all()
+    finally:
+        await session.close()
+    assert 0 < rows <= FEED_SIZE
+    assert f"Feed Ana {unique}" not in athletes
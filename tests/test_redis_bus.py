@@ -0,0 +1,203 @@
+import asyncio
+import os
+import time
+from uuid import uuid4
+
+import pytest
+
+from app.integrations.message_bus import MessageBusBackpressureError
+from app.integrations.redis_bus import RedisStreamsMessageBus
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+class FakeRedisStreams:
+    """In-process stand-in for the stream commands the Redis backend uses."""
+
+    def __init__(self) -> None:
+        self._sequence = 0
+        self._streams: dict[str, dict[int, dict[str, str]]] = {}
+        self._groups: dict[tuple[str, str], dict] = {}
+
+    async def xadd(self, name, fields, **_kwargs):
+        self._sequence += 1
+        self._streams.setdefault(name, {})[self._sequence] = dict(fields)
+        return f"{self._sequence}-0"
+
+    async def xlen(self, name):
+        return len(self._streams.get(name, {}))
+
+    async def xgroup_create(self, name, groupname, id="$", mkstream=False):
+        if (name, groupname) in self._groups:
+            raise RuntimeError("BUSYGROUP Consumer Group name already exists")
+        self._streams.setdefault(name, {})
+        last = 0 if id == "0" else self._sequence
+        self._groups[(name, groupname)] = {"last": last, "pending": {}}
+
+    async def xreadgroup(self, groupname, consumername, streams, count=None, block=None):
+        deadline = time.monotonic() + (block or 0) / 1000
+        while True:
+            response = []
+            for name in streams:
+                group = self._groups[(name, groupname)]
+                entries = [
+                    (seq, fields)
+                    for seq, fields in sorted(self._streams.get(name, {}).items())
+                    if seq > group["last"]
+                ][: count or None]
+                for seq, _ in entries:
+                    group["last"] = seq
+                    group["pending"][seq] = (consumername, time.monotonic(), 1)
+                if entries:
+                    response.append([name, [(f"{seq}-0", fields) for seq, fields in entries]])
+            if response or time.monotonic() >= deadline:
+                return response
+            await asyncio.sleep(0.005)
+
+    async def xautoclaim(
+        self, name, groupname, consumername, min_idle_time, start_id="0-0", count=None
+    ):
+        group = self._groups[(name, groupname)]
+        now = time.monotonic()
+        claimed = []
+        for seq, (_, delivered_at, deliveries) in sorted(group["pending"].items()):
+            if (now - delivered_at) * 1000 < min_idle_time:
+                continue
+            group["pending"][seq] = (consumername, now, deliveries + 1)
+            claimed.append((f"{seq}-0", self._streams[name].get(seq)))
+            if count and len(claimed) >= count:
+                break
+        return ["0-0", claimed, []]
+
+    async def xpending_range(self, name, groupname, min, max, count, consumername=None):
+        low, high = int(min.split("-")[0]), int(max.split("-")[0])
+        pending = self._groups[(name, groupname)]["pending"]
+        return [
+            {
+                "message_id": f"{seq}-0",
+                "consumer": consumer,
+                "time_since_delivered": int((time.monotonic() - delivered_at) * 1000),
+                "times_delivered": deliveries,
+            }
+            for seq, (consumer, delivered_at, deliveries) in sorted(pending.items())
+            if low <= seq <= high
+        ][:count]
+
+    async def xrange(self, name, min="-", max="+"):
+        return [(f"{seq}-0", fields) for seq, fields in sorted(self._streams.get(name, {}).items())]
+
+    async def xack(self, name, groupname, *ids):
+        pending = self._groups[(name, groupname)]["pending"]
+        return sum(pending.pop(int(item.split("-")[0]), None) is not None for item in ids)
+
+    async def xdel(self, name, *ids):
+        stream = self._streams.get(name, {})
+        return sum(stream.pop(int(item.split("-")[0]), None) is not None for item in ids)
+
+    async def aclose(self):
+        return None
+
+
+@pytest.fixture
+async def redis_client():
+    url = os.environ.get("ATHLETICS_TEST_REDIS_URL")
+    if not url:
+        yield FakeRedisStreams()
+        return
+    from redis.asyncio import Redis
+
+    client = Redis.from_url(url, decode_responses=True)
+    yield client
+    await client.aclose()
+
+
+def make_bus(client, **options) -> RedisStreamsMessageBus:
+    options.setdefault("stream_prefix", f"test-{uuid4().hex[:8]}")
+    options.setdefault("block_ms", 20)
+    options.setdefault("workers", 1)
+    options.setdefault("max_queue_size", 100)
+    options.setdefault("publish_timeout", 0.05)
+    return RedisStreamsMessageBus(client, **options)
+
+
+async def test_publisher_and_separate_consumer_share_stream(redis_client):
+    prefix = f"test-{uuid4().hex[:8]}"
+    api_bus = make_bus(redis_client, stream_prefix=prefix, consume=False)
+    worker_bus = make_bus(redis_client, stream_prefix=prefix, consumer="ingest", workers=2)
+    received: list[int] = []
+
+    async def handler(payload):
+        received.append(payload)
+
+    api_bus.subscribe("federation.submission", handler)
+    worker_bus.subscribe("federation.submission", handler)
+
+    for submission_id in (1, 2, 3):
+        await api_bus.publish("federation.submission", submission_id)
+    await worker_bus.start()
+    await asyncio.wait_for(worker_bus.join(), timeout=2)
+    await worker_bus.stop()
+
+    assert sorted(received) == [1, 2, 3]
+
+
+async def test_unacknowledged_entries_are_reclaimed_after_a_crash(redis_client):
+    prefix = f"test-{uuid4().hex[:8]}"
+    publisher = make_bus(redis_client, stream_prefix=prefix, consume=False)
+    await publisher.publish("federation.submission", 42)
+
+    stream = f"{prefix}:federation.submission"
+    await publisher._ensure_group(stream)
+    # A consumer reads the entry and dies before acknowledging it.
+    await redis_client.xreadgroup("trackeo-workers", "crashed", {stream: ">"}, count=1)
+
+    received: list[int] = []
+
+    async def handler(payload):
+        received.append(payload)
+
+    recovered = make_bus(redis_client, stream_prefix=prefix, consumer="recovery", claim_idle_ms=0)
+    recovered.subscribe("federation.submission", handler)
+    await recovered.start()
+    await asyncio.wait_for(recovered.join(), timeout=2)
+    await recovered.stop()
+
+    assert received == [42]
+
+
+async def test_publish_applies_backpressure_when_stream_is_full(redis_client):
+    bus = make_bus(redis_client, consume=False, max_queue_size=1)
+    await bus.publish("federation.submission", 1)
+    with pytest.raises(MessageBusBackpressureError):
+        await bus.publish("federation.submission", 2)
+
+
+async def test_failed_entries_are_retried_then_dead_lettered(redis_client):
+    prefix = f"test-{uuid4().hex[:8]}"
+    bus = make_bus(redis_client, stream_prefix=prefix, claim_idle_ms=0, max_deliveries=2)
+    attempts: list[int] = []
+
+    async def handler(payload):
+        attempts.append(payload)
+        if payload == 13:
+            raise RuntimeError("import failed")
+
+    bus.subscribe("federation.submission", handler)
+    await bus.start()
+    await bus.publish("federation.submission", 13)
+    await bus.publish("federation.submission", 7)
+    stream = f"{prefix}:federation.submission"
+
+    async def dead_lettered():
+        while not await redis_client.xlen(f"{stream}:dead"):
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(dead_lettered(), timeout=2)
+    await asyncio.wait_for(bus.join(), timeout=2)
+    await bus.stop()
+
+    assert attempts.count(13) == 2 and attempts.count(7) == 1
+    assert await redis_client.xlen(stream) == 0
+    [(_, fields)] = await redis_client.xrange(f"{stream}:dead")
+    assert fields["payload"] == "13" and "2 deliveries" in fields["reason"]
+    assert bus.metrics("federation.submission").dead_lettered == 1
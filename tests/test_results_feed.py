@@ -0,0 +1,154 @@
+import json
+import threading
+from functools import partial
+from hashlib import sha256
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.core.config import SettingsSingleton
+from app.domain.results_feed import (
+    PayloadFormatError,
+    RowValidationError,
+    iter_blocks,
+    normalize_record,
+)
+from app.integrations.payload_sources import (
+    PayloadFetchError,
+    hash_local_payload,
+    open_payload,
+)
+from app.models import EventEntryStatus
+from app.services.result_imports import ResultsParsePool
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+PREFIX = {"event": "Nacional", "event_date": "2024-05-04", "discipline": "100m"}
+
+
+async def byte_chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def parse(url: str, data: bytes, size: int = 3, block_bytes: int = 16):
+    blocks = [
+        func(*args)
+        async for func, args in iter_blocks(url, byte_chunks(data, size), block_bytes)
+    ]
+    rows = [(line, row.athlete_name, row.notes) for block in blocks for line, row, _ in block.rows]
+    errors = [error for block in blocks for error in block.errors]
+    return blocks, rows, errors
+
+
+async def test_csv_blocks_respect_chunk_boundaries_and_quoted_newlines():
+    data = (
+        "\ufeffevent,event_date,discipline,athlete_name,notes,position\r\n"
+        'Nacional,2024-05-04,100m,Ana Ruiz,"wind +2.1, ""legal""\nafter review",1\r\n'
+        "\r\n"
+        "Nacional,2024-05-04,100m,Joao Lima,,second\n"
+        "Nacional,2024-05-04,100m,Maria Silva,,3"
+    ).encode("utf-8")
+
+    blocks, rows, errors = await parse("results.csv", data)
+
+    assert len(blocks) > 1
+    assert rows == [
+        (2, "Ana Ruiz", 'wind +2.1, "legal"\nafter review'),
+        (6, "Maria Silva", None),
+    ]
+    assert errors == [(5, "position must be a whole number")]
+    assert sum(block.records for block in blocks) == 3
+
+
+async def test_json_array_and_json_lines_are_parsed():
+    records = [{**PREFIX, "athlete": "Ana Ruiz"}, {**PREFIX, "athlete": "Añez"}, ["bad"]]
+
+    _, array_rows, array_errors = await parse("feed", json.dumps(records).encode("utf-8"))
+    _, line_rows, line_errors = await parse(
+        "feed.jsonl",
+        "\n".join(json.dumps(record) for record in records).encode("utf-8") + b"\n{oops\n",
+        size=5,
+    )
+
+    assert array_rows == line_rows == [(1, "Ana Ruiz", None), (2, "Añez", None)]
+    assert array_errors == [(3, "expected a JSON object")]
+    assert line_errors == [(3, "expected a JSON object"), (4, "malformed JSON")]
+
+
+async def test_malformed_payloads_are_rejected():
+    with pytest.raises(PayloadFormatError):
+        await parse("feed.json", b'[{"athlete": "Ana"}, {"athlete": ')
+    with pytest.raises(PayloadFormatError):
+        await parse("results.csv", b'athlete_name\n"unterminated\n')
+    with pytest.raises(PayloadFormatError):
+        await parse("results.xml", b"<results/>")
+    unterminated = b'athlete_name\nAna\n"Bea' + b"x\n" * 40_000
+    with pytest.raises(PayloadFormatError, match="line 3: record too long"):
+        await parse("results.csv", unterminated, size=4096, block_bytes=16_384)
+    with pytest.raises(PayloadFormatError, match="line 1: record too long"):
+        await parse("feed.jsonl", b'{"athlete": "' + b"x" * 70_000, size=4096, block_bytes=16_384)
+
+
+async def test_parse_pool_runs_blocks_in_worker_processes(monkeypatch):
+    monkeypatch.setattr(SettingsSingleton().instance, "ingestion_parse_workers", 1)
+    pool = ResultsParsePool()
+    monkeypatch.setattr(pool, "_workers", None)
+    data = "event,event_date,discipline,athlete_name\n" + "Nacional,2024-05-04,100m,Ana\n" * 50
+    try:
+        jobs = [job async for job in iter_blocks("r.csv", byte_chunks(data.encode(), 64), 256)]
+        blocks = [await pool.submit(func, *args) for func, args in jobs]
+    finally:
+        pool.shutdown()
+
+    assert pool.workers == 1
+    assert sum(len(block.rows) for block in blocks) == 50
+
+
+def test_normalize_record_validates_and_defaults():
+    base = {"event": "Nacional", "event_date": "2024-05-04", "discipline": "100m", "athlete": "A"}
+    row = normalize_record({**base, "event": " Nacional ", "Mark": "10.52"})
+    assert row.event == "Nacional"
+    assert row.event_end_date == row.event_date
+    assert row.status == EventEntryStatus.FINISHED
+
+    with pytest.raises(RowValidationError, match="event_date"):
+        normalize_record({**base, "event_date": ""})
+    with pytest.raises(RowValidationError, match="status"):
+        normalize_record({**base, "status": "won"})
+
+
+async def test_open_payload_streams_from_local_http_stand_in(tmp_path):
+    (tmp_path / "results.csv").write_bytes(b"athlete_name\nAna Ruiz\n")
+    (tmp_path / "archive").mkdir()
+    handler = partial(SimpleHTTPRequestHandler, directory=str(tmp_path))
+    handler.log_message = lambda *args: None
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        chunks = [chunk async for chunk in open_payload(f"{base}/results.csv", allow_local=True)]
+        assert b"".join(chunks) == b"athlete_name\nAna Ruiz\n"
+        with pytest.raises(PayloadFetchError, match="404"):
+            [chunk async for chunk in open_payload(f"{base}/missing.csv", allow_local=True)]
+        with pytest.raises(PayloadFetchError, match="scheme"):
+            [chunk async for chunk in open_payload(f"{base}/results.csv")]
+        # The stand-in answers a directory without a trailing slash with a 301.
+        with pytest.raises(PayloadFetchError, match="redirects"):
+            [chunk async for chunk in open_payload(f"{base}/archive", allow_local=True)]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+async def test_local_payloads_reuse_a_recorded_checksum(tmp_path):
+    path = tmp_path / "results.csv"
+    path.write_bytes(b"athlete_name\nAna\n")
+
+    hashed = await hash_local_payload(path)
+    assert hashed.checksum == sha256(b"athlete_name\nAna\n").hexdigest()
+    recorded = await hash_local_payload(path, "recorded-on-upload")
+    assert (recorded.checksum, recorded.size, recorded.owned) == ("recorded-on-upload", 17, False)
+    with pytest.raises(PayloadFetchError):
+        await hash_local_payload(tmp_path / "missing.csv", "recorded-on-upload")
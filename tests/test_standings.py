@@ -0,0 +1,101 @@
+from uuid import uuid4
+
+import pytest
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+async def test_standings_follow_entry_writes(client):
+    from sqlalchemy import select
+
+    from app.core.database import DatabaseSessionManager
+    from app.models import Club, EventStanding, Federation, Roster
+    from app.services.standings import StandingsService
+
+    unique = uuid4().hex[:6]
+    session = DatabaseSessionManager().session()
+    federation = Federation(name=f"Standings Federation {unique}")
+    club = Club(name=f"Standings Club {unique}", federation=federation)
+    roster = Roster(
+        name=f"Standings Roster {unique}",
+        country="Peru",
+        division="Senior",
+        coach_name="Coach",
+        club=club,
+    )
+    session.add(roster)
+    await session.commit()
+    try:
+        event = await client.post(
+            "/api/v1/events/",
+            json={
+                "name": f"Standings Meet {unique}",
+                "location": "Lima",
+                "start_date": "2025-05-01",
+                "end_date": "2025-05-02",
+            },
+        )
+        event_id = event.json()["id"]
+        discipline = await client.post(
+            f"/api/v1/events/{event_id}/disciplines", json={"name": "400m"}
+        )
+        entries_url = f"/api/v1/events/disciplines/{discipline.json()['id']}/entries"
+
+        ids = []
+        for athlete, team, roster_id in [
+            ("Ana", "Lima Club", roster.id),
+            ("Bea", "Cusco Club", None),
+            ("Cris", "Lima Club", None),
+        ]:
+            response = await client.post(
+                entries_url,
+                json={"athlete_name": athlete, "team_name": team, "roster_id": roster_id},
+            )
+            ids.append(response.json()["id"])
+        for entry_id, points in zip(ids, [10, 8, 6]):
+            await client.patch(f"/api/v1/events/entries/{entry_id}", json={"points": points})
+
+        url = f"/api/v1/events/{event_id}/standings"
+        teams = (await client.get(url)).json()["rows"]
+        assert [(row["rank"], row["label"], row["points"], row["entries"]) for row in teams] == [
+            (1, "Lima Club", 16, 2),
+            (2, "Cusco Club", 8, 1),
+        ]
+
+        # Moving an athlete to another team moves their points with them.
+        await client.patch(
+            f"/api/v1/events/entries/{ids[2]}", json={"team_name": "Cusco Club", "points": 7}
+        )
+        teams = (await client.get(url)).json()["rows"]
+        assert [(row["label"], row["points"]) for row in teams] == [
+            ("Cusco Club", 15),
+            ("Lima Club", 10),
+        ]
+
+        for scope, label in [
+            ("roster", roster.name),
+            ("club", club.name),
+            ("federation", federation.name),
+        ]:
+            rows = (await client.get(url, params={"scope": scope})).json()["rows"]
+            assert [(row["label"], row["points"]) for row in rows] == [(label, 10)]
+
+        # Rebuilding from the entries gives the totals the writes kept.
+        check = DatabaseSessionManager().session()
+        try:
+            totals = select(
+                EventStanding.scope, EventStanding.scope_key, EventStanding.points
+            ).where(EventStanding.event_id == event_id)
+            kept = sorted((await check.execute(totals)).all())
+            await StandingsService(check).rebuild()
+            await check.flush()
+            assert sorted((await check.execute(totals)).all()) == kept
+        finally:
+            await check.rollback()
+            await check.close()
+    finally:
+        await session.delete(roster)
+        await session.delete(club)
+        await session.delete(federation)
+        await session.commit()
+        await session.close()
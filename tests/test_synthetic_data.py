@@ -0,0 +1,71 @@
+from datetime import date
+
+import pytest
+
+from app.services.synthetic_data import DatasetSize, SyntheticDataset, load_dataset
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+SMALL = DatasetSize(
+    federations=2,
+    clubs_per_federation=2,
+    rosters_per_club=1,
+    athletes_per_roster=10,
+    events=4,
+    disciplines_per_event=4,
+    entries_per_discipline=12,
+    users=30,
+    news=5,
+)
+
+
+def _dataset(seed: int) -> SyntheticDataset:
+    return SyntheticDataset(
+        SMALL, seed=seed, season=2025, today=date(2025, 7, 1), password_hash="hash"
+    )
+
+
+def test_dataset_is_reproducible_and_scales():
+    first = [(table.name, rows) for table, rows in _dataset(7).batches(25)]
+    assert first == [(table.name, rows) for table, rows in _dataset(7).batches(25)]
+    assert first != [(table.name, rows) for table, rows in _dataset(8).batches(25)]
+    assert all(len(rows) <= 25 for _, rows in first)
+
+    scaled = SMALL.scaled(10)
+    assert (scaled.federations, scaled.events, scaled.users) == (20, 40, 300)
+    assert scaled.entries_per_discipline == SMALL.entries_per_discipline
+
+
+async def test_load_dataset_builds_derived_tables(tmp_path):
+    from sqlalchemy import func, select
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from app.models import (
+        EventDiscipline,
+        EventEntry,
+        EventStanding,
+        LeaderboardEntry,
+        RecentResult,
+        User,
+    )
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'synthetic.db'}")
+    try:
+        counts = await load_dataset(engine, _dataset(7), batch_size=50)
+        assert counts["federations"] == 2
+        assert counts["users"] == 30
+        async with engine.connect() as conn:
+            assert await conn.scalar(select(func.count()).select_from(EventEntry)) == (
+                counts["event_entries"]
+            )
+            rounds = set(await conn.scalars(select(EventDiscipline.round_name)))
+            assert "Final" in rounds and "Heat 1" in rounds
+            assert await conn.scalar(select(func.count()).select_from(LeaderboardEntry)) > 0
+            assert await conn.scalar(select(func.count()).select_from(EventStanding)) > 0
+            assert await conn.scalar(select(func.count()).select_from(RecentResult)) > 0
+            assert await conn.scalar(select(func.max(User.id))) == 30
+
+        with pytest.raises(ValueError, match="empty database"):
+            await load_dataset(engine, _dataset(7))
+    finally:
+        await engine.dispose()
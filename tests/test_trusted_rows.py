@@ -0,0 +1,79 @@
+from datetime import date, datetime
+
+import pytest
+from pydantic import BaseModel, field_validator
+
+from app.core.config import Settings, SettingsSingleton
+from app.core.trusted_rows import row_builder, row_loader
+from app.models import Event
+from app.schemas.event import EventDetailRead, EventRead
+from app.schemas.home import HomeRoster
+
+pytestmark = pytest.mark.anyio("asyncio")
+
+
+@pytest.fixture
+def trusted(monkeypatch):
+    monkeypatch.setattr(SettingsSingleton().instance, "validate_trusted_rows", False)
+
+
+async def test_generated_constructors_match_validation(trusted):
+    event = Event(
+        id=7,
+        name="Grand Prix Lima",
+        location="Lima",
+        start_date=date(2025, 5, 1),
+        end_date=date(2025, 5, 2),
+        federation_id=None,
+    )
+    loaded = row_loader(EventRead)(event)
+    assert type(loaded) is EventRead
+    assert loaded == EventRead.model_validate(event)
+    assert loaded.model_dump_json() == EventRead.model_validate(event).model_dump_json()
+
+    roster = row_builder(HomeRoster)(id=3, name="Sprinters", updated_at=datetime(2025, 5, 1))
+    assert roster == HomeRoster(id=3, name="Sprinters", updated_at=datetime(2025, 5, 1))
+    with pytest.raises(TypeError):
+        row_builder(HomeRoster)(id=3)
+
+
+async def test_validation_setting_and_nested_models(trusted, monkeypatch):
+    class Trimmed(BaseModel):
+        name: str
+
+        @field_validator("name")
+        @classmethod
+        def strip(cls, value: str) -> str:
+            return value.strip()
+
+    with pytest.raises(TypeError, match="nested model"):
+        row_loader(EventDetailRead)
+    with pytest.raises(TypeError, match="validators or serializers"):
+        row_builder(Trimmed)
+
+    monkeypatch.setattr(SettingsSingleton().instance, "validate_trusted_rows", True)
+    assert row_loader(EventRead) == EventRead.model_validate
+    assert row_builder(HomeRoster) is HomeRoster
+
+
+def test_pydantic_instance_slots_are_the_ones_generated_code_sets():
+    # The generated constructors fill exactly these; a pydantic upgrade that
+    # changes them must update app.core.trusted_rows first.
+    assert BaseModel.__slots__ == (
+        "__dict__",
+        "__pydantic_fields_set__",
+        "__pydantic_extra__",
+        "__pydantic_private__",
+    )
+    validated = HomeRoster(id=3, name="Sprinters", updated_at=datetime(2025, 5, 1))
+    assert validated.__pydantic_extra__ is None
+    assert validated.__pydantic_private__ is None
+    assert validated.__pydantic_fields_set__ == {"id", "name", "updated_at"}
+
+
+def test_validation_defaults_off_only_in_production(monkeypatch):
+    monkeypatch.delenv("ATHLETICS_VALIDATE_TRUSTED_ROWS", raising=False)
+    assert Settings(_env_file=None, environment="development").validate_trusted_rows is True
+    assert Settings(_env_file=None, environment="Production").validate_trusted_rows is False
+    explicit = Settings(_env_file=None, environment="production", validate_trusted_rows=True)
+    assert explicit.validate_trusted_rows is True